@@ -0,0 +1,103 @@
+""" Benchmark for the camera compositing pipeline.
+
+Run from the project root:
+    python -m benchmarks.camera_compositing
+
+Draws a scene of 200 sprites at 1280x720 (a 4x upscale of the 320x180 game resolution) with the software renderer,
+where the cost of each full-screen blit is significant. It prints the average time of a full draw loop (entities,
+render passes, camera compositing and the copy to the screen) for a few camera setups.
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+from engine.atlas import Atlas
+from engine.engine import Engine
+from engine.entity import Entity
+from engine.game import Game
+from engine.renderer import Renderer
+from engine.scene import Scene
+from engine.sprite import Sprite
+from engine.window import Window
+
+
+FRAMES = 60
+SPRITE_COUNT = 200
+ATLAS = "atlas.png"
+
+
+class BenchmarkEntity(Entity):
+    def __init__(self, sprite_name: str) -> None:
+        super().__init__()
+        self.sprite = Sprite.from_atlas(ATLAS, sprite_name)
+
+    def draw(self, camera) -> None:
+        self.sprite.draw(camera, self.position())
+
+
+class BenchmarkScene(Scene):
+    def __init__(self, moving_camera: bool, lighting: bool) -> None:
+        self.moving_camera = moving_camera
+        self.lighting = lighting
+        super().__init__()
+
+    def setup_cameras(self) -> None:
+        if self.lighting:
+            self.main_camera.add_lighting_pass()
+
+    def load_entities(self) -> None:
+        rng = random.Random(1234)
+        sprite_names = sorted(Atlas.instance(ATLAS).sprites)
+        for _ in range(SPRITE_COUNT):
+            entity = BenchmarkEntity(rng.choice(sprite_names))
+            entity.x = rng.randrange(320)
+            entity.y = rng.randrange(180)
+            self.entities.add(entity)
+
+    def update(self) -> None:
+        super().update()
+        if self.moving_camera:
+            self.main_camera.x += 0.3
+
+
+def time_scene(scene: Scene) -> float:
+    """ Get the average time of a draw loop, in milliseconds. """
+    Engine.load_scene(scene)
+    Engine.update()
+    Engine.draw()
+
+    total = 0.0
+    for _ in range(FRAMES):
+        Engine.update()
+        start = time.perf_counter()
+        Engine.draw()
+        total += time.perf_counter() - start
+    return total / FRAMES * 1000
+
+
+def main() -> int:
+    Game.init(name="benchmark", version="0")
+    Engine.init(1000)
+    Window.init("benchmark", (1280, 720))
+    Renderer.init((320, 180), 0)
+    Window.update_viewport()
+
+    results = [
+        ("static camera", time_scene(BenchmarkScene(False, False))),
+        ("moving camera", time_scene(BenchmarkScene(True, False))),
+        ("static camera, empty lighting pass", time_scene(BenchmarkScene(False, True))),
+    ]
+
+    print(f"\nRenderer: {Renderer.name()}, window: 1280x720, resolution: 320x180")
+    for name, milliseconds in results:
+        print(f"{name:<36} {milliseconds:>8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
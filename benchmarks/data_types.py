@@ -0,0 +1,95 @@
+""" Micro-benchmarks for the Point, Rect and Color data types.
+
+Run from the project root:
+    python -m benchmarks.data_types
+
+Each benchmark prints the time per call. The checks at the end make sure that the fast paths are still in place (shared
+constants, cached SDL structs), and the script exits with a non-zero code if any of them regress.
+"""
+import sys
+import timeit
+
+from engine.data_types.circle import Circle
+from engine.data_types.color import Color
+from engine.data_types.point import Point
+from engine.data_types.rect import Rect
+
+
+NUMBER = 200_000
+
+
+def bench(name: str, statement: str, setup_globals: dict) -> None:
+    """ Time a statement, and print the time per call. """
+    seconds = min(timeit.repeat(statement, globals=setup_globals, number=NUMBER, repeat=3))
+    print(f"{name:<40} {seconds / NUMBER * 1e9:8.1f} ns")
+
+
+def check(name: str, condition: bool) -> bool:
+    """ Print the result of a check. """
+    print(f"{name:<40} {'ok' if condition else 'FAILED'}")
+    return condition
+
+
+def main() -> int:
+    a = Point(10, 20)
+    b = Point(3, 4)
+    r = Rect(5, 5, 32, 16)
+    r2 = Rect(20, 10, 8, 8)
+    c = Circle(12, 12, 6)
+    env = {
+        "a": a, "b": b, "r": r, "r2": r2, "c": c,
+        "Point": Point, "Rect": Rect, "Color": Color,
+    }
+
+    print("Point")
+    bench("Point(x, y)", "Point(10, 20)", env)
+    bench("a + b", "a + b", env)
+    bench("a - b", "a - b", env)
+    bench("a.offset(3, 4)", "a.offset(3, 4)", env)
+    bench("a.add_tuple(b)", "a.add_tuple(b)", env)
+    bench("a.distance_to(b)", "a.distance_to(b)", env)
+    bench("Point.zero()", "Point.zero()", env)
+    bench("a.to_sdl_point()", "a.to_sdl_point()", env)
+
+    print("\nRect")
+    bench("Rect(x, y, w, h)", "Rect(5, 5, 32, 16)", env)
+    bench("r.center()", "r.center()", env)
+    bench("r.center_tuple()", "r.center_tuple()", env)
+    bench("r.contains_point(a)", "r.contains_point(a)", env)
+    bench("r.contains_xy(10, 20)", "r.contains_xy(10, 20)", env)
+    bench("r.intersects_rect(r2)", "r.intersects_rect(r2)", env)
+    bench("r.intersects_circle(c)", "r.intersects_circle(c)", env)
+    bench("r.to_sdl_rect()", "r.to_sdl_rect()", env)
+
+    print("\nColor")
+    bench("Color(r, g, b, a)", "Color(10, 20, 30, 40)", env)
+    bench("Color.white()", "Color.white()", env)
+    bench("Color.lerp(...)", "Color.lerp(Color.black(), Color.white(), 0.5)", env)
+    bench("tuple(color)", "tuple(Color.white())", env)
+
+    print("\nChecks")
+    results = [
+        check("Color constants are shared", Color.white() is Color.white()),
+        check("Color constants are immutable", _is_immutable(Color.white())),
+        check("Color.copy() is mutable", not _is_immutable(Color.white().copy())),
+        check("Point constants are shared", Point.zero() is Point.zero()),
+        check("Point SDL struct is cached", a.to_sdl_point() is a.to_sdl_point()),
+        check("Rect SDL struct is cached", r.to_sdl_rect() is r.to_sdl_rect()),
+        check("Point + Point stays exact", (a + b).to_tuple() == (13, 24)),
+        check("Rect.center() matches center_tuple()", r.center().to_tuple() == r.center_tuple()),
+    ]
+
+    return 0 if all(results) else 1
+
+
+def _is_immutable(color: Color) -> bool:
+    """ Check if a color rejects modification. """
+    try:
+        color.r = color.r
+    except AttributeError:
+        return True
+    return False
+
+
+if __name__ == "__main__":
+    sys.exit(main())
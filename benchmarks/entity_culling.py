@@ -0,0 +1,119 @@
+""" Benchmark for camera culling.
+
+Run from the project root:
+    python -m benchmarks.entity_culling
+
+Draws a 4000x4000 world of 4000 sprites with a 320x180 camera that pans across it, so that only a small part of the
+world is on-screen at a time. It prints the average time of a full draw loop with culling off and on, for entities that
+use their bounding box as their draw bounds (looked up in the spatial index) and for entities that override
+`draw_bounds()`.
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+from engine.atlas import Atlas
+from engine.data_types.rect import Rect
+from engine.engine import Engine
+from engine.entity import Entity
+from engine.game import Game
+from engine.renderer import Renderer
+from engine.scene import Scene
+from engine.sprite import Sprite
+from engine.window import Window
+
+
+FRAMES = 60
+SPRITE_COUNT = 4000
+WORLD_SIZE = 4000
+ATLAS = "atlas.png"
+
+
+class BoundingBoxEntity(Entity):
+    """ An entity whose sprite fills its bounding box. """
+    def __init__(self, sprite_name: str) -> None:
+        super().__init__()
+        self.sprite = Sprite.from_atlas(ATLAS, sprite_name)
+        self.width = self.sprite.width()
+        self.height = self.sprite.height()
+
+    def draw(self, camera) -> None:
+        self.sprite.draw(camera, self.position())
+
+
+class DrawBoundsEntity(BoundingBoxEntity):
+    """ An entity that reports its sprite's bounds. """
+    def draw_bounds(self) -> Rect:
+        return self.sprite.bounds(self.position())
+
+
+class BenchmarkScene(Scene):
+    def __init__(self, entity_type: type, culling: bool) -> None:
+        self.entity_type = entity_type
+        self.culling = culling
+        super().__init__()
+
+    def setup_cameras(self) -> None:
+        self.main_camera.culling = self.culling
+
+    def load_entities(self) -> None:
+        rng = random.Random(1234)
+        sprite_names = sorted(Atlas.instance(ATLAS).sprites)
+        for _ in range(SPRITE_COUNT):
+            entity = self.entity_type(rng.choice(sprite_names))
+            entity.x = rng.randrange(WORLD_SIZE)
+            entity.y = rng.randrange(WORLD_SIZE)
+            self.entities.add(entity)
+
+    def update(self) -> None:
+        super().update()
+        self.main_camera.x += 7
+        self.main_camera.y += 3
+
+
+def time_scene(scene: Scene) -> tuple[float, int, int]:
+    """ Get the average time of a draw loop, in milliseconds, and the number of entities drawn and culled. """
+    Engine.load_scene(scene)
+    Engine.update()
+    Engine.draw()
+
+    total = 0.0
+    drawn = 0
+    culled = 0
+    for _ in range(FRAMES):
+        Engine.update()
+        start = time.perf_counter()
+        Engine.draw()
+        total += time.perf_counter() - start
+        drawn += scene.main_camera.drawn_entity_count()
+        culled += scene.main_camera.culled_entity_count()
+    return total / FRAMES * 1000, drawn // FRAMES, culled // FRAMES
+
+
+def main() -> int:
+    Game.init(name="benchmark", version="0")
+    Engine.init(1000)
+    Window.init("benchmark", (320, 180))
+    Renderer.init((320, 180), 0)
+    Window.update_viewport()
+
+    results = [
+        ("bounding box, no culling", time_scene(BenchmarkScene(BoundingBoxEntity, False))),
+        ("bounding box, culling", time_scene(BenchmarkScene(BoundingBoxEntity, True))),
+        ("draw_bounds(), no culling", time_scene(BenchmarkScene(DrawBoundsEntity, False))),
+        ("draw_bounds(), culling", time_scene(BenchmarkScene(DrawBoundsEntity, True))),
+    ]
+
+    print(f"\nRenderer: {Renderer.name()}, {SPRITE_COUNT} sprites in a {WORLD_SIZE}x{WORLD_SIZE} world")
+    for name, (milliseconds, drawn, culled) in results:
+        print(f"{name:<28} {milliseconds:>8.2f} ms  {drawn:>5} drawn  {culled:>5} culled")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
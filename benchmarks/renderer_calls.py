@@ -0,0 +1,109 @@
+""" Micro-benchmark for the per-call overhead of Renderer methods.
+
+Run from the project root:
+    python -m benchmarks.renderer_calls
+
+Each benchmark prints the number of calls per second. The draws are tiny, so the numbers mostly measure the Python and
+ctypes overhead of each call rather than the rasterization. The software renderer is used so that the numbers don't
+depend on the GPU.
+
+The buffer benchmarks draw thousands of points and triangles per call, to compare lists of tuples with buffers that
+are passed to SDL directly.
+
+Benchmarks that use call signatures that the renderer doesn't support (for example, tuple arguments on older
+revisions) are reported as unsupported, so that the script can be run against older revisions for comparison.
+"""
+import ctypes
+import os
+from array import array
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+import sdl2
+
+from engine.content_types.texture import Texture
+from engine.data_types.color import Color
+from engine.data_types.point import Point
+from engine.data_types.rect import Rect
+from engine.game import Game
+from engine.renderer import Renderer
+from engine.window import Window
+
+
+CALLS = 20_000
+
+
+def bench(name: str, function, calls: int = CALLS) -> None:
+    """ Time a function, and print the number of calls per second. """
+    try:
+        function()
+    except (TypeError, AttributeError, ctypes.ArgumentError):
+        print(f"{name:<40} {'unsupported':>14}")
+        return
+
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        sdl2.SDL_RenderFlush(Renderer.sdl_renderer())
+        best = min(best, time.perf_counter() - start)
+
+    print(f"{name:<40} {calls / best:>10,.0f} /s")
+
+
+def main() -> int:
+    Game.init(name="benchmark", version="0")
+    Window.init("benchmark", (640, 360))
+    Renderer.init((320, 180), 0)
+
+    texture = Texture.create_target(8, 8)
+    target = Texture.create_target(64, 64)
+    Renderer.set_render_target(target)
+
+    source = Rect(0, 0, 1, 1)
+    white = Color.white()
+    points = [Point(i % 8, i // 8) for i in range(64)]
+    point_tuples = [p.to_tuple() for p in points]
+    vertices = [Point(0, 0), Point(2, 0), Point(0, 2), Point(2, 0), Point(2, 2), Point(0, 2)]
+    vertex_tuples = [v.to_tuple() for v in vertices]
+
+    print("copy")
+    bench("copy(Rect, Rect)", lambda: Renderer.copy(texture, source, Rect(1, 1, 1, 1), 0, None, 0))
+    bench("copy(tuple, tuple)", lambda: Renderer.copy(texture, (0, 0, 1, 1), (1, 1, 1, 1), 0, None, 0))
+    bench("copy(Rect, Rect, rotated)", lambda: Renderer.copy(texture, source, Rect(1, 1, 1, 1), 90, Point(0, 0), 0))
+    bench("copy(tuple, tuple, rotated)", lambda: Renderer.copy(texture, (0, 0, 1, 1), (1, 1, 1, 1), 90, (0, 0), 0))
+
+    print("\nprimitives")
+    bench("draw_point(Point)", lambda: Renderer.draw_point(Point(1, 1), white))
+    bench("draw_point(tuple)", lambda: Renderer.draw_point((1, 1), white))
+    bench("draw_rect_solid(Rect)", lambda: Renderer.draw_rect_solid(Rect(1, 1, 1, 1), white))
+    bench("draw_rect_solid(tuple)", lambda: Renderer.draw_rect_solid((1, 1, 1, 1), white))
+    bench("draw_points(64 Points)", lambda: Renderer.draw_points(points, white))
+    bench("draw_points(64 tuples)", lambda: Renderer.draw_points(point_tuples, white))
+    bench("render_geometry(6 Points)", lambda: Renderer.render_geometry(vertices, white))
+    bench("render_geometry(6 tuples)", lambda: Renderer.render_geometry(vertex_tuples, white))
+
+    many_points = [(i % 64, i // 64 % 64) for i in range(10_000)]
+    many_points_int = array('i', [c for point in many_points for c in point])
+    many_points_float = array('f', many_points_int)
+    many_vertices = [(i % 3, i % 2) for i in range(3_000)]
+    many_vertices_float = array('f', [c for vertex in many_vertices for c in vertex])
+
+    print("\nbuffers")
+    bench("draw_points(10k tuples)", lambda: Renderer.draw_points(many_points, white), 200)
+    bench("draw_points(10k array('i'))", lambda: Renderer.draw_points(many_points_int, white), 200)
+    bench("draw_points(10k array('f'))", lambda: Renderer.draw_points(many_points_float, white), 200)
+    bench("render_geometry(3k vertex tuples)", lambda: Renderer.render_geometry(many_vertices, white), 200)
+    bench("render_geometry(3k vertex array('f'))", lambda: Renderer.render_geometry(many_vertices_float, white), 200)
+
+    Renderer.unset_render_target()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
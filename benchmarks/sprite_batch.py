@@ -0,0 +1,109 @@
+""" Benchmark for batched sprite drawing.
+
+Run from the project root:
+    python -m benchmarks.sprite_batch
+
+Draws 1,000 and 10,000 atlas sprites with a mix of tints and opacities, once with a separate `Renderer.copy` call per
+sprite (setting and clearing the texture's color mod and alpha mod around each copy, as sprites used to), and once
+with `Renderer.copy_batched`. The software renderer is used so that the numbers don't depend on the GPU.
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+import sdl2
+
+from engine.atlas import Atlas
+from engine.content import Content
+from engine.data_types.blend_mode import BlendMode
+from engine.data_types.color import Color
+from engine.data_types.rect import Rect
+from engine.game import Game
+from engine.renderer import Renderer
+from engine.window import Window
+
+
+SPRITE_COUNTS = (1_000, 10_000)
+FRAMES = 20
+ATLAS = "atlas.png"
+
+
+def make_sprites(count: int) -> list[tuple[Rect, Rect, Color, int]]:
+    """ Create (source, destination, tint, opacity) tuples for random frames of the atlas. """
+    atlas = Atlas.instance(ATLAS)
+    frames = [atlas.frame(name) for name in atlas.frame_names]
+    tints = [Color.white(), Color.red(), Color.green(), Color.blue()]
+    width, height = Renderer.resolution()
+
+    rng = random.Random(1234)
+    sprites = []
+    for _ in range(count):
+        frame = rng.choice(frames)
+        source = Rect(frame.x, frame.y, frame.frame_width, frame.frame_height)
+        destination = Rect(rng.randrange(width), rng.randrange(height), frame.frame_width, frame.frame_height)
+        sprites.append((source, destination, rng.choice(tints), rng.choice((255, 255, 128))))
+    return sprites
+
+
+def draw_individually(texture, sprites: list) -> None:
+    """ Draw each sprite with its own copy call. """
+    for source, destination, tint, opacity in sprites:
+        Renderer.set_texture_color_mod(texture, tint)
+        Renderer.set_texture_alpha_mod(texture, opacity)
+        Renderer.copy(texture, source, destination, 0, None, 0)
+        Renderer.clear_texture_color_mod(texture)
+        Renderer.clear_texture_alpha_mod(texture)
+
+
+def draw_batched(texture, sprites: list) -> None:
+    """ Draw the sprites as a batch. """
+    for source, destination, tint, opacity in sprites:
+        Renderer.copy_batched(texture, source, destination, 0, None, 0, tint, opacity)
+    Renderer.flush()
+
+
+def time_frames(draw, texture, sprites: list) -> float:
+    """ Get the average time to draw and rasterize one frame, in milliseconds. """
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        Renderer.clear(Color.black())
+        draw(texture, sprites)
+        sdl2.SDL_RenderFlush(Renderer.sdl_renderer())
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main() -> int:
+    Game.init(name="benchmark", version="0")
+    Window.init("benchmark", (640, 360))
+    Renderer.init((320, 180), 0)
+    print(f"Renderer: {Renderer.name()}")
+
+    texture = Content.load_texture(ATLAS)
+    texture.set_blend_mode(BlendMode.BLEND)
+    target = sdl2.SDL_CreateTexture(
+        Renderer.sdl_renderer(),
+        sdl2.SDL_PIXELFORMAT_RGBA8888,
+        sdl2.SDL_TEXTUREACCESS_TARGET,
+        *Renderer.resolution()
+    )
+    sdl2.SDL_SetRenderTarget(Renderer.sdl_renderer(), target)
+
+    print(f"{'sprites':>8} {'individual':>12} {'batched':>12} {'speedup':>8}")
+    for count in SPRITE_COUNTS:
+        sprites = make_sprites(count)
+        individual = time_frames(draw_individually, texture, sprites)
+        batched = time_frames(draw_batched, texture, sprites)
+        print(f"{count:>8} {individual:>9.2f} ms {batched:>9.2f} ms {individual / batched:>7.2f}x")
+
+    sdl2.SDL_SetRenderTarget(Renderer.sdl_renderer(), None)
+    sdl2.SDL_DestroyTexture(target)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
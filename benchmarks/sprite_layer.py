@@ -0,0 +1,79 @@
+""" Benchmark for repeated sprite layers.
+
+Run from the project root:
+    python -m benchmarks.sprite_layer
+
+Draws a background of four layers of small sprites that repeat on both axes, like a parallax background, with a
+320x180 camera that scrolls every frame. It prints the average time of a full draw loop, and the renderer's draw calls
+and pixels in the last frame.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+from engine.engine import Engine
+from engine.entities.sprite_layer_entity import SpriteLayerEntity
+from engine.game import Game
+from engine.renderer import Renderer
+from engine.scene import Scene
+from engine.sprite import Sprite
+from engine.window import Window
+
+
+FRAMES = 120
+ATLAS = "atlas.png"
+LAYERS = ("blue_skull.0001", "red_skull.0001", "board_layout_a.0001", "summon_fx_blue.0001")
+
+
+class RepeatedLayer(SpriteLayerEntity):
+    """ A layer that repeats a sprite on both axes. """
+    def __init__(self, sprite_name: str) -> None:
+        super().__init__()
+        self.sprite = Sprite.from_atlas(ATLAS, sprite_name)
+        self.repeat_x = True
+        self.repeat_y = True
+
+
+class BenchmarkScene(Scene):
+    def load_entities(self) -> None:
+        for i, sprite_name in enumerate(LAYERS):
+            layer = RepeatedLayer(sprite_name)
+            layer.z_depth = -i
+            self.entities.add(layer)
+
+    def update(self) -> None:
+        super().update()
+        self.main_camera.x += 2.5
+        self.main_camera.y += 1.25
+
+
+def main() -> int:
+    Game.init(name="benchmark", version="0")
+    Engine.init(1000)
+    Window.init("benchmark", (320, 180))
+    Renderer.init((320, 180), 0)
+    Window.update_viewport()
+
+    Engine.load_scene(BenchmarkScene())
+    Engine.update()
+    Engine.draw()
+
+    total = 0.0
+    for _ in range(FRAMES):
+        Engine.update()
+        start = time.perf_counter()
+        Engine.draw()
+        total += time.perf_counter() - start
+
+    stats = Engine.render_stats()
+    print(f"\nRenderer: {Renderer.name()}, {len(LAYERS)} repeated layers")
+    print(f"draw loop {total / FRAMES * 1000:8.2f} ms  {stats.draw_calls} draw calls  {stats.pixels} pixels")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
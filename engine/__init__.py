@@ -40,7 +40,9 @@ from .data_types.rect import Rect
 from .data_types.scale_mode import ScaleMode
 from .data_types.vector2 import Vector2
 
+from engine.entities.cached_layer_entity import CachedLayerEntity
 from engine.entities.gui_widget_entity import GuiWidgetEntity
+from engine.entities.render_stats_overlay_entity import RenderStatsOverlayEntity
 from engine.entities.sprite_layer_entity import SpriteLayerEntity
 
 from .ldtk.ldtk import LDtk
@@ -50,6 +52,7 @@ from .lights.light import Light
 from .lights.point_light import PointLight
 
 from .utilities import papp
+from .utilities import pgeometry
 from .utilities import pmath
 from .utilities import pstring
 
@@ -100,7 +103,9 @@ __all__ = [
     "Vector2",
 
     # Entities
+    "CachedLayerEntity",
     "GuiWidgetEntity",
+    "RenderStatsOverlayEntity",
     "SpriteLayerEntity",
 
     # LDtk
@@ -113,6 +118,7 @@ __all__ = [
 
     # Utilities
     "papp",
+    "pgeometry",
     "pmath",
     "pstring",
 ]
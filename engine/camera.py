@@ -12,7 +12,10 @@ from engine.data_types.rect import Rect
 from engine.data_types.scale_mode import ScaleMode
 from engine.data_types.vector2 import Vector2
 from engine.engine import Engine
+from engine.internal_utilities.draw_queue import DrawQueue
 from engine.internal_utilities.entity_list import EntityList
+from engine.internal_utilities.render_stats import RenderStats
+from engine.internal_utilities.render_target_pool import RenderTargetPool
 from engine.log import Log
 from engine.renderer import Renderer
 from engine.render_pass import RenderPass
@@ -28,10 +31,15 @@ class Camera:
     """ A camera renders entities to the screen.
 
     A high-level overview of the camera rendering process is:
-        1. For all valid entities, draw to the render passes textures
-        2. Copy all render passes to the camera's render texture
-        3. Scale the render texture to match the viewport size
-        4. Copy the scaled render texture to the viewport
+        1. For all valid entities, record draw commands for the render passes
+        2. Clear the render passes that were drawn to, and execute the draw commands one render pass at a time
+        3. Copy the visible render passes to the camera's render texture
+        4. Scale the render texture to match the viewport size
+        5. Copy the scaled render texture to the viewport
+
+    Steps are skipped when they wouldn't change the result. Render passes with no draws aren't cleared or copied if
+    they would be invisible. When only the default pass is visible, it is used as the render texture directly. When the
+    render texture isn't drawn at a sub-pixel offset, it is scaled straight into the viewport.
 
     The camera renders an extra pixel of width and height so that the scaled render texture can be drawn at sub-pixel
     increments when the camera is moving. This allows for smooth camera movement.
@@ -41,6 +49,7 @@ class Camera:
         self._name = name
         self._draw_order = draw_order
         self._active = True
+        self._ended = False
 
         self._pixel_perfect_scaling = True
         self._scale = 1
@@ -50,6 +59,17 @@ class Camera:
 
         self._tint = None
 
+        # Culling skips entities whose draw bounds are off-screen
+        self._culling = False
+        self._culling_margin = 16
+
+        # The number of entities that were drawn and culled in the last frame
+        self._drawn_entity_count = 0
+        self._culled_entity_count = 0
+
+        # The renderer's work while drawing the camera in the last frame
+        self._render_stats = RenderStats()
+
         self._include_tags = set()
         self._exclude_tags = set()
         self._include_tags_filter_set = False
@@ -67,27 +87,30 @@ class Camera:
         }
         self._extra_render_passes: list[RenderPass] = []
 
-        # Create a null texture to draw to when an invalid render pass is drawn to
-        self._null_texture = Texture.create_target(2, 2)
+        # Entity draw calls are recorded here, so that each render pass only has to be set as the render target once
+        self._draw_queue = DrawQueue()
+
+        # A null texture to draw to when an invalid render pass is drawn to
+        self._null_texture: Optional[Texture] = None
 
         # When the camera renders, it draws everything to its render texture.
         # After it is finished drawing, the render texture is scaled and copied to the main window.
-        self._render_texture = Texture.create_target(2, 2)
-
-        self._scaled_render_texture = Texture.create_target(2, 2)
+        # Render targets are acquired from the render target pool when the camera starts or first draws, so that a
+        # scene that is created ahead of time doesn't hold textures before it is loaded.
+        self._render_texture: Optional[Texture] = None
+        self._scaled_render_texture: Optional[Texture] = None
         self._scaled_resolution = Renderer.resolution()
         self._offset_x = 0
         self._offset_y = 0
-
-        # Initialize render passes
-        self._reset_render_targets()
+        self._update_scale()
 
         # Callbacks
+        # These are removed when the camera ends
         Window.add_resize_callback(self._reset_render_targets)
         Renderer.add_reset_callback(self._reset_render_targets)
 
     def __del__(self) -> None:
-        Renderer.remove_reset_callback(self._reset_render_targets)
+        self.end()
 
     def __str__(self) -> str:
         return f"Camera({self.name})"
@@ -123,6 +146,27 @@ class Camera:
     def pixel_perfect_scaling(self, value: bool) -> None:
         self._pixel_perfect_scaling = value
 
+    @property
+    def culling(self) -> bool:
+        """ If True, entities whose draw bounds don't overlap the camera's rect (plus the culling margin) aren't drawn.
+        This is off by default, because an entity's draw bounds default to its bounding box; entities that draw outside
+        of it should override `Entity.draw_bounds()`, or set `Entity.cullable` to False.
+        """
+        return self._culling
+
+    @culling.setter
+    def culling(self, value: bool) -> None:
+        self._culling = value
+
+    @property
+    def culling_margin(self) -> int:
+        """ The number of pixels that the camera's rect is grown by on each side when culling entities. """
+        return self._culling_margin
+
+    @culling_margin.setter
+    def culling_margin(self, value: int) -> None:
+        self._culling_margin = int(value)
+
     @property
     def x(self) -> float:
         """ The X position of the camera. """
@@ -194,6 +238,41 @@ class Camera:
         """ The viewport rect of the camera in world space. """
         return Rect(floor(self._x), floor(self._y), self.resolution[0], self.resolution[1])
 
+    def cull_rect(self) -> Rect:
+        """ The world-space rect that entities must overlap to be drawn when culling is enabled. """
+        margin = self._culling_margin
+        return Rect(
+            floor(self._x) - margin,
+            floor(self._y) - margin,
+            self.resolution[0] + margin * 2,
+            self.resolution[1] + margin * 2
+        )
+
+    def is_visible(self, rect: Rect) -> bool:
+        """ Check if a world-space rect overlaps the area that the camera renders. """
+        left = floor(self._x)
+        top = floor(self._y)
+
+        # The render targets may have an extra pixel of width and height, for sub-pixel camera movement
+        return (
+            rect.x <= left + self.resolution[0]
+            and left < rect.x + rect.width
+            and rect.y <= top + self.resolution[1]
+            and top < rect.y + rect.height
+        )
+
+    def drawn_entity_count(self) -> int:
+        """ The number of entities that the camera drew in the last frame. """
+        return self._drawn_entity_count
+
+    def culled_entity_count(self) -> int:
+        """ The number of entities that the camera skipped in the last frame because they were off-screen. """
+        return self._culled_entity_count
+
+    def render_stats(self) -> RenderStats:
+        """ The renderer's statistics for drawing the camera in the last frame. """
+        return self._render_stats
+
     def include_tag(self, tag: str) -> None:
         """ When set, the camera will only render entities with the include tag(s).
         By default, there are no include tags set, so the camera will render everything.
@@ -219,6 +298,12 @@ class Camera:
         self._exclude_tags.clear()
         self._exclude_tags_filter_set = False
 
+    def tag_filter_key(self) -> tuple[frozenset[str], frozenset[str]]:
+        """ The camera's include and exclude tags.
+        Cameras with the same key draw the same entities, so this can be used to share work between them.
+        """
+        return frozenset(self._include_tags), frozenset(self._exclude_tags)
+
     def add_render_pass(self, render_pass: RenderPass) -> None:
         """ Add a render pass. """
         if render_pass.name in self._render_pass_map:
@@ -228,16 +313,21 @@ class Camera:
         self._extra_render_passes.append(render_pass)
         self._render_pass_map[render_pass.name] = render_pass
 
-    def add_lighting_pass(self) -> None:
-        """ Add a lighting render pass. """
-        render_pass = RenderPass("Lighting")
+    def add_lighting_pass(self, resolution_divisor: int = 1) -> None:
+        """ Add a lighting render pass.
+        Lighting is usually smooth, so it can be drawn at a fraction of the camera's resolution (for example, a divisor
+        of 2 for half resolution) to reduce its fill cost.
+        """
+        render_pass = RenderPass("Lighting", resolution_divisor)
         render_pass.set_clear_color(Color.black())
         render_pass.set_blend_mode(BlendMode.MOD)
         self.add_render_pass(render_pass)
 
-    def add_glow_pass(self) -> None:
-        """ Add a glow render pass. """
-        render_pass = RenderPass("Glow")
+    def add_glow_pass(self, resolution_divisor: int = 1) -> None:
+        """ Add a glow render pass.
+        Like the lighting pass, the glow pass can be drawn at a fraction of the camera's resolution.
+        """
+        render_pass = RenderPass("Glow", resolution_divisor)
         render_pass.set_clear_color(Color.black())
         render_pass.set_blend_mode(BlendMode.ADD)
         self.add_render_pass(render_pass)
@@ -246,21 +336,57 @@ class Camera:
         """ This runs just before the first update. """
         self._reset_render_targets()
 
+    def end(self) -> None:
+        """ Called when the scene ends.
+        This returns the camera's render targets to the render target pool, so the next scene's cameras can use them.
+        """
+        if self._ended:
+            return
+        self._ended = True
+
+        Window.remove_resize_callback(self._reset_render_targets)
+        Renderer.remove_reset_callback(self._reset_render_targets)
+
+        for texture in (self._null_texture, self._render_texture, self._scaled_render_texture):
+            if texture is not None:
+                RenderTargetPool.release(texture)
+        self._null_texture = None
+        self._render_texture = None
+        self._scaled_render_texture = None
+
+        for render_pass in self._render_pass_map.values():
+            render_pass.release_texture()
+
     def draw(self, entities: EntityList) -> None:
         """ Draw entities. """
-        self._clear_render_targets()
+        if self._render_texture is None:
+            self._reset_render_targets()
+
+        Renderer.begin_stats(self._render_stats)
+        Renderer.set_draw_queue(self._draw_queue)
         self._draw_entities(entities)
 
         if __debug__:
             if Engine.debug_mode():
                 self._debug_draw_entities(entities)
 
-        self._copy_render_passes()
-        self._scale_render_texture()
-        self._copy_render_texture_to_viewport()
+        Renderer.clear_draw_queue()
 
-    def _reset_render_targets(self) -> None:
-        """ Create the camera's render target textures. """
+        render_passes = self._visible_render_passes()
+        for render_pass in render_passes:
+            render_pass.clear()
+        self._draw_queue.execute(Renderer)
+
+        if render_passes:
+            render_texture = self._copy_render_passes(render_passes)
+            self._copy_render_texture_to_viewport(render_texture)
+
+        Renderer.end_stats()
+
+    def _update_scale(self) -> tuple[int, int]:
+        """ Calculate the camera's scale and offset in the viewport.
+        Returns the size of the camera's render targets.
+        """
         # Calculate the scaling needed
         scale_x = Window.viewport().width / self.resolution[0]
         scale_y = Window.viewport().height / self.resolution[1]
@@ -292,12 +418,25 @@ class Camera:
             w = self.resolution[0]
             h = self.resolution[1]
 
+        return w, h
+
+    def _reset_render_targets(self) -> None:
+        """ Create the camera's render target textures. """
+        w, h = self._update_scale()
         scaled_w = int(w * self._scale)
         scaled_h = int(h * self._scale)
 
-        # Create the camera's render texture and upscaled render texture
-        self._render_texture = Texture.create_target(w, h)
-        self._scaled_render_texture = Texture.create_target(scaled_w, scaled_h)
+        if self._null_texture is None:
+            self._null_texture = RenderTargetPool.acquire(2, 2)
+
+        # Get the camera's render texture and upscaled render texture
+        # The previous textures are released first, so textures that keep the same size are re-used
+        if self._render_texture is not None:
+            RenderTargetPool.release(self._render_texture)
+        if self._scaled_render_texture is not None:
+            RenderTargetPool.release(self._scaled_render_texture)
+        self._render_texture = RenderTargetPool.acquire(w, h)
+        self._scaled_render_texture = RenderTargetPool.acquire(scaled_w, scaled_h)
         if self.pixel_perfect_scaling:
             self._render_texture.set_scale_mode(ScaleMode.NEAREST)
             self._scaled_render_texture.set_scale_mode(ScaleMode.NEAREST)
@@ -309,86 +448,77 @@ class Camera:
         self._scaled_render_texture.set_blend_mode(BlendMode.ALPHA_COMPOSITE)
 
         # Create a texture for each render pass
-        self._default_render_pass.create_texture(w, h)
-        self._debug_render_pass.create_texture(w, h)
-        for render_pass in self._extra_render_passes:
+        # The scale mode matches the render texture, since a render pass can be scaled to the viewport in its place
+        for render_pass in self._render_pass_map.values():
             render_pass.create_texture(w, h)
-            if self.pixel_perfect_scaling:
+            if render_pass.resolution_divisor > 1:
+                # Reduced-resolution passes are smoothed when they are upscaled
+                render_pass.texture.set_scale_mode(ScaleMode.LINEAR)
+            elif self.pixel_perfect_scaling:
                 render_pass.texture.set_scale_mode(ScaleMode.NEAREST)
             else:
                 render_pass.texture.set_scale_mode(ScaleMode.BEST)
 
-        # The null texture is never displayed, so it has a small size
-        self._null_texture = Texture.create_target(2, 2)
-
-    def _clear_render_targets(self) -> None:
-        """ Clear the camera's render target textures. """
-        Renderer.set_render_target(self._render_texture)
-        Renderer.clear()
+    def _visible_render_passes(self) -> list[RenderPass]:
+        """ Get the render passes that need to be drawn this frame, in the order that they are composited.
+        A render pass that wasn't drawn to is skipped if it would be invisible once cleared.
+        """
+        drawn_targets = self._draw_queue.targets()
 
-        Renderer.set_render_target(self._scaled_render_texture)
-        Renderer.clear()
+        render_passes = [self._default_render_pass, *self._extra_render_passes]
+        if __debug__:
+            render_passes.append(self._debug_render_pass)
 
-        self._default_render_pass.clear()
-        self._debug_render_pass.clear()
-        for render_pass in self._extra_render_passes:
-            render_pass.clear()
+        return [rp for rp in render_passes if rp.texture in drawn_targets or not rp.is_invisible_when_clear()]
 
     def _draw_entities(self, entities: EntityList) -> None:
         """ Draw entities to the camera's render texture.
         The default render pass will be used, unless an entity overrides it in the 'draw()' method.
         """
         with self.render_pass("Default"):
-            entities.draw(self)
+            self._drawn_entity_count, self._culled_entity_count = entities.draw(self)
 
     def _debug_draw_entities(self, entities: EntityList) -> None:
         """ Draw the debug pass. """
         with self.render_pass("Debug"):
             entities.debug_draw(self)
 
-    def _copy_render_passes(self) -> None:
-        """ Copy render passes to the camera's render texture. """
-        Renderer.set_render_target(self._render_texture)
+    def _copy_render_passes(self, render_passes: list[RenderPass]) -> Texture:
+        """ Copy render passes to the camera's render texture, and return the texture to display.
+        A single full-resolution, alpha-composited render pass would be copied unchanged, so its texture is returned
+        instead. Reduced-resolution render passes are upscaled as they are copied.
+        """
+        if len(render_passes) == 1:
+            render_pass = render_passes[0]
+            if render_pass.blend_mode == BlendMode.ALPHA_COMPOSITE and render_pass.resolution_divisor == 1:
+                return render_pass.texture
 
-        # Default
-        Renderer.copy(
-            texture=self._default_render_pass.texture,
-            source_rect=None,
-            destination_rect=None,
-            rotation_angle=0,
-            rotation_center=None,
-            flip=0
-        )
+        Renderer.set_render_target(self._render_texture)
+        Renderer.clear()
+        for render_pass in render_passes:
+            # A reduced-resolution texture may be rounded up in size, so it's scaled by its divisor rather than stretched
+            destination = None
+            divisor = render_pass.resolution_divisor
+            if divisor > 1:
+                destination = (0, 0, render_pass.texture.width * divisor, render_pass.texture.height * divisor)
 
-        # Extra passes
-        for render_pass in self._extra_render_passes:
             Renderer.copy(
                 texture=render_pass.texture,
                 source_rect=None,
-                destination_rect=None,
-                rotation_angle=0,
-                rotation_center=None,
-                flip=0
-            )
-
-        # Debug
-        if __debug__:
-            Renderer.copy(
-                texture=self._debug_render_pass.texture,
-                source_rect=None,
-                destination_rect=None,
+                destination_rect=destination,
                 rotation_angle=0,
                 rotation_center=None,
                 flip=0
             )
 
-        Renderer.unset_render_target()
+        return self._render_texture
 
-    def _scale_render_texture(self) -> None:
-        """ Scale the render texture to a size matching the viewport. """
+    def _scale_render_texture(self, render_texture: Texture) -> None:
+        """ Scale the render texture to the scaled render texture. """
         Renderer.set_render_target(self._scaled_render_texture)
+        Renderer.clear()
         Renderer.copy(
-            texture=self._render_texture,
+            texture=render_texture,
             source_rect=None,
             destination_rect=None,
             rotation_angle=0,
@@ -396,16 +526,14 @@ class Camera:
             flip=0
         )
 
-    def _copy_render_texture_to_viewport(self) -> None:
-        """ Copy the camera's render texture to the window's viewport texture. """
-        Renderer.set_render_target(Window.viewport_texture())
-
-        # Apply tint
-        if self.color:
-            Renderer.set_texture_color_mod(self._scaled_render_texture, self.color)
+    def _copy_render_texture_to_viewport(self, render_texture: Texture) -> None:
+        """ Copy the camera's render texture to the window's viewport texture, scaling it to the viewport size.
 
-        # Calculate the source and destination rects
-        # If doing pixel-perfect upscaling, calculate sub-pixel offsets for smooth drawing
+        When doing pixel-perfect upscaling, the render texture is drawn at a sub-pixel offset for smooth camera
+        movement; this needs the render texture to be scaled to an intermediate texture first, so that it can be
+        offset in whole pixels of the scaled size. Otherwise, the render texture is scaled straight into the viewport.
+        """
+        # Calculate sub-pixel offsets
         if self._scale > 1 and self._pixel_perfect_scaling:
             xr = self.x % 1
             yr = self.y % 1
@@ -415,12 +543,26 @@ class Camera:
             x = 0
             y = 0
 
-        source = Rect(x, y, self._scaled_resolution[0], self._scaled_resolution[1])
+        # Calculate the source and destination rects
+        if x or y:
+            self._scale_render_texture(render_texture)
+            texture = self._scaled_render_texture
+            source = Rect(x, y, self._scaled_resolution[0], self._scaled_resolution[1])
+        else:
+            texture = render_texture
+            source = Rect(0, 0, self._resolution[0], self._resolution[1])
+
         destination = Rect(self._offset_x, self._offset_y, self._scaled_resolution[0], self._scaled_resolution[1])
 
+        Renderer.set_render_target(Window.viewport_texture())
+
+        # Apply tint
+        if self.color:
+            Renderer.set_texture_color_mod(texture, self.color)
+
         # Copy render texture
         Renderer.copy(
-            texture=self._scaled_render_texture,
+            texture=texture,
             source_rect=source,
             destination_rect=destination,
             rotation_angle=0,
@@ -430,7 +572,7 @@ class Camera:
 
         # Clear tint
         if self.color:
-            Renderer.clear_texture_color_mod(self._scaled_render_texture)
+            Renderer.clear_texture_color_mod(texture)
 
         Renderer.unset_render_target()
 
@@ -455,6 +597,20 @@ class Camera:
         y = pmath.remap(screen_position.y, viewport.top(), viewport.bottom(), 0, resolution_y)
         return Point(x, y)
 
+    def draw_entity(self, entity: Entity) -> None:
+        """ Draw an entity.
+        While the camera is drawing, the entity's draw calls are recorded as a command, and drawn in the same order.
+        """
+        if Renderer.draw_queue() is self._draw_queue:
+            self._draw_queue.begin_command()
+        entity.draw(self)
+
+    def debug_draw_entity(self, entity: Entity) -> None:
+        """ Debug draw an entity. """
+        if Renderer.draw_queue() is self._draw_queue:
+            self._draw_queue.begin_command()
+        entity.debug_draw(self)
+
     def can_draw_entity(self, entity: Entity) -> bool:
         """ Check if an entity can be drawn by the camera. """
         # If no tag filters have been set, the entity will always be visible
@@ -475,7 +631,9 @@ class Camera:
 
     @contextmanager
     def render_pass(self, name: str) -> Generator:
-        """ Context manager to render to a specific render pass. """
+        """ Context manager to render to a specific render pass.
+        While the camera is drawing, this only changes the render pass that draw calls are recorded for.
+        """
         render_pass = self._render_pass_map.get(name)
 
         if render_pass:
@@ -484,5 +642,11 @@ class Camera:
             Log.error(f"{self} has no render pass named {name}")
             target = self._null_texture
 
-        with Renderer.render_target(target):
+        if Renderer.draw_queue() is self._draw_queue:
+            previous_target = self._draw_queue.target
+            self._draw_queue.set_target(target)
             yield
+            self._draw_queue.set_target(previous_target)
+        else:
+            with Renderer.render_target(target):
+                yield
@@ -7,6 +7,8 @@ from typing import Any, IO, Iterator, Optional
 from engine.content_types.audio_clip import AudioClip
 from engine.content_types.audio_stream import AudioStream
 from engine.content_types.texture import Texture
+from engine.data_types.blend_mode import BlendMode
+from engine.internal_utilities.texture_registry import TextureRegistry
 from engine.log import Log
 from engine.utilities import papp
 
@@ -35,6 +37,9 @@ class Content:
         'empty-texture': Texture.create_static(2, 2),
     }
 
+    # Silhouettes of loaded textures, by the texture's content path
+    __loaded_silhouettes: dict[str, Texture] = {}
+
     @classmethod
     def root(cls) -> Path:
         """ Get the content root. """
@@ -151,12 +156,35 @@ class Content:
                 Log.error(f"Content path does not exist: {content_path}")
                 cls.__loaded_content[content_path] = Texture.create_static(2, 2)
 
+            # Loaded content is shared between scenes
+            TextureRegistry.retain(cls.__loaded_content[content_path])
+
         return cls.__loaded_content[content_path]
 
+    @classmethod
+    def load_silhouette(cls, content_path: str) -> Texture:
+        """ Load a silhouette of a 2D texture; every pixel is white, with the alpha of the original texture. """
+        content_path = cls._format_path(content_path)
+        if content_path not in cls.__loaded_silhouettes:
+            if cls.is_file(content_path):
+                full_content_path = cls._full_content_path(content_path)
+                cls.__loaded_silhouettes[content_path] = Texture.silhouette_from_file(full_content_path)
+            else:
+                # There is no image to take the alpha from, so the silhouette is transparent, and the flash is hidden
+                texture = cls.load_texture(content_path)
+                silhouette = Texture.create_static(texture.width, texture.height)
+                silhouette.update(bytes(texture.width * texture.height * 4), texture.width * 4)
+                silhouette.set_blend_mode(BlendMode.BLEND)
+                cls.__loaded_silhouettes[content_path] = silhouette
+            TextureRegistry.retain(cls.__loaded_silhouettes[content_path])
+
+        return cls.__loaded_silhouettes[content_path]
+
     @classmethod
     def unload(cls, content_path: str) -> None:
         """ Unload content. """
         content_path = cls._format_path(content_path)
+        cls.__loaded_silhouettes.pop(content_path, None)
         try:
             cls.__loaded_content.pop(content_path)
         except KeyError:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from ctypes import byref, c_int, POINTER
+from ctypes import byref, c_int, c_uint32, memmove, POINTER, string_at
 from io import BytesIO
 from pathlib import Path
 from typing import Optional
@@ -10,6 +10,7 @@ import sdl2.sdlimage
 
 from engine.data_types.blend_mode import BlendMode
 from engine.data_types.scale_mode import ScaleMode
+from engine.internal_utilities.texture_registry import TextureRegistry
 
 
 BLENDMODE_ALPHA_COMPOSITE = sdl2.SDL_ComposeCustomBlendMode(
@@ -27,22 +28,40 @@ class Texture:
 
     New instances of this shouldn't be created manually, instead the factory methods should be used to more easily
     initialize the texture.
+
+    While a camera is recording draw calls, scale mode and blend mode changes are recorded too, so that they apply to
+    the draw calls around them. Other changes (pixels, render scale, and color and alpha mods set on the texture
+    directly) take effect immediately; draw code should use the `Renderer` methods for color and alpha mods.
     """
     def __init__(self,
                  width: int,
                  height: int,
                  sdl_texture: Optional[POINTER(sdl2.SDL_Texture)],
-                 name: Optional[str] = None
+                 name: Optional[str] = None,
+                 pixel_format: int = sdl2.SDL_PIXELFORMAT_RGBA8888,
+                 access: int = sdl2.SDL_TEXTUREACCESS_STATIC
                  ) -> None:
         self._width = width
         self._height = height
         self._sdl_texture = sdl_texture
         self._name = name
+        self._pixel_format = pixel_format
+        self._access = access
         self._scale_mode = ScaleMode.NEAREST
         self._blend_mode = BlendMode.NONE
 
+        # The texture's color mod and alpha mod, so that unchanged values don't have to be sent to SDL again
+        self._color_mod = (255, 255, 255)
+        self._alpha_mod = 255
+
+        # The scale applied to draw calls while the texture is the render target
+        self._render_scale = 1.0
+
+        TextureRegistry.register(self)
+
     def __del__(self):
         sdl2.SDL_DestroyTexture(self.sdl_texture)
+        TextureRegistry.unregister(self)
 
     def __str__(self) -> str:
         if self._name:
@@ -73,6 +92,16 @@ class Texture:
         """ The name of the texture. """
         return self._name
 
+    @property
+    def pixel_format(self) -> int:
+        """ The SDL pixel format of the texture. """
+        return self._pixel_format
+
+    @property
+    def access(self) -> int:
+        """ The SDL texture access (static, streaming or target). """
+        return self._access
+
     @property
     def scale_mode(self) -> ScaleMode:
         """ The scale mode used in drawing operations. """
@@ -83,14 +112,35 @@ class Texture:
         """ The blend mode used in drawing operations. """
         return self._blend_mode
 
+    @property
+    def color_mod(self) -> tuple[int, int, int]:
+        """ The (r, g, b) color multiplied into copy operations. """
+        return self._color_mod
+
+    @property
+    def alpha_mod(self) -> int:
+        """ The alpha value multiplied into copy operations. """
+        return self._alpha_mod
+
+    @property
+    def render_scale(self) -> float:
+        """ The scale applied to draw calls while the texture is the render target. """
+        return self._render_scale
+
+    def set_render_scale(self, scale: float) -> None:
+        """ Set the scale applied to draw calls while the texture is the render target.
+        This lets a texture that is smaller than the camera's render texture be drawn to with render coordinates.
+        The scale takes effect the next time that the texture is set as the render target.
+        """
+        self._render_scale = scale
+
     @staticmethod
-    def _create_new(width: int, height: int, access: int) -> Texture:
+    def _create_new(width: int, height: int, access: int, pixel_format: int = sdl2.SDL_PIXELFORMAT_RGBA8888) -> Texture:
         """ Create a new texture. """
         from engine.renderer import Renderer
 
-        pixel_format = sdl2.SDL_PIXELFORMAT_RGBA8888
         sdl_texture = sdl2.SDL_CreateTexture(Renderer.sdl_renderer(), pixel_format, access, width, height)
-        return Texture(width, height, sdl_texture)
+        return Texture(width, height, sdl_texture, pixel_format=pixel_format, access=access)
 
     @staticmethod
     def create_static(width: int, height: int) -> Texture:
@@ -117,15 +167,70 @@ class Texture:
             rw = sdl2.rw_from_object(BytesIO(fp.read()))
             sdl_texture = sdl2.sdlimage.IMG_LoadTexture_RW(Renderer.sdl_renderer(), rw, freesrc=False)
 
-        # Query texture for width and height
+        # Query texture for format, access, width and height
+        pixel_format = c_uint32()
+        access = c_int()
         width = c_int()
         height = c_int()
-        sdl2.SDL_QueryTexture(sdl_texture, None, None, byref(width), byref(height))
+        sdl2.SDL_QueryTexture(sdl_texture, byref(pixel_format), byref(access), byref(width), byref(height))
+
+        return Texture(width.value, height.value, sdl_texture, image_file.name, pixel_format.value, access.value)
+
+    @staticmethod
+    def silhouette_from_file(image_file: Path) -> Texture:
+        """ Create a silhouette texture from an image file.
+        Every pixel of the silhouette is white, with the alpha of the original image.
+        """
+        from engine.renderer import Renderer
+
+        # Load the image as an RGBA surface
+        with image_file.open('rb') as fp:
+            rw = sdl2.rw_from_object(BytesIO(fp.read()))
+            image_surface = sdl2.sdlimage.IMG_Load_RW(rw, freesrc=False)
+        surface = sdl2.SDL_ConvertSurfaceFormat(image_surface, sdl2.SDL_PIXELFORMAT_RGBA32, 0)
+        sdl2.SDL_FreeSurface(image_surface)
+
+        # Set the red, green and blue bytes of each pixel to 255, keeping the alpha byte
+        sdl2.SDL_LockSurface(surface)
+        width = surface.contents.w
+        height = surface.contents.h
+        size = surface.contents.pitch * height
+        pixels = bytearray(string_at(surface.contents.pixels, size))
+        for channel in range(3):
+            pixels[channel::4] = b'\xff' * len(range(channel, size, 4))
+        memmove(surface.contents.pixels, bytes(pixels), size)
+        sdl2.SDL_UnlockSurface(surface)
+
+        sdl_texture = sdl2.SDL_CreateTextureFromSurface(Renderer.sdl_renderer(), surface)
+        sdl2.SDL_FreeSurface(surface)
 
-        return Texture(width.value, height.value, sdl_texture, image_file.name)
+        # The renderer picks the texture format
+        pixel_format = c_uint32()
+        sdl2.SDL_QueryTexture(sdl_texture, byref(pixel_format), None, None, None)
+
+        texture = Texture(width, height, sdl_texture, f"{image_file.name} (silhouette)", pixel_format.value)
+        texture.set_blend_mode(BlendMode.BLEND)
+        return texture
 
     def set_scale_mode(self, scale_mode: ScaleMode) -> None:
-        """ Set the texture scale mode. """
+        """ Set the texture scale mode.
+        While a draw queue is set on the renderer, the change is recorded, and `scale_mode` is updated when it runs.
+        """
+        from engine.renderer import Renderer
+
+        draw_queue = Renderer.draw_queue()
+        if draw_queue is not None:
+            draw_queue.record(Texture._apply_scale_mode, (self, scale_mode), {})
+        else:
+            self._apply_scale_mode(scale_mode)
+
+    def _apply_scale_mode(self, scale_mode: ScaleMode) -> None:
+        """ Send a scale mode change to SDL. """
+        from engine.renderer import Renderer
+
+        # Batched sprites are drawn with the texture's current settings, so draw them before the settings change
+        Renderer.flush()
+
         self._scale_mode = scale_mode
         match scale_mode:
             case ScaleMode.NEAREST:
@@ -136,7 +241,24 @@ class Texture:
                 sdl2.SDL_SetTextureScaleMode(self.sdl_texture, sdl2.SDL_ScaleModeBest)
 
     def set_blend_mode(self, blend_mode: BlendMode) -> None:
-        """ Set the texture blend mode. """
+        """ Set the texture blend mode.
+        While a draw queue is set on the renderer, the change is recorded, and `blend_mode` is updated when it runs.
+        """
+        from engine.renderer import Renderer
+
+        draw_queue = Renderer.draw_queue()
+        if draw_queue is not None:
+            draw_queue.record(Texture._apply_blend_mode, (self, blend_mode), {})
+        else:
+            self._apply_blend_mode(blend_mode)
+
+    def _apply_blend_mode(self, blend_mode: BlendMode) -> None:
+        """ Send a blend mode change to SDL. """
+        from engine.renderer import Renderer
+
+        # Batched sprites are drawn with the texture's current settings, so draw them before the settings change
+        Renderer.flush()
+
         self._blend_mode = blend_mode
         match blend_mode:
             case BlendMode.NONE:
@@ -151,3 +273,42 @@ class Texture:
                 sdl2.SDL_SetTextureBlendMode(self.sdl_texture, sdl2.SDL_BLENDMODE_MUL)
             case BlendMode.ALPHA_COMPOSITE:
                 sdl2.SDL_SetTextureBlendMode(self.sdl_texture, BLENDMODE_ALPHA_COMPOSITE)
+
+    def set_color_mod(self, r: int, g: int, b: int) -> bool:
+        """ Set the color multiplied into copy operations.
+        Returns False if the color mod was already set to this color, and nothing had to be changed.
+        """
+        color_mod = (r, g, b)
+        if color_mod == self._color_mod:
+            return False
+
+        self._color_mod = color_mod
+        sdl2.SDL_SetTextureColorMod(self.sdl_texture, r, g, b)
+        return True
+
+    def set_alpha_mod(self, alpha: int) -> bool:
+        """ Set the alpha value multiplied into copy operations.
+        Returns False if the alpha mod was already set to this value, and nothing had to be changed.
+        """
+        if alpha == self._alpha_mod:
+            return False
+
+        self._alpha_mod = alpha
+        sdl2.SDL_SetTextureAlphaMod(self.sdl_texture, alpha)
+        return True
+
+    def restore_mods(self) -> None:
+        """ Send the texture's color mod and alpha mod to SDL again, in case something else changed them. """
+        sdl2.SDL_SetTextureColorMod(self.sdl_texture, *self._color_mod)
+        sdl2.SDL_SetTextureAlphaMod(self.sdl_texture, self._alpha_mod)
+
+    def update(self, pixels: bytes, pitch: int) -> None:
+        """ Replace the texture's pixel data.
+        `pixels` must be in the texture's pixel format, and `pitch` is the number of bytes in each row of pixels.
+        """
+        from engine.renderer import Renderer
+
+        # Batched sprites that use the texture must be drawn with its old pixels
+        Renderer.flush()
+
+        sdl2.SDL_UpdateTexture(self.sdl_texture, None, pixels, pitch)
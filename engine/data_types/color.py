@@ -34,7 +34,7 @@ class Color:
 
     def __iter__(self):
         return iter(self.to_tuple())
-    
+
     @property
     def r(self) -> int:
         return self._r
@@ -69,51 +69,67 @@ class Color:
 
     def to_tuple(self) -> tuple[int, int, int, int]:
         """ Return a copy of the color as a tuple. """
-        return self.r, self.g, self.b, self.a
+        return self._r, self._g, self._b, self._a
+
+    def copy(self) -> Color:
+        """ Return a mutable copy of the color. """
+        return Color._from_valid(self._r, self._g, self._b, self._a)
+
+    @classmethod
+    def _from_valid(cls, r: int, g: int, b: int, a: int) -> Self:
+        """ Create a color from channel values that are already ints in the 0-255 range, skipping validation. """
+        color = cls.__new__(cls)
+        color._r = r
+        color._g = g
+        color._b = b
+        color._a = a
+        return color
+
+    # Common colors are shared, immutable instances. Use `copy()` to get a color that can be modified.
 
     @classmethod
     def black(cls) -> Color:
-        return Color(0, 0, 0, 255)
+        return _BLACK
 
     @classmethod
     def white(cls) -> Color:
-        return Color(255, 255, 255, 255)
+        return _WHITE
 
     @classmethod
     def gray(cls) -> Color:
-        return Color(128, 128, 128, 255)
+        return _GRAY
 
     @classmethod
     def red(cls) -> Color:
-        return Color(255, 0, 0, 255)
+        return _RED
 
     @classmethod
     def green(cls) -> Color:
-        return Color(0, 255, 0, 255)
+        return _GREEN
 
     @classmethod
     def blue(cls) -> Color:
-        return Color(0, 0, 255, 255)
+        return _BLUE
 
     @classmethod
     def cyan(cls) -> Color:
-        return Color(0, 255, 255, 255)
+        return _CYAN
 
     @classmethod
     def magenta(cls) -> Color:
-        return Color(255, 0, 255, 255)
+        return _MAGENTA
 
     @classmethod
     def yellow(cls) -> Color:
-        return Color(255, 255, 0, 255)
+        return _YELLOW
 
     @classmethod
     def orange(cls) -> Color:
-        return Color(255, 128, 0, 255)
+        return _ORANGE
 
     @classmethod
     def transparent(cls) -> Color:
-        return Color(0, 0, 0, 0)
+        return _TRANSPARENT
 
     @classmethod
     def random(cls, saturation: Optional[float] = None, brightness: Optional[float] = None) -> Self:
@@ -144,11 +160,12 @@ class Color:
     @classmethod
     def lerp(cls, color_a: Color, color_b: Color, t: float) -> Self:
         """ Linearly interpolate between 2 colors. """
+        # Lerp is clamped between the two colors, so the result is always valid
         r = int(pmath.lerp(color_a.r, color_b.r, t))
         g = int(pmath.lerp(color_a.g, color_b.g, t))
         b = int(pmath.lerp(color_a.b, color_b.b, t))
         a = int(pmath.lerp(color_a.a, color_b.a, t))
-        return cls(r, g, b, a)
+        return cls._from_valid(r, g, b, a)
 
     @classmethod
     def hsv(cls, h: float, s: float, v: float) -> Self:
@@ -213,3 +230,27 @@ class Color:
         """
         hex_code = f"#{value:06x}"
         return cls.from_hex(hex_code)
+
+
+class _ConstantColor(Color):
+    """ A color that can't be modified. """
+    def _immutable(self, value: int) -> None:
+        raise AttributeError(f"{self} is a shared constant and can't be modified; use copy() to get a mutable color.")
+
+    r = property(Color.r.fget, _immutable)
+    g = property(Color.g.fget, _immutable)
+    b = property(Color.b.fget, _immutable)
+    a = property(Color.a.fget, _immutable)
+
+
+_BLACK = _ConstantColor(0, 0, 0, 255)
+_WHITE = _ConstantColor(255, 255, 255, 255)
+_GRAY = _ConstantColor(128, 128, 128, 255)
+_RED = _ConstantColor(255, 0, 0, 255)
+_GREEN = _ConstantColor(0, 255, 0, 255)
+_BLUE = _ConstantColor(0, 0, 255, 255)
+_CYAN = _ConstantColor(0, 255, 255, 255)
+_MAGENTA = _ConstantColor(255, 0, 255, 255)
+_YELLOW = _ConstantColor(255, 255, 0, 255)
+_ORANGE = _ConstantColor(255, 128, 0, 255)
+_TRANSPARENT = _ConstantColor(0, 0, 0, 0)
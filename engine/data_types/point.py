@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from math import floor, sqrt
 from typing import TYPE_CHECKING
 
@@ -40,9 +39,13 @@ class Point:
         return self.x == other.x and self.y == other.y
 
     def __add__(self, other: Point) -> Point:
+        if other.__class__ is Point:
+            return Point._from_ints(self._x + other._x, self._y + other._y)
         return Point(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other: Point) -> Point:
+        if other.__class__ is Point:
+            return Point._from_ints(self._x - other._x, self._y - other._y)
         return Point(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other: Point | float) -> Point:
@@ -65,49 +68,79 @@ class Point:
     def y(self) -> int:
         return self._y
 
+    @staticmethod
+    def _from_ints(x: int, y: int) -> Point:
+        """ Create a point from int coordinates, skipping the conversion in `__init__`. """
+        point = Point.__new__(Point)
+        point._x = x
+        point._y = y
+        return point
+
+    # Points are immutable, so the common points are shared instances
+
     @staticmethod
     def zero() -> Point:
-        return Point(0, 0)
+        return _ZERO
 
     @staticmethod
     def one() -> Point:
-        return Point(1, 1)
+        return _ONE
 
     @staticmethod
     def up() -> Point:
-        return Point(0, -1)
+        return _UP
 
     @staticmethod
     def down() -> Point:
-        return Point(0, 1)
+        return _DOWN
 
     @staticmethod
     def left() -> Point:
-        return Point(-1, 0)
+        return _LEFT
 
     @staticmethod
     def right() -> Point:
-        return Point(1, 0)
+        return _RIGHT
 
     @staticmethod
     def distance(a: Point, b: Point) -> int:
         """ Return the distance between 2 points. """
-        p = b - a
-        return round(sqrt(p.x * p.x + p.y * p.y))
+        dx = b.x - a.x
+        dy = b.y - a.y
+        return round(sqrt(dx * dx + dy * dy))
 
     @staticmethod
     def distance_f(a: Point, b: Point) -> float:
         """ Return the distance between 2 points. """
-        p = b - a
-        return sqrt(p.x * p.x + p.y * p.y)
+        dx = b.x - a.x
+        dy = b.y - a.y
+        return sqrt(dx * dx + dy * dy)
+
+    def offset(self, x: int, y: int) -> Point:
+        """ Return a copy of the point, offset by an amount.
+        This is the same as `point + Point(x, y)`, without creating the intermediate point.
+        """
+        return Point(self._x + x, self._y + y)
+
+    def add_tuple(self, other: Point | tuple[int, int]) -> tuple[int, int]:
+        """ Add another point (or tuple), and return the result as a tuple. """
+        if other.__class__ is Point:
+            return self._x + other._x, self._y + other._y
+        return self._x + other[0], self._y + other[1]
+
+    def sub_tuple(self, other: Point | tuple[int, int]) -> tuple[int, int]:
+        """ Subtract another point (or tuple), and return the result as a tuple. """
+        if other.__class__ is Point:
+            return self._x - other._x, self._y - other._y
+        return self._x - other[0], self._y - other[1]
 
     def copy(self) -> Point:
         """ Return a copy of the point. """
-        return deepcopy(self)
+        return Point._from_ints(self._x, self._y)
 
     def to_tuple(self) -> tuple[int, int]:
         """ Return a copy of the point as a tuple. """
-        return self.x, self.y
+        return self._x, self._y
 
     def to_vector2(self) -> Vector2:
         """ Return a copy of this point as a Vector2. """
@@ -115,8 +148,14 @@ class Point:
         return Vector2(self.x, self.y)
 
     def to_sdl_point(self) -> sdl2.SDL_Point:
-        """ Return a copy of the point as an SDL_Point. """
-        return sdl2.SDL_Point(self.x, self.y)
+        """ Return the point as an SDL_Point.
+        Points are immutable, so the SDL_Point is created once and cached; it must not be modified.
+        """
+        try:
+            return self._sdl_point
+        except AttributeError:
+            self._sdl_point = sdl2.SDL_Point(self._x, self._y)
+            return self._sdl_point
 
     def distance_to(self, other: Point) -> int:
         """ Return the distance to another point. """
@@ -131,3 +170,11 @@ class Point:
         Renderer.set_render_draw_blend_mode(BlendMode.BLEND)
         Renderer.draw_point(camera.world_to_render_position(self), color)
         Renderer.clear_render_draw_blend_mode()
+
+
+_ZERO = Point(0, 0)
+_ONE = Point(1, 1)
+_UP = Point(0, -1)
+_DOWN = Point(0, 1)
+_LEFT = Point(-1, 0)
+_RIGHT = Point(1, 0)
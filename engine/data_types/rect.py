@@ -57,51 +57,61 @@ class Rect:
 
     def top(self) -> int:
         """ The Y position of the top edge of the rectangle. """
-        return self.y
+        return self._y
 
     def bottom(self) -> int:
         """ The Y position of the bottom edge of the rectangle. """
-        return self.y + self.height - 1
+        return self._y + self._height - 1
 
     def left(self) -> int:
         """ The X position of the left edge of the rectangle. """
-        return self.x
+        return self._x
 
     def right(self) -> int:
         """ The X position of the right edge of the rectangle. """
-        return self.x + self.width - 1
+        return self._x + self._width - 1
 
     def position(self) -> Point:
         """ The position of the top-left corner of the rectangle. """
-        return Point(self.x, self.y)
+        return Point(self._x, self._y)
 
     def size(self) -> Point:
         """ The width and height of the rectangle. """
-        return Point(self.width, self.height)
+        return Point(self._width, self._height)
 
     def center(self) -> Point:
         """ The center point of the rectangle. """
-        return self.position() + (self.size() / 2)
+        return Point(*self.center_tuple())
+
+    def center_tuple(self) -> tuple[int, int]:
+        """ The center point of the rectangle, as a tuple. """
+        return self._x + self._width // 2, self._y + self._height // 2
 
     def top_left(self) -> Point:
         """ The top-left corner of the rectangle. """
-        return Point(self.left(), self.top())
+        return Point(self._x, self._y)
 
     def top_right(self) -> Point:
         """ The top-right corner of the rectangle. """
-        return Point(self.right(), self.top())
+        return Point(self._x + self._width - 1, self._y)
 
     def bottom_left(self) -> Point:
         """ The bottom-left corner of the rectangle. """
-        return Point(self.left(), self.bottom())
+        return Point(self._x, self._y + self._height - 1)
 
     def bottom_right(self) -> Point:
         """ The bottom-right corner of the rectangle. """
-        return Point(self.right(), self.bottom())
+        return Point(self._x + self._width - 1, self._y + self._height - 1)
 
     def contains_point(self, point: Point) -> bool:
         """ Check if a point is inside the rectangle. """
-        return self.left() <= point.x <= self.right() and self.top() <= point.y <= self.bottom()
+        x = self._x
+        y = self._y
+        return x <= point.x <= x + self._width - 1 and y <= point.y <= y + self._height - 1
+
+    def contains_xy(self, x: int, y: int) -> bool:
+        """ Check if a point, given as X and Y coordinates, is inside the rectangle. """
+        return self._x <= x <= self._x + self._width - 1 and self._y <= y <= self._y + self._height - 1
 
     def intersects_rect(self, other: Rect) -> bool:
         """ Check if this rectangle intersects another. """
@@ -111,9 +121,19 @@ class Rect:
         """ Check if this rectangle intersects a circle. """
         return geometry_utils.rect_intersects_circle(self, circle)
 
+    def to_tuple(self) -> tuple[int, int, int, int]:
+        """ Return a copy of the rect as a tuple. """
+        return self._x, self._y, self._width, self._height
+
     def to_sdl_rect(self) -> sdl2.SDL_Rect:
-        """ Return a copy of the rect as an SDL_Rect. """
-        return sdl2.SDL_Rect(self.x, self.y, self.width, self.height)
+        """ Return the rect as an SDL_Rect.
+        Rects are immutable, so the SDL_Rect is created once and cached; it must not be modified.
+        """
+        try:
+            return self._sdl_rect
+        except AttributeError:
+            self._sdl_rect = sdl2.SDL_Rect(self._x, self._y, self._width, self._height)
+            return self._sdl_rect
 
     def draw(self, camera: Camera, color: Color, solid: bool = False) -> None:
         """ Draw the rectangle. """
@@ -10,6 +10,8 @@ from engine.data_types.color import Color
 from engine.event_manager import EventManager
 from engine.game import Game
 from engine.input_manager import InputManager
+from engine.internal_utilities.render_stats import RenderStats
+from engine.internal_utilities.texture_registry import TextureRegistry
 from engine.keyboard import Keyboard
 from engine.log import Log
 from engine.renderer import Renderer
@@ -198,6 +200,14 @@ class Engine:
         """
         return cls._draw_time_summary
 
+    @classmethod
+    def render_stats(cls) -> RenderStats:
+        """ The renderer's statistics for the last frame: draw calls, render target switches, texture mod changes,
+        primitives, estimated pixels filled, and textures created and destroyed.
+        Each camera's share is available from `Camera.render_stats()`.
+        """
+        return Renderer.frame_stats()
+
     @classmethod
     def start(cls, first_scene: Scene) -> None:
         """ Starts the main game loop. """
@@ -316,11 +326,20 @@ class Engine:
             Log.debug(f"Unloading {cls._scene}")
             cls._scene.entities.end()
             cls._scene.end()
+            cls._scene.cameras.end()
+            ended = True
+        else:
+            ended = False
 
         cls._scene = cls._next_scene
 
+        # Look for textures that the ended scene left behind, once the engine no longer references it
+        if __debug__ and ended:
+            TextureRegistry.end_scene()
+
         if cls._scene:
             Log.debug(f"Loading {cls._scene}")
+            TextureRegistry.begin_scene(str(cls._scene))
             cls._scene.on_load()
             cls._scene.start()
 
@@ -392,5 +411,21 @@ class Engine:
         # Frame time
         frame_time = f"{update_time + draw_time:2d} ms"
 
+        # Entities drawn and culled by the scene's cameras in the last frame
+        drawn = 0
+        culled = 0
+        if cls._scene:
+            for camera in cls._scene.cameras.active_cameras():
+                drawn += camera.drawn_entity_count()
+                culled += camera.culled_entity_count()
+        entities = f"{drawn} drawn {culled} culled"
+
+        # Renderer work in the last frame
+        stats = Renderer.frame_stats()
+        draw_calls = f"{stats.draw_calls} draw calls {stats.target_switches} targets"
+
+        # Textures
+        textures = TextureRegistry.summary()
+
         # Log metrics
-        Log.debug(f"{fps} {bar_graph} {frame_time}")
+        Log.debug(f"{fps} {bar_graph} {frame_time} | {entities} | {draw_calls} | {textures}")
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import weakref
+from typing import Optional, TYPE_CHECKING
+
+from engine.content_types.texture import Texture
+from engine.data_types.blend_mode import BlendMode
+from engine.data_types.point import Point
+from engine.data_types.rect import Rect
+from engine.entity import Entity
+from engine.internal_utilities.render_target_pool import RenderTargetPool
+from engine.log import Log
+from engine.renderer import Renderer
+
+if TYPE_CHECKING:
+    from engine.camera import Camera
+
+
+class LayerCache:
+    """ The cached texture of a layer, for the cameras that share one set of tag filters. """
+    __slots__ = ("texture", "origin", "bounds", "cache_key")
+
+    def __init__(self) -> None:
+        # The cached texture, and the world position of its top-left corner
+        self.texture: Optional[Texture] = None
+        self.origin = Point.zero()
+        self.bounds = Rect.empty()
+
+        # The members, their z-depths and their cache keys when they were last drawn
+        self.cache_key: Optional[tuple] = None
+
+    def release_texture(self) -> None:
+        """ Return the cached texture to the render target pool. """
+        if self.texture is not None:
+            RenderTargetPool.release(self.texture)
+            self.texture = None
+            self.cache_key = None
+
+
+class CachedLayerEntity(Entity):
+    """ An entity that draws a group of static entities into a cached texture.
+
+    The members are drawn into the texture once, and the texture is copied to the camera each frame. The members are
+    only drawn again when one of them is invalidated; that is, when it moves, is activated or deactivated, when its
+    z-depth changes, or when its `draw_cache_key()` changes (for example, when its sprite, tint or opacity changes).
+
+    Members must still be added to the scene for their update loop, but they are no longer drawn in the draw loop.
+    The layer is drawn at its own z-depth, and its members are drawn in z-depth order inside of it. Members should only
+    draw to the default render pass.
+
+    Each camera only draws the members that pass its tag filters, so the layer keeps one texture for each set of tag
+    filters that it is drawn with.
+    """
+
+    # Layers with cached textures, so that the textures can be re-drawn when the render targets are reset
+    _cached_layers: weakref.WeakSet[CachedLayerEntity] = weakref.WeakSet()
+    _reset_callback_added = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._members: list[Entity] = []
+
+        # Cached textures, by the tag filters of the cameras that draw them (see `Camera.tag_filter_key()`)
+        self._caches: dict[tuple[frozenset[str], frozenset[str]], LayerCache] = {}
+
+        # The bounds are only known after the members are drawn, so a moved member could be culled along with the layer
+        self._cullable = False
+
+    def __del__(self) -> None:
+        self._release_textures()
+
+    @property
+    def members(self) -> list[Entity]:
+        """ The entities that are drawn by the layer. """
+        return self._members
+
+    def add(self, entity: Entity) -> None:
+        """ Add an entity to the layer. """
+        if entity.cached_layer is self:
+            return
+
+        if entity.cached_layer is not None:
+            Log.error(f"{entity} already belongs to {entity.cached_layer}")
+            return
+
+        entity._cached_layer = self
+        self._members.append(entity)
+
+    def remove(self, entity: Entity) -> None:
+        """ Remove an entity from the layer. """
+        if entity.cached_layer is not self:
+            return
+
+        entity._cached_layer = None
+        self._members.remove(entity)
+
+    @classmethod
+    def _on_renderer_reset(cls) -> None:
+        """ Re-draw the cached textures, since their contents are lost when the render targets are reset. """
+        for layer in cls._cached_layers:
+            layer.invalidate()
+
+    def invalidate(self) -> None:
+        """ Draw the members again the next time that the layer is drawn. """
+        for cache in self._caches.values():
+            cache.cache_key = None
+
+    def draw_bounds(self) -> Rect:
+        # The union of the bounds of every cached texture
+        bounds = [cache.bounds for cache in self._caches.values() if cache.texture is not None]
+        if not bounds:
+            return Rect.empty()
+
+        left = min(b.x for b in bounds)
+        top = min(b.y for b in bounds)
+        right = max(b.x + b.width for b in bounds)
+        bottom = max(b.y + b.height for b in bounds)
+        return Rect(left, top, right - left, bottom - top)
+
+    def end(self) -> None:
+        self._release_textures()
+
+    def draw(self, camera: Camera) -> None:
+        # Only members that are in the layer's scene, and that pass the camera's tag filters, are drawn
+        members = [
+            e for e in self._members
+            if e.active and e.scene is self.scene and camera.can_draw_entity(e)
+        ]
+
+        filter_key = camera.tag_filter_key()
+        cache = self._caches.get(filter_key)
+        if cache is None:
+            cache = LayerCache()
+            self._caches[filter_key] = cache
+
+        cache_key = tuple((e, e.z_depth, e.draw_cache_key()) for e in members)
+        if cache_key != cache.cache_key or cache.texture is None:
+            self._draw_members(camera, cache, members)
+            cache.cache_key = cache_key
+
+        if cache.texture is None:
+            return
+
+        destination = camera.world_to_render_position(cache.origin)
+        Renderer.copy(
+            texture=cache.texture,
+            source_rect=(0, 0, cache.bounds.width, cache.bounds.height),
+            destination_rect=(destination.x, destination.y, cache.bounds.width, cache.bounds.height),
+            rotation_angle=0,
+            rotation_center=None,
+            flip=0
+        )
+
+    def _draw_members(self, camera: Camera, cache: LayerCache, members: list[Entity]) -> None:
+        """ Draw the members into a cached texture. """
+        # Get the rect that contains all members
+        left = top = right = bottom = None
+        for entity in members:
+            bounds = entity.draw_bounds()
+            if bounds.width <= 0 or bounds.height <= 0:
+                continue
+            left = bounds.x if left is None else min(left, bounds.x)
+            top = bounds.y if top is None else min(top, bounds.y)
+            right = bounds.x + bounds.width if right is None else max(right, bounds.x + bounds.width)
+            bottom = bounds.y + bounds.height if bottom is None else max(bottom, bounds.y + bounds.height)
+
+        if left is None:
+            cache.bounds = Rect.empty()
+            cache.release_texture()
+            return
+
+        cache.bounds = Rect(left, top, right - left, bottom - top)
+        cache.origin = cache.bounds.position()
+
+        # The texture only grows, so that members that move around don't allocate a new texture every frame
+        texture = cache.texture
+        if texture is None or texture.width < cache.bounds.width or texture.height < cache.bounds.height:
+            width = cache.bounds.width if texture is None else max(texture.width, cache.bounds.width)
+            height = cache.bounds.height if texture is None else max(texture.height, cache.bounds.height)
+            cache.release_texture()
+            cache.texture = RenderTargetPool.acquire(width, height)
+            cache.texture.set_blend_mode(BlendMode.ALPHA_COMPOSITE)
+
+        if not CachedLayerEntity._reset_callback_added:
+            Renderer.add_reset_callback(CachedLayerEntity._on_renderer_reset)
+            CachedLayerEntity._reset_callback_added = True
+        CachedLayerEntity._cached_layers.add(self)
+
+        # Members are drawn back to front; the sort is stable, so members at the same z-depth keep the order they were
+        # added in
+        members = sorted(members, key=lambda e: e.z_depth, reverse=True)
+
+        # Move the camera to the layer's origin, so that the members draw relative to the texture
+        camera_position = camera.position()
+        camera.set_position(cache.origin)
+        with Renderer.render_target(cache.texture):
+            Renderer.clear()
+            for entity in members:
+                entity.draw(camera)
+        camera.set_position(camera_position)
+
+    def _release_textures(self) -> None:
+        """ Return the cached textures to the render target pool. """
+        for cache in self._caches.values():
+            cache.release_texture()
+        self._caches.clear()
+        CachedLayerEntity._cached_layers.discard(self)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from engine.data_types.point import Point
+from engine.engine import Engine
+from engine.entity import Entity
+from engine.text import Text
+
+if TYPE_CHECKING:
+    from engine.camera import Camera
+
+
+class RenderStatsOverlayEntity(Entity):
+    """ An entity that shows the engine's frame rate, frame times and renderer statistics in the corner of a camera.
+
+    The text is only rebuilt every few frames, so that the overlay doesn't add much work to the frames it measures. Its
+    own glyphs are counted in the statistics, as one batched geometry call.
+    """
+    def __init__(self, content_path: str, refresh_frames: int = 15) -> None:
+        """ `content_path` is the path to the bitmap font texture file. """
+        super().__init__()
+        self.pausable = False
+
+        # Lower z-depths are drawn in the foreground, so the overlay is drawn on top of the scene
+        self.z_depth = -1000
+
+        # The overlay is drawn relative to the camera, so its bounding box doesn't describe where it is drawn
+        self._cullable = False
+
+        self._text = Text(content_path)
+        self._refresh_frames = refresh_frames
+        self._last_refresh_frame = None
+        self._offset = Point(2, 2)
+
+    @property
+    def refresh_frames(self) -> int:
+        """ The number of frames between updates of the text. """
+        return self._refresh_frames
+
+    @refresh_frames.setter
+    def refresh_frames(self, value: int) -> None:
+        self._refresh_frames = value
+
+    @property
+    def offset(self) -> Point:
+        """ The position of the text, relative to the top-left corner of the camera. """
+        return self._offset
+
+    @offset.setter
+    def offset(self, value: Point) -> None:
+        self._offset = value
+
+    def draw(self, camera: Camera) -> None:
+        frame = Engine.frame()
+        if self._last_refresh_frame is None or frame - self._last_refresh_frame >= self._refresh_frames:
+            self._last_refresh_frame = frame
+            self._refresh_text()
+
+        self._text.draw(camera, camera.render_to_world_position(self._offset))
+
+    def _refresh_text(self) -> None:
+        """ Rebuild the text from the engine's current statistics. """
+        update_time = Engine.update_time_summary()[1]
+        draw_time = Engine.draw_time_summary()[1]
+        lines = [f"{Engine.fps()} FPS {update_time}+{draw_time} ms", *Engine.render_stats().summary()]
+        self._text.text = "\n".join(lines)
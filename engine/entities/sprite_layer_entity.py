@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import weakref
 from math import ceil, floor
 from typing import TYPE_CHECKING
 
+from engine.content_types.texture import Texture
+from engine.data_types.blend_mode import BlendMode
 from engine.data_types.point import Point
 from engine.entity import Entity
+from engine.internal_utilities.render_target_pool import RenderTargetPool
+from engine.renderer import Renderer
 from engine.sprite import Sprite
 
 if TYPE_CHECKING:
@@ -12,14 +17,30 @@ if TYPE_CHECKING:
 
 
 class SpriteLayerEntity(Entity):
-    """ An entity that contains a single non-collidable sprite. """
+    """ An entity that contains a single non-collidable sprite.
+
+    When the sprite is repeated, the tiles that cover a camera are drawn once into a cached texture, and the texture is
+    copied to the camera each frame. Tiles are aligned to multiples of the sprite's size in world space, so when the
+    camera moves, only the position that the texture is copied to changes. The tiles are only drawn again when the
+    sprite would draw differently (see `Sprite.cache_key()`), or when the number of tiles changes.
+    """
+
+    # Layers with cached textures, so that the textures can be re-drawn when the render targets are reset
+    _cached_layers: weakref.WeakSet[SpriteLayerEntity] = weakref.WeakSet()
+    _reset_callback_added = False
+
     def __init__(self) -> None:
         super().__init__()
         self._sprite = Sprite.empty()
         self._repeat_x = False
         self._repeat_y = False
-        self._tile_positions: dict[str, list[Point]] = {}
-        self._cached_camera_positions: dict[str, Point] = {}
+
+        # The cached tile texture of each camera, and the cache key that it was drawn with
+        self._tile_textures: dict[str, Texture] = {}
+        self._tile_cache_keys: dict[str, tuple] = {}
+
+    def __del__(self) -> None:
+        self._release_tile_textures()
 
     @property
     def sprite(self) -> Sprite:
@@ -48,53 +69,110 @@ class SpriteLayerEntity(Entity):
     def repeat_y(self, value: bool) -> None:
         self._repeat_y = value
 
+    @classmethod
+    def _on_renderer_reset(cls) -> None:
+        """ Re-draw the cached textures, since their contents are lost when the render targets are reset. """
+        for layer in cls._cached_layers:
+            layer._tile_cache_keys.clear()
+
+    def end(self) -> None:
+        self._release_tile_textures()
+
     def draw(self, camera: Camera) -> None:
         # Don't draw if there is no sprite set
         if not self.sprite:
             return
 
-        # Cache tile positions if the camera position has changed
-        last_camera_position = self._cached_camera_positions.get(camera.name)
-        if last_camera_position is None or last_camera_position != camera.position():
-            self._cache_tile_positions(camera)
-            self._cached_camera_positions[camera.name] = camera.position()
-
-        # Draw each tile
-        for position in self._tile_positions[camera.name]:
-            self.sprite.draw(camera, position)
+        # A sprite that isn't repeated is a single tile
+        if not self.repeat_x and not self.repeat_y:
+            self.sprite.draw(camera, self.position())
+            return
 
-    def _cache_tile_positions(self, camera: Camera) -> None:
-        """ Calculate and cache a list of positions to draw the sprite at. """
-        self._tile_positions[camera.name] = []
+        tile_width = self.sprite.width()
+        tile_height = self.sprite.height()
+        if tile_width <= 0 or tile_height <= 0:
+            return
 
         # Calculate number of tiles needed on each axis
         if self.repeat_x:
-            x_tiles = ceil(camera.resolution[0] / self.sprite.width()) + 1
+            x_tiles = ceil(camera.resolution[0] / tile_width) + 1
         else:
             x_tiles = 1
 
         if self.repeat_y:
-            y_tiles = ceil(camera.resolution[1] / self.sprite.height()) + 1
+            y_tiles = ceil(camera.resolution[1] / tile_height) + 1
         else:
             y_tiles = 1
 
-        # Use the top-left corner of the camera rect to figure out the starting position for tiles
-        camera_x = floor(camera.rect().left() / self.sprite.width()) * self.sprite.width()
-        camera_y = floor(camera.rect().top() / self.sprite.height()) * self.sprite.height()
-
-        # Calculate the position for each tile
-        for j in range(y_tiles):
-            for i in range(x_tiles):
-                # Get tile position
-                if self.repeat_x:
-                    x = camera_x + self.sprite.width() * i
-                else:
-                    x = self.x
-
-                if self.repeat_y:
-                    y = camera_y + self.sprite.height() * j
-                else:
-                    y = self.y
-
-                # Add to draw position list
-                self._tile_positions[camera.name].append(Point(x, y))
+        # The area that a tile covers, relative to its position
+        tile_bounds = self.sprite.bounds(Point.zero())
+
+        cache_key = (self.sprite.cache_key(), x_tiles, y_tiles)
+        texture = self._tile_textures.get(camera.name)
+        if texture is None or cache_key != self._tile_cache_keys.get(camera.name):
+            texture = self._draw_tiles(camera, x_tiles, y_tiles)
+            self._tile_cache_keys[camera.name] = cache_key
+
+        # Use the top-left corner of the camera rect to figure out the position of the first tile
+        if self.repeat_x:
+            x = floor(camera.rect().left() / tile_width) * tile_width
+        else:
+            x = self.x
+
+        if self.repeat_y:
+            y = floor(camera.rect().top() / tile_height) * tile_height
+        else:
+            y = self.y
+
+        destination = camera.world_to_render_position(Point(x + tile_bounds.x, y + tile_bounds.y))
+        Renderer.copy(
+            texture=texture,
+            source_rect=None,
+            destination_rect=(destination.x, destination.y, texture.width, texture.height),
+            rotation_angle=0,
+            rotation_center=None,
+            flip=0
+        )
+
+    def _draw_tiles(self, camera: Camera, x_tiles: int, y_tiles: int) -> Texture:
+        """ Draw a grid of tiles into the camera's cached texture, and return it. """
+        tile_width = self.sprite.width()
+        tile_height = self.sprite.height()
+        tile_bounds = self.sprite.bounds(Point.zero())
+
+        # The texture covers every tile, which can be larger than the tile size if the sprite has a pivot or rotation
+        width = (x_tiles - 1) * tile_width + tile_bounds.width
+        height = (y_tiles - 1) * tile_height + tile_bounds.height
+
+        texture = self._tile_textures.get(camera.name)
+        if texture is None or texture.width != width or texture.height != height:
+            if texture is not None:
+                RenderTargetPool.release(texture)
+            texture = RenderTargetPool.acquire(width, height)
+            texture.set_blend_mode(BlendMode.ALPHA_COMPOSITE)
+            self._tile_textures[camera.name] = texture
+
+        if not SpriteLayerEntity._reset_callback_added:
+            Renderer.add_reset_callback(SpriteLayerEntity._on_renderer_reset)
+            SpriteLayerEntity._reset_callback_added = True
+        SpriteLayerEntity._cached_layers.add(self)
+
+        # Move the camera so that the first tile's bounds start at the top-left corner of the texture
+        camera_position = camera.position()
+        camera.set_position(tile_bounds.position())
+        with Renderer.render_target(texture):
+            Renderer.clear()
+            for j in range(y_tiles):
+                for i in range(x_tiles):
+                    self.sprite.draw(camera, Point(tile_width * i, tile_height * j))
+        camera.set_position(camera_position)
+
+        return texture
+
+    def _release_tile_textures(self) -> None:
+        """ Return the cached textures to the render target pool. """
+        for texture in self._tile_textures.values():
+            RenderTargetPool.release(texture)
+        self._tile_textures.clear()
+        self._tile_cache_keys.clear()
+        SpriteLayerEntity._cached_layers.discard(self)
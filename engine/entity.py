@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from math import floor
-from typing import Iterator, Optional, TYPE_CHECKING
+from typing import Hashable, Iterator, Optional, TYPE_CHECKING
 
 from ulid import ULID
 
@@ -11,6 +11,7 @@ from engine.mouse import Mouse
 from engine.utilities import pmath
 
 if TYPE_CHECKING:
+    from engine.entities.cached_layer_entity import CachedLayerEntity
     from engine.level import Level
     from engine.scene import Scene
     from engine.camera import Camera
@@ -39,17 +40,25 @@ class Entity:
         # Z depth
         self._z_depth = 0
 
+        # The cached layer that draws this entity (if any)
+        self._cached_layer: Optional[CachedLayerEntity] = None
+
+        # Whether cameras with culling enabled can skip the entity when its draw bounds are off-screen
+        self._cullable = True
+
         # Collision
         self._collisions_enabled = False
         self._mouse_collisions_enabled = False
 
         self._solid = False
+        self._static = False
 
         self._width = 0
         self._height = 0
 
-        self._collisions_this_frame: set[Entity] = set()
-        self._collisions_last_frame: set[Entity] = set()
+        # Incremented whenever the position, size, or collision shape of the entity changes
+        self._collision_version = 0
+
         self._mouse_this_frame = False
         self._mouse_last_frame = False
 
@@ -115,7 +124,10 @@ class Entity:
 
     @x.setter
     def x(self, value: int | float) -> None:
-        self._x = floor(value)
+        x = floor(value)
+        if x != self._x:
+            self._x = x
+            self._on_shape_changed()
 
     @property
     def y(self) -> int:
@@ -124,7 +136,10 @@ class Entity:
 
     @y.setter
     def y(self, value: int | float) -> None:
-        self._y = floor(value)
+        y = floor(value)
+        if y != self._y:
+            self._y = y
+            self._on_shape_changed()
 
     @property
     def z_depth(self) -> int:
@@ -139,6 +154,24 @@ class Entity:
             self.scene.entities.flag_entity_draw_list_needs_sorting()
         self._z_depth = value
 
+    @property
+    def cached_layer(self) -> Optional[CachedLayerEntity]:
+        """ The cached layer that draws this entity.
+        Entities that belong to a cached layer are drawn into the layer's texture, instead of in the draw loop.
+        """
+        return self._cached_layer
+
+    @property
+    def cullable(self) -> bool:
+        """ If True, cameras with culling enabled skip drawing the entity when its `draw_bounds()` are off-screen.
+        Entities with empty draw bounds are never culled.
+        """
+        return self._cullable
+
+    @cullable.setter
+    def cullable(self, value: bool) -> None:
+        self._cullable = value
+
     @property
     def collisions_enabled(self) -> bool:
         """ If true, the entity will be checked for collisions against other entities. """
@@ -147,6 +180,8 @@ class Entity:
     @collisions_enabled.setter
     def collisions_enabled(self, value: bool) -> None:
         self._collisions_enabled = value
+        if self._static and self.scene:
+            self.scene.entities.flag_static_colliders_need_rebuild()
 
     @property
     def mouse_collisions_enabled(self) -> bool:
@@ -166,6 +201,20 @@ class Entity:
     def solid(self, value: bool) -> None:
         self._solid = value
 
+    @property
+    def static(self) -> bool:
+        """ If True, the entity is a static collider.
+        Static colliders are baked into the scene's static collider index, which is much faster to query than testing
+        every entity. They are not expected to move on their own; moving them with `Level.move` rebuilds the index.
+        """
+        return self._static
+
+    @static.setter
+    def static(self, value: bool) -> None:
+        self._static = value
+        if self.scene:
+            self.scene.entities.flag_static_colliders_need_rebuild()
+
     @property
     def width(self) -> int:
         """ The width of the entity (for collision). """
@@ -174,6 +223,7 @@ class Entity:
     @width.setter
     def width(self, value: int | float) -> None:
         self._width = floor(value)
+        self._on_shape_changed()
 
     @property
     def height(self) -> int:
@@ -183,6 +233,7 @@ class Entity:
     @height.setter
     def height(self, value: int | float) -> None:
         self._height = floor(value)
+        self._on_shape_changed()
 
     def position(self) -> Point:
         """ The position of the entity. """
@@ -197,6 +248,28 @@ class Entity:
         """ Get the bounding box of the entity. """
         return Rect(self.x, self.y, self.width, self.height)
 
+    def draw_bounds(self) -> Rect:
+        """ Get the world-space rect that the entity draws to.
+        Default behavior is to use the entity's bounding box. Override this if the entity draws outside of it.
+        """
+        return self.bbox()
+
+    def draw_cache_key(self) -> Hashable:
+        """ A value that changes whenever the entity would draw differently.
+        This is used by cached layers to know when the entity needs to be re-drawn. Default behavior is to use the
+        entity's position; entities that belong to a cached layer should override this to add their sprite's
+        `cache_key()`, and anything else that affects how they are drawn.
+        """
+        return self._x, self._y
+
+    def static_collider_rects(self) -> list[Rect]:
+        """ The rects that are baked into the static collider index if the entity is static.
+        Default behavior is to use the entity's bounding box.
+        Entities that override `intersects` should override this as well, so that every region that `intersects` can
+        report is covered by at least one rect.
+        """
+        return [self.bbox()]
+
     # Main game loop
 
     def awake(self) -> None:
@@ -343,35 +416,17 @@ class Entity:
 
     # Internal methods
 
-    def _collisions_pre_update(self) -> None:
-        """ Reset the collision tracking for this frame. """
-        self._collisions_last_frame = self._collisions_this_frame.copy()
-        self._collisions_this_frame.clear()
+    def _on_shape_changed(self) -> None:
+        """ Called when the position or size of the entity changes. """
+        self._collision_version += 1
+        if self._scene:
+            self._scene.entities.flag_entity_moved(self)
 
     def _mouse_pre_update(self) -> None:
         """ Reset the mouse tracking for this frame. """
         self._mouse_last_frame = self._mouse_this_frame
         self._mouse_this_frame = False
 
-    def _collisions_post_update(self) -> None:
-        """ Handle persistent collisions.
-
-        If an entity was collided with last frame and this frame, we call 'on_collision_stay'.
-        Because we normally only update collisions during movement, we first need to double-check the collision against
-        anything that was in the collision list in the last frame, so that we don't miss anything.
-
-        Once we've ruled out the persistent collisions, then we can safely call 'on_collision_end'.
-        """
-        for entity in self._collisions_last_frame - self._collisions_this_frame:
-            if self._check_collision_at(self.x, self.y, entity):
-                self._collisions_this_frame.add(entity)
-
-        for entity in self._collisions_last_frame:
-            if entity in self._collisions_this_frame:
-                self.on_collision_stay(entity)
-            else:
-                self.on_collision_end(entity)
-
     def _mouse_post_update(self) -> None:
         """ Check for mouse collision, for each camera that can draw this entity. """
         # Check collisions with each active camera
@@ -394,9 +449,9 @@ class Entity:
         This returns True if at least one collision is invoked.
         """
         collision_invoked = False
+        verified = x == self.x and y == self.y
         for entity in self._get_solid_collisions(x, y):
-            self._register_collision(entity)
-            entity._register_collision(self)
+            self.scene.contacts.register(self, entity, verified)
             collision_invoked = True
 
         return collision_invoked
@@ -406,16 +461,16 @@ class Entity:
         This returns True if at least one collision is invoked.
         """
         collision_invoked = False
+        verified = x == self.x and y == self.y
         for entity in self._get_non_solid_collisions(x, y):
-            self._register_collision(entity)
-            entity._register_collision(self)
+            self.scene.contacts.register(self, entity, verified)
             collision_invoked = True
 
         return collision_invoked
 
     def _get_solid_collisions(self, x: int, y: int) -> Iterator[Entity]:
         """ Get a list of solid entities that the actor would collide with at a given position. """
-        for entity in self.scene.entities.active_entities():
+        for entity in self.scene.entities.collision_candidates(Rect(x, y, self.width, self.height)):
             if entity == self:
                 continue
             if not entity.solid:
@@ -425,7 +480,7 @@ class Entity:
 
     def _get_non_solid_collisions(self, x: int, y: int) -> Iterator[Entity]:
         """ Get a list of non-solid entities that the actor would collide with at a given position. """
-        for entity in self.scene.entities.active_entities():
+        for entity in self.scene.entities.collision_candidates(Rect(x, y, self.width, self.height)):
             if entity == self:
                 continue
             if entity.solid:
@@ -443,15 +498,3 @@ class Entity:
 
         bbox = Rect(x, y, self.width, self.height)
         return other.intersects(bbox)
-
-    def _register_collision(self, other: Entity) -> None:
-        """ Registers a collision between this entity and another entity. """
-        # If we have already handled a collision against a specific entity this frame, prevent it from being run again
-        if other in self._collisions_this_frame:
-            return
-
-        self._collisions_this_frame.add(other)
-
-        # Check to see if this is the first frame of collision
-        if other not in self._collisions_last_frame:
-            self.on_collision_begin(other)
@@ -48,7 +48,7 @@ class EventManager:
         """ Handle any window event. """
         match event.window.event:
             case sdl2.SDL_WINDOWEVENT_RESIZED:
-                Window.on_window_resized()
+                Window.queue_resize()
             case sdl2.SDL_WINDOWEVENT_ENTER:
                 InputManager.register_mouse_enter_window()
             case sdl2.SDL_WINDOWEVENT_LEAVE:
@@ -118,3 +118,8 @@ class CameraList:
         """ Sort the camera list based on the draw order. """
         self._camera_list.sort(key=lambda c: c.draw_order, reverse=True)
         self._needs_sorting = False
+
+    def end(self) -> None:
+        """ Called when the scene ends. """
+        for camera in self:
+            camera.end()
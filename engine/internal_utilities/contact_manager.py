@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from typing import Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from engine.entity import Entity
+    from engine.scene import Scene
+
+
+class ContactManager:
+    """ Tracks the collisions (contacts) between pairs of entities in a scene.
+
+    Each pair of colliding entities is stored once, along with the collision versions of both entities at the time the
+    contact was last verified. The begin / stay / end callbacks are dispatched from here.
+
+    Because collisions are normally only registered during movement, contacts that were not registered this frame are
+    re-verified at the end of the frame. If neither entity has moved or changed shape since the contact was last
+    verified, the contact is still valid, and no collision test is needed.
+
+    If a contact ends while only one of its entities is paused, the contact is removed, and the paused entity's
+    'on_collision_end' is dispatched on the first frame that it is no longer paused.
+    """
+    def __init__(self, scene: Scene) -> None:
+        self._scene = scene
+
+        # Contacts, mapped to the collision versions of each entity when the contact was last verified
+        # A version of -1 means that the contact has not been verified at the entity's current position
+        self._contacts: dict[tuple[Entity, Entity], list[int]] = {}
+
+        # Contacts that began this frame, and contacts that have been registered this frame
+        self._began_this_frame: set[tuple[Entity, Entity]] = set()
+        self._registered_this_frame: set[tuple[Entity, Entity]] = set()
+
+        # Paused entities, mapped to the entities that they stopped touching while they were paused
+        self._pending_ends: dict[Entity, list[Entity]] = {}
+
+    def __str__(self) -> str:
+        return f"ContactManager({len(self)} contacts)"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        return len(self._contacts)
+
+    def __iter__(self) -> Iterator[tuple[Entity, Entity]]:
+        for pair in self._contacts:
+            yield pair
+
+    @staticmethod
+    def _key(a: Entity, b: Entity) -> tuple[Entity, Entity]:
+        """ Get the key for a pair of entities, which is the same regardless of their order. """
+        if id(a) < id(b):
+            return a, b
+        else:
+            return b, a
+
+    def is_touching(self, a: Entity, b: Entity) -> bool:
+        """ Check if there is a contact between two entities. """
+        return self._key(a, b) in self._contacts
+
+    def contacts(self, entity: Entity) -> Iterator[Entity]:
+        """ Iterate over the entities that an entity is in contact with. """
+        for a, b in self._contacts:
+            if a is entity:
+                yield b
+            elif b is entity:
+                yield a
+
+    def register(self, a: Entity, b: Entity, verified: bool) -> None:
+        """ Register a collision between two entities.
+        `verified` should be True if the collision was detected at the current position of both entities.
+        """
+        key = self._key(a, b)
+
+        # If we have already handled a collision between these entities this frame, prevent it from being run again
+        if key in self._registered_this_frame:
+            return
+
+        self._registered_this_frame.add(key)
+
+        if verified:
+            versions = [key[0]._collision_version, key[1]._collision_version]  # noqa
+        else:
+            versions = [-1, -1]
+
+        # Check to see if this is the first frame of collision
+        if key not in self._contacts:
+            self._contacts[key] = versions
+            self._began_this_frame.add(key)
+
+            # An entity that hasn't been sent the end of the previous contact yet is still touching, from its side
+            if not self._cancel_pending_end(a, b):
+                a.on_collision_begin(b)
+            if not self._cancel_pending_end(b, a):
+                b.on_collision_begin(a)
+        else:
+            self._contacts[key] = versions
+
+    def pre_update(self) -> None:
+        """ Reset the collision tracking for this frame. """
+        self._began_this_frame.clear()
+        self._registered_this_frame.clear()
+
+    def post_update(self) -> None:
+        """ Handle persistent collisions.
+
+        If a contact existed last frame and still exists this frame, we call 'on_collision_stay' on both entities.
+        Contacts that weren't registered this frame are re-verified first, so that we don't miss anything.
+
+        Once we've ruled out the persistent collisions, then we can safely call 'on_collision_end'.
+        """
+        paused = self._scene.paused
+        ended = []
+
+        # Ends of contacts that were removed while the entity was paused
+        for entity, others in list(self._pending_ends.items()):
+            if paused and entity.pausable:
+                continue
+            del self._pending_ends[entity]
+            for other in others:
+                entity.on_collision_end(other)
+
+        for key, versions in list(self._contacts.items()):
+            if key in self._began_this_frame:
+                continue
+
+            a, b = key
+            a_paused = paused and a.pausable
+            b_paused = paused and b.pausable
+            if a_paused and b_paused:
+                continue
+
+            if key not in self._registered_this_frame and not self._verify(a, b, versions):
+                ended.append(key)
+                continue
+
+            if not a_paused:
+                a.on_collision_stay(b)
+            if not b_paused:
+                b.on_collision_stay(a)
+
+        for key in ended:
+            del self._contacts[key]
+            a, b = key
+            if paused and a.pausable:
+                self._pending_ends.setdefault(a, []).append(b)
+            else:
+                a.on_collision_end(b)
+            if paused and b.pausable:
+                self._pending_ends.setdefault(b, []).append(a)
+            else:
+                b.on_collision_end(a)
+
+    def _cancel_pending_end(self, entity: Entity, other: Entity) -> bool:
+        """ Remove a pending 'on_collision_end' for a pair of entities, and return True if there was one. """
+        others = self._pending_ends.get(entity)
+        if others is None or other not in others:
+            return False
+
+        others.remove(other)
+        if not others:
+            del self._pending_ends[entity]
+        return True
+
+    @staticmethod
+    def _verify(a: Entity, b: Entity, versions: list[int]) -> bool:
+        """ Check if a contact is still valid.
+        The collision test is skipped if neither entity has moved or changed shape since the contact was verified.
+        """
+        if not a.active or not b.active or not a.collisions_enabled or not b.collisions_enabled:
+            return False
+
+        if versions[0] == a._collision_version and versions[1] == b._collision_version:  # noqa
+            return True
+
+        if a._check_collision_at(a.x, a.y, b) or b._check_collision_at(b.x, b.y, a):  # noqa
+            versions[0] = a._collision_version  # noqa
+            versions[1] = b._collision_version  # noqa
+            return True
+
+        return False
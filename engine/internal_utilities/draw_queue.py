@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Callable, KeysView, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from engine.content_types.texture import Texture
+    from engine.renderer import Renderer
+
+
+class DrawCommand:
+    """ The draw calls that one entity made to one render target. """
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[Callable, tuple, dict]] = []
+
+
+class DrawQueue:
+    """ Records renderer draw calls so that they can be executed later, grouped by render target.
+
+    Each entity's draw calls become one command per render target that the entity draws to. When the queue is
+    executed, each target is set once, and its commands are drawn in the order that they were recorded; that is, in the
+    camera's draw order. Neighbouring commands that copy the same texture (and so use the same blend mode) share a
+    sprite batch, because the renderer only flushes a batch when its texture changes.
+
+    The draw calls of a single command are always executed in the order that they were recorded, and targets are
+    executed in the order that they were first drawn to.
+
+    Calls between `Renderer.push_render_target()` and `Renderer.pop_render_target()` draw to a texture that isn't one
+    of the queue's targets (for example, an intermediate light texture). They are recorded as off-screen calls, which
+    are executed in the order that they were recorded, before any target. A texture that an entity renders to is
+    therefore ready before any target's command copies it, as long as it isn't rendered to again in the same frame.
+    """
+    def __init__(self) -> None:
+        # Commands for each target, in the order that the targets were first drawn to
+        self._commands: dict[Texture, list[DrawCommand]] = {}
+
+        # The target that calls are currently recorded for
+        self._target: Optional[Texture] = None
+
+        # The commands of the entity that is currently recorded, by target
+        self._entity_commands: dict[Texture, DrawCommand] = {}
+        self._command: Optional[DrawCommand] = None
+
+        # Calls that render to other textures, and the number of pushed render targets that are being recorded
+        self._offscreen_calls: list[tuple[Callable, tuple, dict]] = []
+        self._offscreen_depth = 0
+
+    def __len__(self) -> int:
+        return sum(len(commands) for commands in self._commands.values())
+
+    @property
+    def target(self) -> Optional[Texture]:
+        """ The render target that calls are currently recorded for. """
+        return self._target
+
+    def targets(self) -> KeysView[Optional[Texture]]:
+        """ The render targets that calls have been recorded for. """
+        return self._commands.keys()
+
+    def set_target(self, target: Optional[Texture]) -> None:
+        """ Set the render target for the calls that are recorded next. """
+        self._target = target
+        self._command = self._entity_commands.get(target)
+
+    def begin_command(self) -> None:
+        """ Start recording the draw calls of a new entity. """
+        self._entity_commands = {}
+        self._command = None
+
+    def begin_offscreen(self) -> None:
+        """ Start recording off-screen calls, when a render target is pushed. """
+        self._offscreen_depth += 1
+
+    def end_offscreen(self) -> None:
+        """ Stop recording off-screen calls, when a render target is popped. """
+        self._offscreen_depth -= 1
+
+    def record(self, function: Callable, args: tuple, kwargs: dict) -> None:
+        """ Record a call to a renderer method. """
+        if self._offscreen_depth:
+            self._offscreen_calls.append((function, args, kwargs))
+            return
+
+        command = self._command
+        if command is None:
+            command = DrawCommand()
+            self._commands.setdefault(self._target, []).append(command)
+            self._entity_commands[self._target] = command
+            self._command = command
+        command.calls.append((function, args, kwargs))
+
+    def execute(self, renderer: type[Renderer]) -> None:
+        """ Execute the recorded commands, and clear the queue.
+        The queue must not be set on the renderer while it is executed. The render target is left set to the last
+        target that was drawn to.
+        """
+        for function, args, kwargs in self._offscreen_calls:
+            function(*args, **kwargs)
+
+        for target, commands in self._commands.items():
+            renderer.set_render_target(target)
+            for command in commands:
+                for function, args, kwargs in command.calls:
+                    function(*args, **kwargs)
+
+        self.clear()
+
+    def clear(self) -> None:
+        """ Clear the queue. """
+        self._commands.clear()
+        self._offscreen_calls.clear()
+        self._offscreen_depth = 0
+        self._target = None
+        self._entity_commands = {}
+        self._command = None
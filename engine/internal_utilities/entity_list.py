@@ -3,9 +3,12 @@ from __future__ import annotations
 from typing import Iterator, Optional, TYPE_CHECKING
 
 from engine.entity import Entity
+from engine.internal_utilities.spatial_hash import SpatialHash
+from engine.internal_utilities.static_collider_index import StaticColliderIndex
 
 if TYPE_CHECKING:
     from engine.camera import Camera
+    from engine.data_types.rect import Rect
     from engine.scene import Scene
 
 
@@ -29,6 +32,13 @@ class EntityList:
         self._entity_draw_list: list[Entity] = []
         self._entity_draw_list_needs_sorting = False
 
+        # Static colliders are baked into an index that is only rebuilt when the set of static colliders changes
+        self._static_collider_index = StaticColliderIndex()
+        self._static_colliders_need_rebuild = False
+
+        # Spatial index of every entity in the list, for scene queries
+        self._spatial_index = SpatialHash()
+
         # Add / remove queue
         self._to_add: list[Entity] = []
         self._to_remove: list[Entity] = []
@@ -95,6 +105,41 @@ class EntityList:
         """ Flag that the entity draw list needs to be sorted. """
         self._entity_draw_list_needs_sorting = True
 
+    def flag_static_colliders_need_rebuild(self) -> None:
+        """ Flag that the static collider index needs to be rebuilt. """
+        self._static_colliders_need_rebuild = True
+
+    def static_colliders(self) -> StaticColliderIndex:
+        """ The index of active static colliders.
+        The index is rebuilt lazily, the first time it is used after the set of static colliders changes.
+        """
+        if self._static_colliders_need_rebuild:
+            self._static_collider_index = StaticColliderIndex(
+                e for e in self._entity_list if e.static and e.active and e.collisions_enabled
+            )
+            self._static_colliders_need_rebuild = False
+
+        return self._static_collider_index
+
+    @property
+    def spatial_index(self) -> SpatialHash:
+        """ The spatial index of every entity in the list. """
+        return self._spatial_index
+
+    def flag_entity_moved(self, entity: Entity) -> None:
+        """ Flag that an entity has moved or changed size, so that it is re-bucketed in the spatial index. """
+        self._spatial_index.mark_dirty(entity)
+
+    def collision_candidates(self, rect: Rect) -> Iterator[Entity]:
+        """ Iterate over the active entities that could collide with a given rect.
+        Static colliders are looked up in the static collider index; dynamic entities are always candidates.
+        """
+        yield from self.static_colliders().query(rect)
+
+        for entity in self._entity_list:
+            if entity.active and not entity.static:
+                yield entity
+
     def get(self, entity_name: str) -> Optional[Entity]:
         """ Get an entity by name. """
         return self._entity_map.get(entity_name)
@@ -112,6 +157,7 @@ class EntityList:
             self._entity_map[entity.name] = entity
             self.set_active(entity)
             entity._scene = self._scene
+            self._spatial_index.insert(entity)
 
         # Remove queued entities
         for entity in self._to_remove:
@@ -120,6 +166,7 @@ class EntityList:
             self._entity_map.pop(entity.name)
             self.set_inactive(entity)
             entity._scene = None
+            self._spatial_index.remove(entity)
 
         # Entity lifecycle methods
         for entity in self._to_add:
@@ -139,6 +186,13 @@ class EntityList:
         for entity in self._to_remove:
             entity.end()
 
+        # Static colliders that were added, removed, activated or deactivated invalidate the static collider index
+        for entity_list in (self._to_add, self._to_remove, self._to_activate, self._to_deactivate):
+            for entity in entity_list:
+                if entity.static:
+                    self.flag_static_colliders_need_rebuild()
+                    break
+
         # Sort
         if self._entity_draw_list_needs_sorting:
             self.sort_draw_list()
@@ -170,10 +224,10 @@ class EntityList:
     def update(self) -> None:
         """ Update loop. """
         # Reset collision information
+        self._scene.contacts.pre_update()
         for entity in self:
             if self._scene.paused and entity.pausable:
                 continue
-            entity._collisions_pre_update()  # noqa
             entity._mouse_pre_update()  # noqa
 
         # Update
@@ -183,25 +237,64 @@ class EntityList:
             entity.update()
 
         # Handle collision callbacks
+        self._scene.contacts.post_update()
         for entity in self:
             if self._scene.paused and entity.pausable:
                 continue
-            entity._collisions_post_update()  # noqa
             entity._mouse_post_update()  # noqa
 
-    def draw(self, camera: Camera) -> None:
-        """ Draw loop. """
+    def draw(self, camera: Camera) -> tuple[int, int]:
+        """ Draw loop.
+        Entities that belong to a cached layer are drawn by the layer. If the camera has culling enabled, entities that
+        are off-screen are skipped. Returns the number of entities that were drawn and culled.
+        """
+        cull_rect = None
+        visible = None
+        if camera.culling:
+            # Entities that draw to their bounding box are looked up in the spatial index, instead of tested one by one
+            cull_rect = camera.cull_rect()
+            visible = set(self._spatial_index.query_rect(cull_rect))
+
+        drawn = 0
+        culled = 0
         for entity in self._entity_draw_list:
-            if entity.active:
+            if entity.active and entity.cached_layer is None:
                 if camera.can_draw_entity(entity):
-                    entity.draw(camera)
+                    if cull_rect is not None and entity.cullable and self._is_culled(entity, cull_rect, visible):
+                        culled += 1
+                        continue
+                    camera.draw_entity(entity)
+                    drawn += 1
+
+        return drawn, culled
+
+    @staticmethod
+    def _is_culled(entity: Entity, cull_rect: Rect, visible: set[Entity]) -> bool:
+        """ Check if an entity's draw bounds are outside of a camera's cull rect.
+        `visible` is the set of entities whose bounding boxes overlap the cull rect.
+        """
+        if type(entity).draw_bounds is Entity.draw_bounds:
+            if entity.width <= 0 or entity.height <= 0:
+                return False
+            return entity not in visible
+
+        bounds = entity.draw_bounds()
+        if bounds.width <= 0 or bounds.height <= 0:
+            return False
+
+        return (
+            bounds.x >= cull_rect.x + cull_rect.width
+            or bounds.x + bounds.width <= cull_rect.x
+            or bounds.y >= cull_rect.y + cull_rect.height
+            or bounds.y + bounds.height <= cull_rect.y
+        )
 
     def debug_draw(self, camera: Camera) -> None:
         """ Debug draw pass. """
         for entity in self._entity_draw_list:
             if entity.active:
                 if camera.can_draw_entity(entity):
-                    entity.debug_draw(camera)
+                    camera.debug_draw_entity(entity)
 
     def end(self) -> None:
         """ Called when the scene ends. """
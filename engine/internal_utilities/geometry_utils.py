@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from math import floor, sqrt
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -9,29 +10,47 @@ if TYPE_CHECKING:
 
 def rect_intersects_rect(a: Rect, b: Rect) -> bool:
     """ Check if two rectangles intersect. """
-    return b.left() <= a.right() and a.left() <= b.right() and b.top() <= a.bottom() and a.top() <= b.bottom()
+    a_x, a_y, a_width, a_height = a.to_tuple()
+    b_x, b_y, b_width, b_height = b.to_tuple()
+    return (
+        b_x <= a_x + a_width - 1 and a_x <= b_x + b_width - 1 and
+        b_y <= a_y + a_height - 1 and a_y <= b_y + b_height - 1
+    )
 
 
 def circle_intersects_circle(a: Circle, b: Circle) -> bool:
     """ Check if two circles intersect. """
-    return a.center().distance_to_f(b.center()) <= a.radius + b.radius
+    dx = floor(b.x) - floor(a.x)
+    dy = floor(b.y) - floor(a.y)
+    return sqrt(dx * dx + dy * dy) <= a.radius + b.radius
 
 
 def rect_intersects_circle(r: Rect, c: Circle) -> bool:
     """ Check if a rectangle intersects a circle.
     Logic and diagram: https://stackoverflow.com/a/43546279
     """
+    x, y, width, height = r.to_tuple()
+    right = x + width - 1
+    bottom = y + height - 1
+    cx = floor(c.x)
+    cy = floor(c.y)
+
     # Check if the center point of the circle is inside the rectangle
-    if r.contains_point(c.center()):
+    if x <= cx <= right and y <= cy <= bottom:
         return True
 
     # Check if any of the rectangle corners are inside the circle
-    if c.contains(r.top_left()) or c.contains(r.top_right()) or c.contains(r.bottom_left()) or c.contains(r.bottom_right()):
-        return True
+    # This matches `Circle.contains`, which compares the rounded distance to the radius
+    for corner_x, corner_y in ((x, y), (right, y), (x, bottom), (right, bottom)):
+        dx = corner_x - cx
+        dy = corner_y - cy
+        if round(sqrt(dx * dx + dy * dy)) <= c.radius:
+            return True
 
     # Check if any of the rectangle edges intersect the circle
-    distance_x = abs(c.x - r.center().x)
-    distance_y = abs(c.y - r.center().y)
+    center_x, center_y = r.center_tuple()
+    distance_x = abs(c.x - center_x)
+    distance_y = abs(c.y - center_y)
     if distance_x <= r.width / 2 and distance_y < r.height / 2 + c.radius:
         return True
     if distance_y <= r.height / 2 and distance_x < r.width / 2 + c.radius:
@@ -39,3 +58,20 @@ def rect_intersects_circle(r: Rect, c: Circle) -> bool:
 
     # If none of the above conditions are met, there is no intersection
     return False
+
+
+def segment_intersects_circle(ax: float, ay: float, bx: float, by: float, cx: float, cy: float, radius: float) -> bool:
+    """ Check if the line segment from (ax, ay) to (bx, by) is within a radius of (cx, cy). """
+    dx = bx - ax
+    dy = by - ay
+    length_squared = dx * dx + dy * dy
+
+    # Find the point on the segment that is nearest to the center
+    if length_squared:
+        t = ((cx - ax) * dx + (cy - ay) * dy) / length_squared
+        t = 0 if t < 0 else 1 if t > 1 else t
+    else:
+        t = 0
+    nearest_x = ax + dx * t - cx
+    nearest_y = ay + dy * t - cy
+    return nearest_x * nearest_x + nearest_y * nearest_y <= radius * radius
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+
+class RenderStats:
+    """ Counters of the work that the renderer sent to SDL, over a frame or while one camera was drawing.
+
+    Draw calls are the calls that submit something to SDL, including clears; they are split into texture copies
+    (`SDL_RenderCopyEx`) and geometry (`SDL_RenderGeometryRaw`, which includes sprite batches). The rest are primitives.
+
+    Primitives are the points, lines, rects, circles and triangles that were drawn. Pixels are estimated from the
+    destination rects of copies, batched sprites, solid rects and clears; outlines, points and untextured geometry
+    aren't counted, so the value is a lower bound that is useful for comparing frames rather than an exact fill rate.
+    """
+    __slots__ = (
+        "draw_calls",
+        "copy_calls",
+        "geometry_calls",
+        "target_switches",
+        "mod_changes",
+        "primitives",
+        "pixels",
+        "textures_created",
+        "textures_destroyed",
+    )
+
+    def __init__(self) -> None:
+        self.draw_calls = 0
+        self.copy_calls = 0
+        self.geometry_calls = 0
+        self.target_switches = 0
+        self.mod_changes = 0
+        self.primitives = 0
+        self.pixels = 0
+        self.textures_created = 0
+        self.textures_destroyed = 0
+
+    def __str__(self) -> str:
+        return (
+            f"RenderStats({self.draw_calls} draw calls ({self.copy_calls} copies, {self.geometry_calls} geometry), "
+            f"{self.target_switches} target switches, {self.mod_changes} mod changes, {self.primitives} primitives, "
+            f"{self.pixels} pixels, {self.textures_created} textures created, {self.textures_destroyed} destroyed)"
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def reset(self) -> None:
+        """ Set every counter to 0. """
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def add(self, other: RenderStats) -> None:
+        """ Add another set of counters to this one. """
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_dict(self) -> dict[str, int]:
+        """ The counters, by name. """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def summary(self) -> list[str]:
+        """ A short description of the counters, as lines of text. """
+        return [
+            f"{self.draw_calls} draws: {self.copy_calls} copy {self.geometry_calls} geo",
+            f"{self.target_switches} targets {self.mod_changes} mods",
+            f"{self.primitives} prims {self.pixels / 1000:.1f}k px",
+            f"textures +{self.textures_created} -{self.textures_destroyed}",
+        ]
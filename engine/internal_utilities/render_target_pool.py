@@ -0,0 +1,98 @@
+import sdl2
+
+from engine.content_types.texture import Texture
+from engine.internal_utilities.texture_registry import TextureRegistry
+
+
+class RenderTargetPool:
+    """ A shared pool of textures, keyed by size, pixel format and access.
+
+    Objects that need a render target texture acquire one from the pool, and release it when they no longer need it
+    (for example, when they are resized or destroyed). Released textures are kept, and handed out again to the next
+    object that asks for the same size, format and access, so that render targets aren't created and destroyed
+    repeatedly.
+
+    A texture must not be shared while it is acquired; if two objects render to the same texture in a frame, the draw
+    queue can't keep their results apart.
+    """
+    _free: dict[tuple[int, int, int, int], list[Texture]] = {}
+
+    # The number of acquired textures, and the highest it has been
+    _live_count = 0
+    _peak_count = 0
+
+    # Allocation counters
+    _created_count = 0
+    _reused_count = 0
+    _destroyed_count = 0
+
+    @classmethod
+    def acquire(cls,
+                width: int,
+                height: int,
+                pixel_format: int = sdl2.SDL_PIXELFORMAT_RGBA8888,
+                access: int = sdl2.SDL_TEXTUREACCESS_TARGET
+                ) -> Texture:
+        """ Get a texture of a given size, pixel format and access; by default, an RGBA render target.
+        The texture's contents, blend mode and scale mode are not reset, so they should be set by the caller.
+        """
+        free = cls._free.get((width, height, pixel_format, access))
+        if free:
+            texture = free.pop()
+            TextureRegistry.claim(texture)
+            cls._reused_count += 1
+        else:
+            texture = Texture._create_new(width, height, access, pixel_format)  # noqa
+            cls._created_count += 1
+
+        cls._live_count += 1
+        cls._peak_count = max(cls._peak_count, cls._live_count)
+        return texture
+
+    @classmethod
+    def release(cls, texture: Texture) -> None:
+        """ Return a texture to the pool. """
+        texture.set_color_mod(255, 255, 255)
+        texture.set_alpha_mod(255)
+        texture.set_render_scale(1.0)
+        TextureRegistry.retain(texture)
+
+        key = (texture.width, texture.height, texture.pixel_format, texture.access)
+        cls._free.setdefault(key, []).append(texture)
+        cls._live_count -= 1
+
+    @classmethod
+    def clear(cls) -> None:
+        """ Destroy the textures that are in the pool and not currently acquired. """
+        cls._destroyed_count += cls.free_count()
+        cls._free.clear()
+
+    @classmethod
+    def live_count(cls) -> int:
+        """ The number of textures that are currently acquired. """
+        return cls._live_count
+
+    @classmethod
+    def peak_count(cls) -> int:
+        """ The highest number of textures that have been acquired at the same time. """
+        return cls._peak_count
+
+    @classmethod
+    def free_count(cls) -> int:
+        """ The number of textures in the pool that are ready to be acquired. """
+        return sum(len(textures) for textures in cls._free.values())
+
+    @classmethod
+    def created_count(cls) -> int:
+        """ The number of textures that the pool has created, because no matching texture was free. """
+        return cls._created_count
+
+    @classmethod
+    def reused_count(cls) -> int:
+        """ The number of times that a released texture was acquired again, instead of creating a new one. """
+        return cls._reused_count
+
+    @classmethod
+    def destroyed_count(cls) -> int:
+        """ The number of free textures that were destroyed by clearing the pool. """
+        return cls._destroyed_count
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from math import floor
+from typing import Iterable, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from engine.data_types.line import Line
+    from engine.data_types.point import Point
+
+
+class ShadowCasterIndex:
+    """ An immutable acceleration structure for shadow-casting line segments.
+
+    Segments are bucketed into a uniform grid when the index is built, so that a light only has to look at the segments
+    near it, rather than every segment in the level.
+
+    The index is never modified after it is built; when the segments change, a new index is built.
+    """
+    def __init__(self, lines: Iterable[Line] = (), cell_size: int = 64) -> None:
+        self._cell_size = cell_size
+        self._lines: list[Line] = []
+        self._buckets: dict[tuple[int, int], list[int]] = {}
+
+        for line in lines:
+            self._insert(line)
+
+    def __str__(self) -> str:
+        return f"ShadowCasterIndex({len(self._lines)} lines)"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __iter__(self) -> Iterator[Line]:
+        return iter(self._lines)
+
+    @property
+    def lines(self) -> list[Line]:
+        """ Every segment in the index. """
+        return self._lines
+
+    def _insert(self, line: Line) -> None:
+        """ Add a segment to every bucket that its bounding box overlaps. """
+        index = len(self._lines)
+        self._lines.append(line)
+
+        cell_size = self._cell_size
+        left = floor(min(line.a.x, line.b.x) / cell_size)
+        top = floor(min(line.a.y, line.b.y) / cell_size)
+        right = floor(max(line.a.x, line.b.x) / cell_size)
+        bottom = floor(max(line.a.y, line.b.y) / cell_size)
+        for cy in range(top, bottom + 1):
+            for cx in range(left, right + 1):
+                self._buckets.setdefault((cx, cy), []).append(index)
+
+    def query(self, position: Point, radius: int) -> list[Line]:
+        """ Get the segments in the buckets that a circle overlaps.
+        This is a broad phase; `PointLight` skips the segments that are outside of its radius.
+        """
+        if not self._buckets:
+            return []
+
+        cell_size = self._cell_size
+        left = floor((position.x - radius) / cell_size)
+        top = floor((position.y - radius) / cell_size)
+        right = floor((position.x + radius) / cell_size)
+        bottom = floor((position.y + radius) / cell_size)
+
+        # Segments that span several buckets are only returned once, in the order that they were added
+        found: dict[int, None] = {}
+        for cy in range(top, bottom + 1):
+            for cx in range(left, right + 1):
+                bucket = self._buckets.get((cx, cy))
+                if bucket:
+                    found.update(dict.fromkeys(bucket))
+
+        lines = self._lines
+        return [lines[i] for i in sorted(found)]
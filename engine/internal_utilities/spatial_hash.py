@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from math import floor, inf
+from typing import Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from engine.data_types.rect import Rect
+    from engine.entity import Entity
+
+
+class SpatialHash:
+    """ An incrementally maintained spatial index of entity bounding boxes.
+
+    Entities are bucketed into a uniform grid of cells. When an entity moves or changes size, it is flagged as dirty,
+    and it is re-bucketed the next time the index is queried. Entities that don't move never need to be touched again,
+    so the cost of keeping the index up to date depends on how many entities moved, rather than how many there are.
+
+    Zero-sized bounding boxes still occupy the pixel at their position.
+    """
+    def __init__(self, cell_size: int = 64) -> None:
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], set[Entity]] = {}
+
+        # The bounds (left, top, right, bottom) of each entity, and the range of cells that it was bucketed into
+        self._bounds: dict[Entity, tuple[int, int, int, int]] = {}
+        self._cell_ranges: dict[Entity, tuple[int, int, int, int]] = {}
+
+        # Entities that have moved since they were last bucketed
+        self._dirty: set[Entity] = set()
+
+    def __str__(self) -> str:
+        return f"SpatialHash({len(self)} entities, {len(self._cells)} cells)"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity in self._bounds
+
+    def insert(self, entity: Entity) -> None:
+        """ Add an entity to the index. """
+        if entity in self._bounds:
+            self.mark_dirty(entity)
+            return
+
+        self._bucket(entity)
+
+    def remove(self, entity: Entity) -> None:
+        """ Remove an entity from the index. """
+        if entity not in self._bounds:
+            return
+
+        self._unbucket(entity)
+        del self._bounds[entity]
+        self._dirty.discard(entity)
+
+    def mark_dirty(self, entity: Entity) -> None:
+        """ Flag that an entity has moved or changed size, so that it is re-bucketed before the next query. """
+        if entity in self._bounds:
+            self._dirty.add(entity)
+
+    def bounds(self, entity: Entity) -> tuple[int, int, int, int]:
+        """ Get the bounds (left, top, right, bottom) of an entity, as of the last time it was bucketed. """
+        return self._bounds[entity]
+
+    def flush(self) -> None:
+        """ Re-bucket the entities that have moved. """
+        if not self._dirty:
+            return
+
+        for entity in self._dirty:
+            self._unbucket(entity)
+            self._bucket(entity)
+
+        self._dirty.clear()
+
+    def query(self, left: int, top: int, right: int, bottom: int) -> Iterator[Entity]:
+        """ Iterate over the entities whose bounds overlap a region (inclusive).
+        Each entity is yielded at most once.
+        """
+        self.flush()
+
+        cell_size = self._cell_size
+        found = set()
+        for cy in range(floor(top / cell_size), floor(bottom / cell_size) + 1):
+            for cx in range(floor(left / cell_size), floor(right / cell_size) + 1):
+                cell = self._cells.get((cx, cy))
+                if not cell:
+                    continue
+                for entity in cell:
+                    if entity in found:
+                        continue
+                    found.add(entity)
+                    entity_left, entity_top, entity_right, entity_bottom = self._bounds[entity]
+                    if entity_left <= right and left <= entity_right and entity_top <= bottom and top <= entity_bottom:
+                        yield entity
+
+    def query_rect(self, rect: Rect) -> Iterator[Entity]:
+        """ Iterate over the entities whose bounds overlap a rect. """
+        yield from self.query(rect.x, rect.y, rect.x + max(rect.width, 1) - 1, rect.y + max(rect.height, 1) - 1)
+
+    def query_segment(self, x1: float, y1: float, x2: float, y2: float) -> Iterator[Entity]:
+        """ Iterate over the entities in the cells that a line segment passes through.
+        Cells are visited in order from the start of the segment to the end, so that only the cells along the segment
+        are visited, rather than every cell in its bounding box. This is a broad phase; entities are not tested against
+        the segment itself.
+        """
+        self.flush()
+
+        cell_size = self._cell_size
+        cx = floor(x1 / cell_size)
+        cy = floor(y1 / cell_size)
+        end_cx = floor(x2 / cell_size)
+        end_cy = floor(y2 / cell_size)
+
+        dx = x2 - x1
+        dy = y2 - y1
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+
+        # The distance along the segment (0 to 1) to the next vertical / horizontal cell boundary, and between them
+        if dx:
+            boundary_x = (cx + (1 if dx > 0 else 0)) * cell_size
+            t_max_x = (boundary_x - x1) / dx
+            t_delta_x = cell_size / abs(dx)
+        else:
+            t_max_x = t_delta_x = inf
+        if dy:
+            boundary_y = (cy + (1 if dy > 0 else 0)) * cell_size
+            t_max_y = (boundary_y - y1) / dy
+            t_delta_y = cell_size / abs(dy)
+        else:
+            t_max_y = t_delta_y = inf
+
+        found = set()
+        max_steps = abs(end_cx - cx) + abs(end_cy - cy)
+        for _ in range(max_steps + 1):
+            cell = self._cells.get((cx, cy))
+            if cell:
+                for entity in cell:
+                    if entity not in found:
+                        found.add(entity)
+                        yield entity
+
+            if cx == end_cx and cy == end_cy:
+                break
+
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+
+    def _bucket(self, entity: Entity) -> None:
+        """ Add an entity to every cell that its bounding box overlaps. """
+        left = entity.x
+        top = entity.y
+        right = left + max(entity.width, 1) - 1
+        bottom = top + max(entity.height, 1) - 1
+        self._bounds[entity] = (left, top, right, bottom)
+
+        cell_size = self._cell_size
+        cell_range = (floor(left / cell_size), floor(top / cell_size), floor(right / cell_size), floor(bottom / cell_size))
+        self._cell_ranges[entity] = cell_range
+
+        min_cx, min_cy, max_cx, max_cy = cell_range
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                self._cells.setdefault((cx, cy), set()).add(entity)
+
+    def _unbucket(self, entity: Entity) -> None:
+        """ Remove an entity from every cell that it was bucketed into. """
+        min_cx, min_cy, max_cx, max_cy = self._cell_ranges.pop(entity)
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                cell = self._cells[(cx, cy)]
+                cell.discard(entity)
+                if not cell:
+                    del self._cells[(cx, cy)]
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from array import array
+from ctypes import c_float, c_void_p, cast, POINTER
+from math import cos, radians, sin
+from typing import Optional, TYPE_CHECKING
+
+import sdl2
+
+if TYPE_CHECKING:
+    from engine.content_types.texture import Texture
+    from engine.data_types.point import Point
+    from engine.data_types.rect import Rect
+
+
+class SpriteBatch:
+    """ Accumulates textured quads that share a texture, and draws them with a single SDL_RenderGeometryRaw call.
+
+    Each quad carries its own color and alpha in its vertex colors, so sprites with different tints and opacities can
+    be drawn together without changing the texture's color mod or alpha mod.
+
+    The batch must be flushed before anything else is drawn, so that the draw order is preserved. The renderer does
+    this automatically whenever the texture, blend mode or render target changes, or when something other than a
+    batched quad is drawn.
+    """
+    def __init__(self) -> None:
+        self._texture: Optional[Texture] = None
+        self._quad_count = 0
+
+        # Vertex data
+        self._xy = array('f')
+        self._uv = array('f')
+        self._colors = array('B')
+
+        # Indices for two triangles per quad; this only ever grows
+        self._indices = array('i')
+
+    def __len__(self) -> int:
+        return self._quad_count
+
+    @property
+    def texture(self) -> Optional[Texture]:
+        """ The texture of the quads in the batch. """
+        return self._texture
+
+    def add(self,
+            sdl_renderer: POINTER(sdl2.SDL_Renderer),
+            texture: Texture,
+            source_rect: Optional[Rect],
+            destination_rect: Rect,
+            rotation_angle: float,
+            rotation_center: Optional[Point],
+            flip: int,
+            color: tuple[int, int, int, int],
+            ) -> None:
+        """ Add a quad to the batch.
+        The arguments match `SDL_RenderCopyEx`, and the color is the (r, g, b, a) color of each vertex.
+        If the quad uses a different texture than the current batch, the current batch is flushed first.
+        """
+        if texture is not self._texture:
+            self.flush(sdl_renderer)
+            self._texture = texture
+
+        # Texture coordinates
+        texture_width = texture.width
+        texture_height = texture.height
+        if source_rect:
+            u0 = source_rect.x / texture_width
+            v0 = source_rect.y / texture_height
+            u1 = (source_rect.x + source_rect.width) / texture_width
+            v1 = (source_rect.y + source_rect.height) / texture_height
+        else:
+            u0, v0, u1, v1 = 0.0, 0.0, 1.0, 1.0
+
+        if flip & sdl2.SDL_FLIP_HORIZONTAL:
+            u0, u1 = u1, u0
+        if flip & sdl2.SDL_FLIP_VERTICAL:
+            v0, v1 = v1, v0
+
+        # Vertex positions (top-left, top-right, bottom-right, bottom-left)
+        x, y, w, h = destination_rect.to_tuple()
+        if rotation_angle:
+            if rotation_center:
+                cx = x + rotation_center.x
+                cy = y + rotation_center.y
+            else:
+                cx = x + w / 2
+                cy = y + h / 2
+
+            angle = radians(rotation_angle)
+            c = cos(angle)
+            s = sin(angle)
+            positions = []
+            for px, py in ((x, y), (x + w, y), (x + w, y + h), (x, y + h)):
+                dx = px - cx
+                dy = py - cy
+                positions.append(cx + dx * c - dy * s)
+                positions.append(cy + dx * s + dy * c)
+            self._xy.extend(positions)
+        else:
+            self._xy.extend((x, y, x + w, y, x + w, y + h, x, y + h))
+
+        self._uv.extend((u0, v0, u1, v0, u1, v1, u0, v1))
+        self._colors.extend(color * 4)
+        self._quad_count += 1
+
+    def add_quads(self,
+                  sdl_renderer: POINTER(sdl2.SDL_Renderer),
+                  texture: Texture,
+                  positions: array,
+                  texture_coordinates: array,
+                  colors: array,
+                  ) -> None:
+        """ Add quads that have already been built to the batch.
+        Each quad has four vertices (top-left, top-right, bottom-right, bottom-left); `positions` has 8 floats per quad,
+        `texture_coordinates` has 8 normalized floats per quad, and `colors` has 16 bytes (r, g, b, a) per quad.
+        If the quads use a different texture than the current batch, the current batch is flushed first.
+        """
+        if texture is not self._texture:
+            self.flush(sdl_renderer)
+            self._texture = texture
+
+        self._xy.extend(positions)
+        self._uv.extend(texture_coordinates)
+        self._colors.extend(colors)
+        self._quad_count += len(positions) // 8
+
+    def flush(self, sdl_renderer: POINTER(sdl2.SDL_Renderer)) -> None:
+        """ Draw the quads in the batch, and clear it. """
+        quad_count = self._quad_count
+        if not quad_count:
+            return
+
+        # Grow the index buffer if needed
+        index_count = quad_count * 6
+        if len(self._indices) < index_count:
+            for i in range(len(self._indices) // 6, quad_count * 2):
+                v = i * 4
+                self._indices.extend((v, v + 1, v + 2, v, v + 2, v + 3))
+
+        sdl2.SDL_RenderGeometryRaw(
+            sdl_renderer,
+            self._texture.sdl_texture,
+            cast(c_void_p(self._xy.buffer_info()[0]), POINTER(c_float)), 8,
+            cast(c_void_p(self._colors.buffer_info()[0]), POINTER(sdl2.SDL_Color)), 4,
+            cast(c_void_p(self._uv.buffer_info()[0]), POINTER(c_float)), 8,
+            quad_count * 4,
+            c_void_p(self._indices.buffer_info()[0]), index_count, 4
+        )
+
+        # The software renderer draws axis-aligned quads as copies, by setting the texture's color mod and alpha mod to the
+        # vertex color; it doesn't restore them afterwards
+        self._texture.restore_mods()
+
+        del self._xy[:]
+        del self._uv[:]
+        del self._colors[:]
+        self._quad_count = 0
+        self._texture = None
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from math import floor
+from typing import Iterable, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from engine.data_types.rect import Rect
+    from engine.entity import Entity
+
+
+class StaticColliderIndex:
+    """ An immutable acceleration structure for static colliders.
+
+    Each static collider contributes one or more rects (see `Entity.static_collider_rects`), which are bucketed into a
+    uniform grid when the index is built. Queries only visit the buckets that overlap the query rect, so the cost of a
+    query depends on the amount of nearby geometry rather than the total amount of geometry in the scene.
+
+    The index is never modified after it is built; when the set of static colliders changes, a new index is built.
+    """
+    def __init__(self, entities: Iterable[Entity] = (), cell_size: int = 64) -> None:
+        self._cell_size = cell_size
+        self._buckets: dict[tuple[int, int], list[tuple[int, int, int, int, Entity]]] = {}
+        self._entity_count = 0
+        self._rect_count = 0
+
+        for entity in entities:
+            self._entity_count += 1
+            for rect in entity.static_collider_rects():
+                self._insert(rect, entity)
+
+    def __str__(self) -> str:
+        return f"StaticColliderIndex({self._entity_count} entities, {self._rect_count} rects)"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+        return self._entity_count
+
+    def _insert(self, rect: Rect, entity: Entity) -> None:
+        """ Add a rect to every bucket that it overlaps. """
+        # Zero-sized rects still occupy the pixel at their position
+        left = rect.x
+        top = rect.y
+        right = rect.x + max(rect.width, 1) - 1
+        bottom = rect.y + max(rect.height, 1) - 1
+        entry = (left, top, right, bottom, entity)
+
+        cell_size = self._cell_size
+        for cy in range(floor(top / cell_size), floor(bottom / cell_size) + 1):
+            for cx in range(floor(left / cell_size), floor(right / cell_size) + 1):
+                self._buckets.setdefault((cx, cy), []).append(entry)
+
+        self._rect_count += 1
+
+    def query(self, rect: Rect) -> Iterator[Entity]:
+        """ Iterate over the static colliders that have at least one rect overlapping a given rect.
+        Each entity is yielded at most once.
+        """
+        if not self._buckets:
+            return
+
+        left = rect.x
+        top = rect.y
+        right = rect.x + max(rect.width, 1) - 1
+        bottom = rect.y + max(rect.height, 1) - 1
+
+        cell_size = self._cell_size
+        found = set()
+        for cy in range(floor(top / cell_size), floor(bottom / cell_size) + 1):
+            for cx in range(floor(left / cell_size), floor(right / cell_size) + 1):
+                bucket = self._buckets.get((cx, cy))
+                if not bucket:
+                    continue
+                for entry_left, entry_top, entry_right, entry_bottom, entity in bucket:
+                    if entity in found:
+                        continue
+                    if entry_left <= right and left <= entry_right and entry_top <= bottom and top <= entry_bottom:
+                        found.add(entity)
+                        yield entity
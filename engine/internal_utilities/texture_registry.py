@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import gc
+import os
+import sys
+from typing import Optional, TYPE_CHECKING
+
+import sdl2
+
+from engine.log import Log
+
+if TYPE_CHECKING:
+    from engine.content_types.texture import Texture
+
+
+# Call sites in these files are skipped, so that a texture is attributed to the code that asked for it
+_WRAPPER_FILES = ("texture.py", "render_target_pool.py", "texture_registry.py")
+
+_ACCESS_NAMES = {
+    sdl2.SDL_TEXTUREACCESS_STATIC: "static",
+    sdl2.SDL_TEXTUREACCESS_STREAMING: "streaming",
+    sdl2.SDL_TEXTUREACCESS_TARGET: "target",
+}
+
+
+class TextureRecord:
+    """ The accounting information of one live texture. """
+    __slots__ = ("name", "width", "height", "access", "size", "call_site", "scene", "generation", "retained")
+
+    def __init__(self, texture: Texture, call_site: str, scene: Optional[str], generation: int) -> None:
+        self.name = texture.name
+        self.width = texture.width
+        self.height = texture.height
+        self.access = _ACCESS_NAMES.get(texture.access, str(texture.access))
+
+        # The estimated size of the texture's pixel data, in bytes
+        self.size = texture.width * texture.height * max(sdl2.SDL_BYTESPERPIXEL(texture.pixel_format), 1)
+
+        # The code that created (or last acquired) the texture, and the scene that was running at the time
+        self.call_site = call_site
+        self.scene = scene
+        self.generation = generation
+
+        # Retained textures are expected to outlive the scene that created them (for example, loaded content)
+        self.retained = False
+
+    def __str__(self) -> str:
+        name = f"{self.name}, " if self.name else ""
+        return f"TextureRecord({name}{self.width}x{self.height}, {self.access}, {self.size} bytes, {self.call_site})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class TextureRegistry:
+    """ Tracks every SDL texture that the engine has allocated.
+
+    Each texture registers itself when it is created, and unregisters itself when it is destroyed. The registry keeps
+    live and peak totals, the difference since the current scene started, and a record of each texture's size, access
+    and call site.
+
+    When a scene ends, textures that were created while it was running and are still alive are reported as possible
+    leaks. Textures that are meant to be shared between scenes (loaded content, free render targets in the pool, the
+    window's viewport) are marked as retained, and aren't reported.
+    """
+    _records: dict[int, TextureRecord] = {}
+
+    # Live and peak totals
+    _live_bytes = 0
+    _peak_count = 0
+    _peak_bytes = 0
+
+    # The number of textures that have been created and destroyed since the game started
+    _created_count = 0
+    _destroyed_count = 0
+
+    # The scene that is currently running, and the totals when it started
+    _scene: Optional[str] = None
+    _generation = 0
+    _scene_start_count = 0
+    _scene_start_bytes = 0
+
+    @classmethod
+    def register(cls, texture: Texture) -> None:
+        """ Start tracking a new texture. """
+        record = TextureRecord(texture, cls._call_site(), cls._scene, cls._generation)
+        cls._records[id(texture)] = record
+        cls._live_bytes += record.size
+        cls._created_count += 1
+        cls._peak_count = max(cls._peak_count, len(cls._records))
+        cls._peak_bytes = max(cls._peak_bytes, cls._live_bytes)
+
+    @classmethod
+    def unregister(cls, texture: Texture) -> None:
+        """ Stop tracking a texture that has been destroyed. """
+        record = cls._records.pop(id(texture), None)
+        if record is not None:
+            cls._live_bytes -= record.size
+            cls._destroyed_count += 1
+
+    @classmethod
+    def claim(cls, texture: Texture) -> None:
+        """ Attribute an existing texture to the code that is calling this, in the current scene.
+        This is used when a shared texture is handed out again.
+        """
+        record = cls._records.get(id(texture))
+        if record is not None:
+            record.call_site = cls._call_site()
+            record.scene = cls._scene
+            record.generation = cls._generation
+            record.retained = False
+
+    @classmethod
+    def retain(cls, texture: Texture) -> None:
+        """ Mark a texture as intentionally outliving the scene that created it. """
+        record = cls._records.get(id(texture))
+        if record is not None:
+            record.retained = True
+
+    @classmethod
+    def record(cls, texture: Texture) -> Optional[TextureRecord]:
+        """ Get the record of a texture. """
+        return cls._records.get(id(texture))
+
+    @classmethod
+    def records(cls) -> list[TextureRecord]:
+        """ The records of all live textures, largest first. """
+        return sorted(cls._records.values(), key=lambda r: r.size, reverse=True)
+
+    @classmethod
+    def live_count(cls) -> int:
+        """ The number of live textures. """
+        return len(cls._records)
+
+    @classmethod
+    def live_bytes(cls) -> int:
+        """ The estimated size of all live textures, in bytes. """
+        return cls._live_bytes
+
+    @classmethod
+    def peak_count(cls) -> int:
+        """ The highest number of textures that have been alive at the same time. """
+        return cls._peak_count
+
+    @classmethod
+    def peak_bytes(cls) -> int:
+        """ The highest estimated size of all live textures, in bytes. """
+        return cls._peak_bytes
+
+    @classmethod
+    def created_count(cls) -> int:
+        """ The number of textures that have been created since the game started. """
+        return cls._created_count
+
+    @classmethod
+    def destroyed_count(cls) -> int:
+        """ The number of textures that have been destroyed since the game started. """
+        return cls._destroyed_count
+
+    @classmethod
+    def scene_diff(cls) -> tuple[int, int]:
+        """ The change in the number of live textures, and their size in bytes, since the current scene started. """
+        return len(cls._records) - cls._scene_start_count, cls._live_bytes - cls._scene_start_bytes
+
+    @classmethod
+    def begin_scene(cls, scene: str) -> None:
+        """ Attribute the textures that are created from now on to a new scene. """
+        cls._scene = scene
+        cls._generation += 1
+        cls._scene_start_count = len(cls._records)
+        cls._scene_start_bytes = cls._live_bytes
+
+    @classmethod
+    def end_scene(cls) -> list[TextureRecord]:
+        """ Check for textures that are still alive after the current scene has ended, and log them as warnings.
+        This should be called after the engine has let go of the scene. Returns the records of the leaked textures.
+        """
+        # Entities and scenes often reference each other, so collect them before looking for leaks
+        gc.collect()
+
+        count, size = cls.scene_diff()
+        Log.debug(f"{cls._scene} texture diff: {count:+d} textures ({size / 1024:+.1f} KB)")
+
+        leaked = [r for r in cls._records.values() if r.generation == cls._generation and not r.retained]
+        if leaked:
+            total = sum(r.size for r in leaked)
+            Log.warning(f"{len(leaked)} textures ({total / 1024:.1f} KB) from {cls._scene} are still alive")
+
+            # Group leaks by call site, so that a leak in a loop is only reported once
+            call_sites: dict[str, list[TextureRecord]] = {}
+            for record in leaked:
+                call_sites.setdefault(record.call_site, []).append(record)
+            for call_site, records in call_sites.items():
+                sizes = ", ".join(sorted({f"{r.width}x{r.height}" for r in records}))
+                Log.warning(f"  {len(records)} x {records[0].access} texture ({sizes}) created at {call_site}")
+
+        cls._scene = None
+        return leaked
+
+    @classmethod
+    def summary(cls) -> str:
+        """ A one-line summary of the live and peak totals. """
+        live_mb = cls._live_bytes / (1024 * 1024)
+        peak_mb = cls._peak_bytes / (1024 * 1024)
+        return f"{len(cls._records)} textures {live_mb:.1f} MB (peak {cls._peak_count}, {peak_mb:.1f} MB)"
+
+    @classmethod
+    def dump(cls) -> None:
+        """ Log every live texture, grouped by call site, largest first. """
+        call_sites: dict[str, list[TextureRecord]] = {}
+        for record in cls._records.values():
+            call_sites.setdefault(record.call_site, []).append(record)
+
+        Log.debug(f"Textures: {cls.summary()}")
+        for call_site, records in sorted(call_sites.items(), key=lambda item: -sum(r.size for r in item[1])):
+            total = sum(r.size for r in records)
+            Log.debug(f"  {total / 1024:8.1f} KB  {len(records):4d} x  {call_site}")
+
+    @staticmethod
+    def _call_site() -> str:
+        """ Get the file, line and function of the first caller outside of the texture wrappers. """
+        frame = sys._getframe(2)  # noqa
+        while frame is not None and os.path.basename(frame.f_code.co_filename) in _WRAPPER_FILES:
+            frame = frame.f_back
+        if frame is None:
+            return "<unknown>"
+        return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} in {frame.f_code.co_name}"
@@ -3,6 +3,7 @@ import json
 from typing import Iterator
 
 from engine.content import Content
+from engine.entities.cached_layer_entity import CachedLayerEntity
 from engine.entity import Entity
 from engine.ldtk.ldtk_simplified_int_grid_entity import LDtkSimplifiedIntGridEntity
 from engine.ldtk.ldtk_simplified_tiles_entity import LDtkSimplifiedTilesEntity
@@ -100,6 +101,10 @@ class LDtk:
             id_to_level_map[level_id] = level
             scene.add_level(level)
 
+            # Consecutive tile layers are drawn into a cached layer
+            previous_tiles = None
+            cached_layer = None
+
             # Build layers
             for layer_index, layer_data in enumerate(project_data['defs']['layers']):
                 # Get layer info
@@ -107,6 +112,11 @@ class LDtk:
                 layer_type = layer_data['type']
                 layer_grid_size = layer_data['gridSize']
 
+                # Only tile layers that are next to each other can share a cached layer
+                if layer_type not in ("Tiles", "AutoLayer"):
+                    previous_tiles = None
+                    cached_layer = None
+
                 # IntGrid
                 if layer_type == "IntGrid":
                     # Create entity
@@ -118,8 +128,10 @@ class LDtk:
                     int_grid.grid_size = layer_grid_size
 
                     # Enable collisions
+                    # Level geometry never moves on its own, so it is baked into the static collider index
                     if layer_name.lower() in ("collision", "collisions"):
                         int_grid.solid = True
+                        int_grid.static = True
                         int_grid.collisions_enabled = True
 
                     # Set grid values from csv
@@ -200,6 +212,20 @@ class LDtk:
                     level.add_entity(tiles)
                     scene.entities.add(tiles)
 
+                    # Start a cached layer when there is more than one tile layer in a row
+                    if previous_tiles is not None and cached_layer is None:
+                        cached_layer = CachedLayerEntity()
+                        cached_layer.name = f"{previous_tiles.name}-cached"
+                        cached_layer.z_depth = previous_tiles.z_depth
+                        cached_layer.add(previous_tiles)
+                        level.add_entity(cached_layer)
+                        scene.entities.add(cached_layer)
+
+                    if cached_layer is not None:
+                        cached_layer.add(tiles)
+
+                    previous_tiles = tiles
+
                 else:
                     Log.error(f"LDtk layer type '{layer_type}' is not supported")
                     continue
@@ -1,12 +1,32 @@
 from math import floor
+from typing import Iterable, Optional
 
 from engine.camera import Camera
+from engine.data_types.line import Line
 from engine.data_types.point import Point
 from engine.data_types.rect import Rect
 from engine.entity import Entity
+from engine.internal_utilities.shadow_caster_index import ShadowCasterIndex
 from engine.sprite import Sprite
 
 
+def _find_runs(values: Iterable[int]) -> list[tuple[int, int]]:
+    """ Group integers into runs of consecutive values, as (first, last) pairs. """
+    runs = []
+    run_start = None
+    previous = None
+    for value in sorted(values):
+        if run_start is None:
+            run_start = value
+        elif value != previous + 1:
+            runs.append((run_start, previous))
+            run_start = value
+        previous = value
+    if run_start is not None:
+        runs.append((run_start, previous))
+    return runs
+
+
 class LDtkSimplifiedIntGridEntity(Entity):
     """ An LDtk IntGrid layer from a 'Super Simple Export'. """
     def __init__(self) -> None:
@@ -17,6 +37,10 @@ class LDtkSimplifiedIntGridEntity(Entity):
         self.cells: dict[tuple[int, int], int] = {}
         self.sprite = Sprite.empty()
 
+        # Shadow casters are cached until the cells or the position of the entity change
+        self._shadow_caster_index: Optional[ShadowCasterIndex] = None
+        self._shadow_caster_key: Optional[tuple[int, int]] = None
+
     def world_to_cell_position(self, position: Point) -> tuple[int, int]:
         """ Get the cell coordinates from a world position. """
         return (
@@ -47,6 +71,104 @@ class LDtkSimplifiedIntGridEntity(Entity):
     def set_value(self, cx: int, cy: int, value: int) -> None:
         """ Set a value on the grid. """
         self.cells[(cx, cy)] = value
+        self._collision_version += 1
+        if self.static and self.scene:
+            self.scene.entities.flag_static_colliders_need_rebuild()
+
+    def static_collider_rects(self) -> list[Rect]:
+        """ Merge cells with a value into as few rects as possible.
+        Horizontal runs of cells are found on each row, then identical runs on consecutive rows are merged together.
+        """
+        # Group the cells with a value by row
+        row_cells: dict[int, list[int]] = {}
+        for (cx, cy), value in self.cells.items():
+            if value:
+                row_cells.setdefault(cy, []).append(cx)
+
+        # Find the horizontal runs of cells on each row
+        rows: dict[int, list[tuple[int, int]]] = {}
+        for cy in sorted(row_cells):
+            rows[cy] = _find_runs(row_cells[cy])
+
+        # Merge identical runs on consecutive rows
+        # Each open run maps to the row that it started on
+        merged: list[tuple[int, int, int, int]] = []
+        open_runs: dict[tuple[int, int], int] = {}
+        previous_cy = None
+        for cy, runs in rows.items():
+            for run, start_cy in list(open_runs.items()):
+                if run not in runs or cy != previous_cy + 1:
+                    merged.append((run[0], start_cy, run[1], previous_cy))
+                    del open_runs[run]
+            for run in runs:
+                open_runs.setdefault(run, cy)
+            previous_cy = cy
+
+        for run, start_cy in open_runs.items():
+            merged.append((run[0], start_cy, run[1], previous_cy))
+
+        # Convert cell ranges to world rects
+        rects = []
+        for cx0, cy0, cx1, cy1 in merged:
+            position = self.cell_to_world_position(cx0, cy0)
+            rects.append(Rect(
+                position.x,
+                position.y,
+                (cx1 - cx0 + 1) * self.grid_size,
+                (cy1 - cy0 + 1) * self.grid_size
+            ))
+
+        return rects
+
+    def shadow_caster_index(self) -> ShadowCasterIndex:
+        """ The spatial index of the grid's shadow casters.
+        The index is rebuilt the next time it is used after a cell is changed with `set_value()`, or the entity moves.
+        """
+        key = (self._collision_version, self.grid_size)
+        if self._shadow_caster_index is None or key != self._shadow_caster_key:
+            self._shadow_caster_index = ShadowCasterIndex(self._boundary_lines())
+            self._shadow_caster_key = key
+
+        return self._shadow_caster_index
+
+    def shadow_casters(self) -> list[Line]:
+        """ The outline of the cells with a value, as line segments for `PointLight` shadows. """
+        return self.shadow_caster_index().lines
+
+    def shadow_casters_near(self, position: Point, radius: int) -> list[Line]:
+        """ The shadow casters that are near a light, at a world position with a given radius. """
+        return self.shadow_caster_index().query(position, radius)
+
+    def _boundary_lines(self) -> list[Line]:
+        """ Get the edges between cells with a value and cells without one, merged into as few segments as possible.
+        Edges between two cells with a value are dropped, and edges that continue along the same grid line are joined.
+        """
+        solid = {cell for cell, value in self.cells.items() if value}
+
+        # The edges on each horizontal grid line (by row) and vertical grid line (by column)
+        # An edge is stored as the cell coordinate along the line where it starts, and is one cell long
+        horizontal: dict[int, list[int]] = {}
+        vertical: dict[int, list[int]] = {}
+        for cx, cy in solid:
+            if (cx, cy - 1) not in solid:
+                horizontal.setdefault(cy, []).append(cx)
+            if (cx, cy + 1) not in solid:
+                horizontal.setdefault(cy + 1, []).append(cx)
+            if (cx - 1, cy) not in solid:
+                vertical.setdefault(cx, []).append(cy)
+            if (cx + 1, cy) not in solid:
+                vertical.setdefault(cx + 1, []).append(cy)
+
+        # Join the edges on each grid line into segments
+        lines = []
+        for cy in sorted(horizontal):
+            for cx0, cx1 in _find_runs(horizontal[cy]):
+                lines.append(Line(self.cell_to_world_position(cx0, cy), self.cell_to_world_position(cx1 + 1, cy)))
+        for cx in sorted(vertical):
+            for cy0, cy1 in _find_runs(vertical[cx]):
+                lines.append(Line(self.cell_to_world_position(cx, cy0), self.cell_to_world_position(cx, cy1 + 1)))
+
+        return lines
 
     def draw(self, camera: Camera) -> None:
         self.sprite.draw(camera, self.position())
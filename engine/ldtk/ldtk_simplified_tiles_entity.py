@@ -1,4 +1,5 @@
 from engine.camera import Camera
+from engine.data_types.rect import Rect
 from engine.entity import Entity
 from engine.sprite import Sprite
 
@@ -11,5 +12,11 @@ class LDtkSimplifiedTilesEntity(Entity):
         self.tags.add("ldtk_tiles")
         self.sprite = Sprite.empty()
 
+    def draw_bounds(self) -> Rect:
+        return self.sprite.bounds(self.position())
+
+    def draw_cache_key(self) -> tuple:
+        return self.x, self.y, self.sprite.cache_key()
+
     def draw(self, camera: Camera) -> None:
         self.sprite.draw(camera, self.position())
@@ -234,6 +234,10 @@ class Level:
                 entity.x += dx
                 entity.y += dy
 
+            # Static colliders have moved, so the scene's static collider index is no longer valid
+            if self.scene:
+                self.scene.entities.flag_static_colliders_need_rebuild()
+
     def destroy(self, destroy_entities: bool = True) -> None:
         """ Remove this level from the scene.
         If `destroy_entities` is True, all entities in the level will be destroyed as well.
@@ -242,4 +246,5 @@ class Level:
             for entity in self.entities:
                 entity.destroy()
 
+        self.scene.entities.flag_static_colliders_need_rebuild()
         self.scene.remove_level(self)
@@ -38,13 +38,14 @@ class Light(BaseLight):
             self._check_sprites_for_errors()
 
     def draw(self, camera: Camera, position: Point) -> None:
-        if self._light_sprite:
+        # Sprites that are off-screen aren't drawn
+        if self._light_sprite and camera.is_visible(self._light_sprite.bounds(position)):
             with camera.render_pass("Lighting"):
                 self._light_sprite.color = self.color
                 self._light_sprite.opacity = int(self.intensity * 255)
                 self._light_sprite.draw(camera, position)
 
-        if self._glow_sprite:
+        if self._glow_sprite and camera.is_visible(self._glow_sprite.bounds(position)):
             with camera.render_pass("Glow"):
                 self._glow_sprite.color = self.color
                 self._glow_sprite.opacity = int(self.glow_intensity * 255)
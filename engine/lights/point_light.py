@@ -1,3 +1,5 @@
+from array import array
+from math import sqrt
 from typing import Optional
 
 from engine.camera import Camera
@@ -7,35 +9,39 @@ from engine.data_types.color import Color
 from engine.data_types.line import Line
 from engine.data_types.point import Point
 from engine.data_types.rect import Rect
+from engine.internal_utilities import geometry_utils
+from engine.internal_utilities.render_target_pool import RenderTargetPool
+from engine.internal_utilities.texture_registry import TextureRegistry
 from engine.lights.base_light import BaseLight
 from engine.renderer import Renderer
 
 
 class PointLight(BaseLight):
-    """ A circular light centered around a point with a linear intensity falloff, and is capable of casting shadows.
+    """ A circular light centered around a point with an intensity falloff, and is capable of casting shadows.
 
-    Rather than using a pre-defined sprite, this light generates its own texture by drawing pixels.
-    This is an expensive operation, so it should not be done frequently or in high amounts.
+    Rather than using a pre-defined sprite, this light generates its own texture. Textures are cached by radius and
+    falloff, and shared between lights, so a texture is only generated the first time that a radius and falloff is used.
     """
-    def __init__(self, radius: int) -> None:
+    # Light textures, by (radius, falloff)
+    _light_textures: dict[tuple[int, float], Texture] = {}
+
+    def __init__(self, radius: int, falloff: float = 1.0) -> None:
+        """ `falloff` is the exponent of the intensity curve; 1 is a linear falloff, and higher values are dimmer. """
         super().__init__()
         self._radius = radius
-        self._center_offset = Point(radius, radius)
+        self._falloff = falloff
 
-        # Texture
-        self._light_texture = Texture.create_target(2, 2)
-        self._glow_texture = Texture.create_target(2, 2)
-        self._intermediate_texture = Texture.create_target(2, 2)
+        # Textures
+        # The intermediate texture is only needed for drawing shadows, so it is acquired the first time it's used
+        self._light_texture: Texture
+        self._intermediate_texture: Optional[Texture] = None
         self._reset_textures()
 
         # Shadows
         self._cast_shadows = False
 
-        # Callbacks
-        Renderer.add_reset_callback(self._reset_textures)
-
     def __del__(self) -> None:
-        Renderer.remove_reset_callback(self._reset_textures)
+        self._release_intermediate_texture()
 
     @property
     def radius(self) -> int:
@@ -48,7 +54,19 @@ class PointLight(BaseLight):
             return
 
         self._radius = int(value)
-        self._center_offset = Point(value, value)
+        self._reset_textures()
+
+    @property
+    def falloff(self) -> float:
+        """ The exponent of the light's intensity curve. """
+        return self._falloff
+
+    @falloff.setter
+    def falloff(self, value: float) -> None:
+        if value == self._falloff:
+            return
+
+        self._falloff = value
         self._reset_textures()
 
     @property
@@ -61,40 +79,67 @@ class PointLight(BaseLight):
         self._cast_shadows = value
 
     def _reset_textures(self) -> None:
-        width = self.radius * 2
-        height = self.radius * 2
-
-        self._light_texture = Texture.create_target(width, height)
-        self._light_texture.set_blend_mode(BlendMode.ADD)
-
-        self._glow_texture = Texture.create_target(width, height)
-        self._glow_texture.set_blend_mode(BlendMode.ADD)
-
-        self._intermediate_texture = Texture.create_target(width, height)
-        self._intermediate_texture.set_blend_mode(BlendMode.ADD)
-
-        self._draw_light_texture(self._light_texture, width, height)
-        self._draw_light_texture(self._glow_texture, width, height)
-
-    def _draw_light_texture(self, texture: Texture, width: int, height: int) -> None:
-        with Renderer.render_target(texture):
-            # Clear the texture to black
-            Renderer.clear(Color.black())
-
-            # Draw the circle
-            center = Point(self.radius, self.radius)
-            for y in range(height):
-                for x in range(width):
-                    p = Point(x, y)
-                    d = p.distance_to(center)
-                    if d < self.radius:
-                        # Apply a linear falloff to the intensity to calculate the color
-                        intensity = 1 - (d / self.radius)
-                        intensity = int(intensity * 255)
-                        color = Color(intensity, intensity, intensity)
-                        Renderer.draw_point(p, color)
-                    else:
-                        Renderer.draw_point(p, Color.black())
+        self._light_texture = self._get_light_texture(self._radius, self._falloff)
+
+        # The intermediate texture is acquired again at the new size when it's needed
+        self._release_intermediate_texture()
+
+    def _acquire_intermediate_texture(self) -> Texture:
+        """ Get the intermediate texture, acquiring it from the render target pool if needed. """
+        if self._intermediate_texture is None:
+            self._intermediate_texture = RenderTargetPool.acquire(self.radius * 2, self.radius * 2)
+        return self._intermediate_texture
+
+    def _release_intermediate_texture(self) -> None:
+        """ Return the intermediate texture to the render target pool. """
+        if self._intermediate_texture is not None:
+            RenderTargetPool.release(self._intermediate_texture)
+            self._intermediate_texture = None
+
+    @classmethod
+    def _get_light_texture(cls, radius: int, falloff: float) -> Texture:
+        """ Get the shared light texture for a radius and falloff, creating it if needed. """
+        key = (radius, falloff)
+        texture = cls._light_textures.get(key)
+        if texture is None:
+            texture = cls._create_light_texture(radius, falloff)
+            cls._light_textures[key] = texture
+
+            # Light textures are shared between scenes
+            TextureRegistry.retain(texture)
+
+        return texture
+
+    @staticmethod
+    def _create_light_texture(radius: int, falloff: float) -> Texture:
+        """ Create a light texture.
+        The pixels are generated in memory and uploaded in one call. The texture is static, so it keeps its pixels when
+        the render targets are reset.
+        """
+        size = radius * 2
+
+        # The distance to the center is rounded to a whole pixel, so the color of each distance is looked up in a table
+        # RGBA8888 pixels are packed into 32-bit integers, so a gray pixel is its intensity repeated in R, G and B
+        colors = []
+        for distance in range(radius):
+            intensity = 1 - (distance / radius)
+            if falloff != 1:
+                intensity = intensity ** falloff
+            colors.append(int(intensity * 255) * 0x01010100 | 0xFF)
+        black = 0x000000FF
+
+        # Squared distances from the center along each axis
+        squares = [(i - radius) * (i - radius) for i in range(size)]
+
+        pixels = array('I')
+        for dy2 in squares:
+            row = (round(sqrt(dx2 + dy2)) for dx2 in squares)
+            pixels.extend([colors[d] if d < radius else black for d in row])
+
+        texture = Texture.create_static(size, size)
+        texture.update(pixels.tobytes(), size * 4)
+        texture.set_blend_mode(BlendMode.ADD)
+        return texture
 
     # noinspection DuplicatedCode
     def draw(self, camera: Camera, position: Point, shadow_casters: Optional[list[Line]] = None) -> None:
@@ -104,7 +149,15 @@ class PointLight(BaseLight):
             1. The light is drawn to an intermediate texture.
             2. Shadow masks are drawn to the intermediate texture, to mask out portions of the light.
             3. The intermediate texture is drawn to the camera's lighting pass.
+
+        While the camera is drawing, steps 1 and 2 are recorded as off-screen calls, so the intermediate texture is
+        drawn before any of the camera's passes.
         """
+        # Lights that are off-screen aren't drawn
+        radius = self._radius
+        if not camera.is_visible(Rect(position.x - radius, position.y - radius, radius * 2, radius * 2)):
+            return
+
         # Calculate the destination rect
         render_position = camera.world_to_render_position(position)
         destination = Rect(
@@ -114,10 +167,16 @@ class PointLight(BaseLight):
             self._light_texture.height
         )
 
+        shadow_vertices = None
         if self.cast_shadows and shadow_casters:
+            shadow_vertices = self._shadow_mask_vertices(position, shadow_casters)
+
+        if shadow_vertices:
             # Draw the light to the intermediate texture
-            texture = self._intermediate_texture
+            texture = self._acquire_intermediate_texture()
             with Renderer.render_target(texture):
+                # Set with the off-screen calls, so that the blend mode is set before the texture is copied to a pass
+                texture.set_blend_mode(BlendMode.ADD)
                 Renderer.clear(Color.black())
                 Renderer.copy(
                     texture=self._light_texture,
@@ -128,9 +187,8 @@ class PointLight(BaseLight):
                     flip=0
                 )
 
-                # Draw shadows on top of the light texture
-                for line in shadow_casters:
-                    self._draw_shadow_mask(position, line)
+                # Draw every shadow mask on top of the light texture in a single call
+                Renderer.render_geometry(shadow_vertices, Color.black())
         else:
             texture = self._light_texture
 
@@ -168,14 +226,36 @@ class PointLight(BaseLight):
                 Renderer.clear_texture_color_mod(texture)
                 Renderer.clear_texture_alpha_mod(texture)
 
-    def _draw_shadow_mask(self, light_position: Point, line: Line) -> None:
-        """ Project a line segment away from the light's origin to generate a shadow mask.
+    def _shadow_mask_vertices(self, light_position: Point, shadow_casters: list[Line]) -> list[tuple[int, int]]:
+        """ Project line segments away from the light's origin to generate shadow masks, relative to the light texture.
         https://slembcke.github.io/SuperFastHardShadows
-        The '999' magic number is just a constant to make sure the end distance of the shadow mask is sufficiently far
-            away from the light so that the mask extends past the radius.
+        Each mask is a quad from the segment to a copy of it that is 1000 times as far from the light, so that the mask
+            extends past the radius. Segments that are outside of the light's radius are skipped, since their shadows
+            would only cover unlit pixels.
+        Returns the vertices of the triangles of every mask.
         """
-        v0 = line.a - light_position + self._center_offset
-        v1 = line.a + ((line.a - light_position) * 999) - light_position + self._center_offset
-        v2 = line.b - light_position + self._center_offset
-        v3 = line.b + ((line.b - light_position) * 999) - light_position + self._center_offset
-        Renderer.render_geometry([v0, v1, v2, v1, v2, v3], Color.black())
+        light_x = light_position.x
+        light_y = light_position.y
+        radius = self._radius
+
+        # Pixels are lit up to half a pixel inside the radius, and rasterized at their centers, so allow a pixel more
+        reach = radius + 1
+
+        vertices = []
+        for line in shadow_casters:
+            a = line.a
+            b = line.b
+            ax = a.x - light_x
+            ay = a.y - light_y
+            bx = b.x - light_x
+            by = b.y - light_y
+            if not geometry_utils.segment_intersects_circle(ax, ay, bx, by, 0, 0, reach):
+                continue
+
+            v0 = (ax + radius, ay + radius)
+            v1 = (ax * 1000 + radius, ay * 1000 + radius)
+            v2 = (bx + radius, by + radius)
+            v3 = (bx * 1000 + radius, by * 1000 + radius)
+            vertices += (v0, v1, v2, v1, v2, v3)
+
+        return vertices
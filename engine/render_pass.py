@@ -1,14 +1,23 @@
+from math import ceil
+from typing import Optional
+
 from engine.content_types.texture import Texture, BlendMode
 from engine.data_types.color import Color
+from engine.internal_utilities.render_target_pool import RenderTargetPool
 from engine.renderer import Renderer
 
 
 class RenderPass:
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, resolution_divisor: int = 1) -> None:
+        """ `resolution_divisor` divides the size of the render pass's texture; for example, a divisor of 2 draws the
+        render pass at half resolution. Draw calls still use the camera's render coordinates, and the texture is
+        upscaled when it is composited.
+        """
         self._name = name
-        self._texture = Texture.create_target(2, 2)
-        self._texture.set_blend_mode(BlendMode.ALPHA_COMPOSITE)
-        self._blend_mode = self._texture.blend_mode
+        self._resolution_divisor = max(int(resolution_divisor), 1)
+        # The texture is acquired when the camera's render targets are created
+        self._texture: Optional[Texture] = None
+        self._blend_mode = BlendMode.ALPHA_COMPOSITE
         self._clear_color = Color.transparent()
 
     def __str__(self) -> str:
@@ -23,23 +32,69 @@ class RenderPass:
         return self._name
 
     @property
-    def texture(self) -> Texture:
+    def resolution_divisor(self) -> int:
+        """ The number that the camera's resolution is divided by to get the size of the render pass's texture. """
+        return self._resolution_divisor
+
+    @property
+    def texture(self) -> Optional[Texture]:
         """ The texture that the render pass is drawn to. """
         return self._texture
 
+    @property
+    def blend_mode(self) -> BlendMode:
+        """ The blend mode used to composite the render pass. """
+        return self._blend_mode
+
+    @property
+    def clear_color(self) -> Color:
+        """ The color that the render pass is cleared to. """
+        return self._clear_color
+
+    def is_invisible_when_clear(self) -> bool:
+        """ Check if compositing the render pass right after it's cleared would leave the destination unchanged.
+        If so, the render pass can be skipped entirely when nothing is drawn to it.
+        """
+        r, g, b, a = self._clear_color.to_tuple()
+        match self._blend_mode:
+            case BlendMode.BLEND:
+                return a == 0
+            case BlendMode.ALPHA_COMPOSITE:
+                return r == g == b == a == 0
+            case BlendMode.ADD:
+                return a == 0 or r == g == b == 0
+            case BlendMode.MOD:
+                return r == g == b == 255
+            case BlendMode.MUL:
+                return a == 0 or r == g == b == a == 255
+        return False
+
     def set_blend_mode(self, blend_mode: BlendMode) -> None:
         """ Set the texture blend mode. """
         self._blend_mode = blend_mode
-        self._texture.set_blend_mode(blend_mode)
+        if self._texture is not None:
+            self._texture.set_blend_mode(blend_mode)
 
     def set_clear_color(self, color: Color) -> None:
         """ Set the clear color of the render pass."""
         self._clear_color = color
 
     def create_texture(self, width: int, height: int) -> None:
-        """ Create the texture. """
-        self._texture = Texture.create_target(width, height)
+        """ Create the texture, for a camera that renders at a given width and height.
+        The previous texture is returned to the render target pool, so a texture of the same size is re-used.
+        """
+        self.release_texture()
+        divisor = self._resolution_divisor
+        self._texture = RenderTargetPool.acquire(ceil(width / divisor), ceil(height / divisor))
         self._texture.set_blend_mode(self._blend_mode)
+        if divisor > 1:
+            self._texture.set_render_scale(1 / divisor)
+
+    def release_texture(self) -> None:
+        """ Return the texture to the render target pool. """
+        if self._texture is not None:
+            RenderTargetPool.release(self._texture)
+            self._texture = None
 
     def clear(self) -> None:
         """ Clear the texture. """
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from array import array
 from contextlib import contextmanager
-from ctypes import pointer, POINTER
+from ctypes import Array, byref, c_float, c_int, c_void_p, cast, pointer, POINTER, sizeof
+from functools import wraps
 from typing import Callable, Generator, Optional, TYPE_CHECKING
 
 import sdl2
@@ -9,6 +11,10 @@ from sdl2 import sdlgfx
 
 from engine.data_types.blend_mode import BlendMode
 from engine.data_types.color import Color
+from engine.internal_utilities.render_stats import RenderStats
+from engine.internal_utilities.sprite_batch import SpriteBatch
+from engine.internal_utilities.texture_registry import TextureRegistry
+from engine.log import Log
 
 if TYPE_CHECKING:
     from engine.data_types.circle import Circle
@@ -16,6 +22,52 @@ if TYPE_CHECKING:
     from engine.data_types.point import Point
     from engine.data_types.rect import Rect
     from engine.content_types.texture import Texture
+    from engine.internal_utilities.draw_queue import DrawQueue
+
+
+def _deferrable(function: Callable) -> Callable:
+    """ Decorator for renderer methods that are recorded instead of run, while a draw queue is set. """
+    @wraps(function)
+    def wrapper(cls, *args, **kwargs) -> None:
+        if cls._draw_queue is not None:
+            cls._draw_queue.record(function, (cls, *args), kwargs)
+        else:
+            function(cls, *args, **kwargs)
+    return wrapper
+
+
+def _buffer_view(buffer: array | memoryview, name: str) -> Optional[tuple[memoryview, str]]:
+    """ Get a flat byte view of a contiguous buffer of (x, y) pairs, and the type of its values ('i' or 'f').
+    The values must be 32-bit ints or floats. If the buffer has a different layout, an error is logged and None is
+    returned.
+    """
+    view = memoryview(buffer)
+
+    # 'l' is a 32-bit int on Windows
+    value_format = view.format.lstrip("@=")
+    if view.itemsize != 4 or value_format not in ("i", "l", "f"):
+        Log.error(f"{name} buffers must contain 32-bit ints or floats, not '{view.format}'")
+        return None
+
+    if not view.c_contiguous:
+        Log.error(f"{name} buffers must be contiguous")
+        return None
+
+    if view.nbytes % 8:
+        Log.error(f"{name} buffers must contain (x, y) pairs")
+        return None
+
+    return view.cast("B"), "f" if value_format == "f" else "i"
+
+
+def _buffer_to_ctypes(view: memoryview, item_type: type) -> Array:
+    """ Wrap a flat byte view as a ctypes array, without copying it.
+    Read-only buffers can't be shared with ctypes, so they are copied in a single block.
+    """
+    array_type = item_type * (view.nbytes // sizeof(item_type))
+    if view.readonly:
+        return array_type.from_buffer_copy(view)
+    return array_type.from_buffer(view)
 
 
 class Renderer:
@@ -27,6 +79,50 @@ class Renderer:
 
     _reset_callbacks: list[Callable] = []
 
+    # Sprites that share a texture are batched together and drawn with a single call
+    _sprite_batch = SpriteBatch()
+
+    # While a draw queue is set, draw calls are recorded to it instead of being run
+    _draw_queue: Optional[DrawQueue] = None
+
+    # The previous render targets of `render_target()` contexts
+    _render_target_stack: list[Optional[Texture]] = []
+
+    # Render state cache; calls that wouldn't change the current state are skipped
+    # A value of None means that the state is unknown, and the next call will always be sent to SDL
+    _render_target: Optional[Texture] = None
+    _draw_color: Optional[tuple[int, int, int, int]] = None
+    _draw_blend_mode: Optional[int] = None
+
+    # The number of render state calls that were sent to SDL, and that were skipped
+    _state_calls_issued = 0
+    _state_calls_elided = 0
+    _last_frame_state_calls = (0, 0)
+
+    # Draw calls are counted into `_stats`, which is added to the frame's stats (and the stats of the camera that is
+    # drawing, if any) whenever a section of the frame ends
+    _stats = RenderStats()
+    _section_stats: Optional[RenderStats] = None
+    _frame_stats = RenderStats()
+    _last_frame_stats = RenderStats()
+    _textures_created_mark = 0
+    _textures_destroyed_mark = 0
+    _output_width = c_int()
+    _output_height = c_int()
+
+    # Reusable SDL structs and buffers, so that draw calls don't allocate new ones
+    # Values are copied into these right before each SDL call; SDL copies them again when the call is queued
+    _source_rect = sdl2.SDL_Rect()
+    _source_rect_ptr = pointer(_source_rect)
+    _destination_rect = sdl2.SDL_Rect()
+    _destination_rect_ptr = pointer(_destination_rect)
+    _rotation_center = sdl2.SDL_Point()
+    _rotation_center_ptr = pointer(_rotation_center)
+    _vertex_color = sdl2.SDL_Color()
+    _vertex_color_ptr = pointer(_vertex_color)
+    _point_buffer = array('i')
+    _vertex_buffer = array('f')
+
     @classmethod
     def init(cls, resolution: tuple[int, int], flags: int = 0) -> None:
         """ Initialize the renderer. """
@@ -79,39 +175,215 @@ class Renderer:
         return info.name.decode("utf-8")
 
     @classmethod
+    def flush(cls) -> None:
+        """ Draw any batched sprites.
+        This is done automatically before anything else is drawn, and before the render target changes.
+        """
+        if cls._sprite_batch:
+            stats = cls._stats
+            stats.draw_calls += 1
+            stats.geometry_calls += 1
+            stats.primitives += len(cls._sprite_batch) * 2
+            cls._sprite_batch.flush(cls._sdl_renderer)
+
+    @classmethod
+    def state_call_counts(cls) -> tuple[int, int]:
+        """ The number of render state calls in the previous frame, as (issued, elided).
+        Issued calls were sent to SDL; elided calls were skipped because they wouldn't have changed anything.
+        """
+        return cls._last_frame_state_calls
+
+    @classmethod
+    def frame_stats(cls) -> RenderStats:
+        """ The renderer's statistics for the previous frame.
+        The same object is reused every other frame, so it should be copied (for example with `to_dict()`) to be kept.
+        """
+        return cls._last_frame_stats
+
+    @classmethod
+    def begin_stats(cls, stats: RenderStats) -> None:
+        """ Reset a set of stats, and count the renderer's work into it (as well as into the frame's stats) until
+        `end_stats()` is called. Cameras use this to keep their own stats.
+        """
+        cls._commit_stats()
+        stats.reset()
+        cls._section_stats = stats
+
+    @classmethod
+    def end_stats(cls) -> None:
+        """ Stop counting into the stats that were set by `begin_stats()`. """
+        cls._commit_stats()
+        cls._section_stats = None
+
+    @classmethod
+    def _commit_stats(cls) -> None:
+        """ Add the work counted since the last commit to the frame's stats and the current section's stats. """
+        stats = cls._stats
+
+        # Textures are counted by the texture registry, so only the difference since the last commit is added
+        created = TextureRegistry.created_count()
+        destroyed = TextureRegistry.destroyed_count()
+        stats.textures_created += created - cls._textures_created_mark
+        stats.textures_destroyed += destroyed - cls._textures_destroyed_mark
+        cls._textures_created_mark = created
+        cls._textures_destroyed_mark = destroyed
+
+        cls._frame_stats.add(stats)
+        if cls._section_stats is not None:
+            cls._section_stats.add(stats)
+        stats.reset()
+
+    @classmethod
+    def _target_area(cls) -> int:
+        """ The number of pixels in the current render target. """
+        if cls._render_target is not None:
+            return cls._render_target.width * cls._render_target.height
+
+        sdl2.SDL_GetRendererOutputSize(cls._sdl_renderer, byref(cls._output_width), byref(cls._output_height))
+        return cls._output_width.value * cls._output_height.value
+
+    @classmethod
+    def invalidate_state_cache(cls) -> None:
+        """ Forget the cached render state, so that the next state calls are always sent to SDL.
+        This should be used if the render state is changed without going through the renderer.
+        """
+        cls._draw_color = None
+        cls._draw_blend_mode = None
+
+    @staticmethod
+    def _fill_rect(
+            sdl_rect: sdl2.SDL_Rect,
+            sdl_rect_ptr: POINTER(sdl2.SDL_Rect),
+            rect: Rect | tuple[int, int, int, int]
+    ) -> POINTER(sdl2.SDL_Rect):
+        """ Copy a rect or an (x, y, width, height) tuple into a reusable SDL_Rect, and return its pointer. """
+        x, y, w, h = rect if rect.__class__ is tuple else rect.to_tuple()
+        sdl_rect.x = x
+        sdl_rect.y = y
+        sdl_rect.w = w
+        sdl_rect.h = h
+        return sdl_rect_ptr
+
+    @classmethod
+    def _count_mod_change(cls, issued: bool) -> None:
+        """ Count a texture color mod or alpha mod call as issued or elided. """
+        if issued:
+            cls._state_calls_issued += 1
+            cls._stats.mod_changes += 1
+        else:
+            cls._state_calls_elided += 1
+
+    @classmethod
+    def _set_target(cls, texture: Optional[Texture]) -> None:
+        """ Set the render target, or the window if the texture is None. """
+        if texture is cls._render_target:
+            cls._state_calls_elided += 1
+            return
+
+        cls.flush()
+        sdl2.SDL_SetRenderTarget(cls._sdl_renderer, texture.sdl_texture if texture else None)
+        cls._render_target = texture
+        cls._state_calls_issued += 1
+        cls._stats.target_switches += 1
+
+        # SDL resets the scale when a texture is set as the render target
+        if texture and texture.render_scale != 1:
+            sdl2.SDL_RenderSetScale(cls._sdl_renderer, texture.render_scale, texture.render_scale)
+
+    @classmethod
+    def _set_draw_color(cls, color: Color) -> None:
+        """ Set the color used for drawing operations. """
+        draw_color = color.to_tuple()
+        if draw_color == cls._draw_color:
+            cls._state_calls_elided += 1
+            return
+
+        sdl2.SDL_SetRenderDrawColor(cls._sdl_renderer, *draw_color)
+        cls._draw_color = draw_color
+        cls._state_calls_issued += 1
+
+    @classmethod
+    def _set_draw_blend_mode(cls, sdl_blend_mode: int) -> None:
+        """ Set the SDL blend mode used for drawing operations. """
+        if sdl_blend_mode == cls._draw_blend_mode:
+            cls._state_calls_elided += 1
+            return
+
+        sdl2.SDL_SetRenderDrawBlendMode(cls._sdl_renderer, sdl_blend_mode)
+        cls._draw_blend_mode = sdl_blend_mode
+        cls._state_calls_issued += 1
+
+    @classmethod
+    def draw_queue(cls) -> Optional[DrawQueue]:
+        """ The draw queue that draw calls are currently recorded to, if any. """
+        return cls._draw_queue
+
+    @classmethod
+    def set_draw_queue(cls, draw_queue: DrawQueue) -> None:
+        """ Record draw calls to a draw queue instead of running them, until the draw queue is cleared. """
+        cls._draw_queue = draw_queue
+
+    @classmethod
+    def clear_draw_queue(cls) -> None:
+        """ Clear the draw queue; draw calls will be run immediately again. """
+        cls._draw_queue = None
+
+    @classmethod
+    @_deferrable
     def set_render_target(cls, texture: Texture) -> None:
         """ Set the render target to a texture. """
-        sdl2.SDL_SetRenderTarget(cls._sdl_renderer, texture.sdl_texture)
+        cls._set_target(texture)
 
     @classmethod
+    @_deferrable
     def unset_render_target(cls) -> None:
         """ Clear the current render target; it will be set back to the window. """
-        sdl2.SDL_SetRenderTarget(cls._sdl_renderer, None)
+        cls._set_target(None)
 
     @classmethod
+    @_deferrable
     def clear(cls, color: Color = Color.transparent()) -> None:
         """ Clear the current rendering target. """
-        sdl2.SDL_SetRenderDrawColor(cls._sdl_renderer, *color)
+        cls.flush()
+        cls._set_draw_color(color)
         sdl2.SDL_RenderClear(cls._sdl_renderer)
 
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.pixels += cls._target_area()
+
     @classmethod
+    @_deferrable
     def copy(cls,
              texture: Texture,
-             source_rect: Optional[Rect],
-             destination_rect: Optional[Rect],
+             source_rect: Optional[Rect | tuple[int, int, int, int]],
+             destination_rect: Optional[Rect | tuple[int, int, int, int]],
              rotation_angle: float,
-             rotation_center: Optional[Point],
+             rotation_center: Optional[Point | tuple[int, int]],
              flip: int,
              ) -> None:
-        """ Copy a texture to the rendering target. """
+        """ Copy a texture to the rendering target.
+        Rects can be given as (x, y, width, height) tuples, and the rotation center as an (x, y) tuple.
+        """
+        cls.flush()
+
         if source_rect:
-            source_rect = source_rect.to_sdl_rect()
+            source_rect = cls._fill_rect(cls._source_rect, cls._source_rect_ptr, source_rect)
 
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.copy_calls += 1
         if destination_rect:
-            destination_rect = destination_rect.to_sdl_rect()
+            destination_rect = cls._fill_rect(cls._destination_rect, cls._destination_rect_ptr, destination_rect)
+            stats.pixels += cls._destination_rect.w * cls._destination_rect.h
+        else:
+            stats.pixels += cls._target_area()
 
         if rotation_center:
-            rotation_center = pointer(rotation_center.to_sdl_point())
+            x, y = rotation_center if rotation_center.__class__ is tuple else rotation_center.to_tuple()
+            cls._rotation_center.x = x
+            cls._rotation_center.y = y
+            rotation_center = cls._rotation_center_ptr
 
         sdl2.SDL_RenderCopyEx(
             cls._sdl_renderer,
@@ -123,59 +395,257 @@ class Renderer:
             flip
         )
 
+    @classmethod
+    @_deferrable
+    def copy_batched(cls,
+                     texture: Texture,
+                     source_rect: Optional[Rect],
+                     destination_rect: Rect,
+                     rotation_angle: float,
+                     rotation_center: Optional[Point],
+                     flip: int,
+                     color: Optional[Color] = None,
+                     opacity: int = 255,
+                     ) -> None:
+        """ Copy a texture to the rendering target as part of a sprite batch.
+        Consecutive copies of the same texture are drawn together with a single call.
+        The color and opacity are applied to this copy only; the texture's color mod and alpha mod are not used.
+        """
+        if color:
+            vertex_color = (color.r, color.g, color.b, int(opacity))
+        else:
+            vertex_color = (255, 255, 255, int(opacity))
+
+        # A batch of a different texture is flushed here rather than by the batch, so that it is counted
+        if texture is not cls._sprite_batch.texture:
+            cls.flush()
+
+        cls._stats.pixels += destination_rect.width * destination_rect.height
+
+        cls._sprite_batch.add(
+            cls._sdl_renderer,
+            texture,
+            source_rect,
+            destination_rect,
+            rotation_angle,
+            rotation_center,
+            flip,
+            vertex_color
+        )
+
+    @classmethod
+    @_deferrable
+    def copy_batched_quads(cls, texture: Texture, positions: array, texture_coordinates: array, colors: array) -> None:
+        """ Copy pre-built quads of a texture to the rendering target as part of a sprite batch.
+        Each quad has four vertices (top-left, top-right, bottom-right, bottom-left); `positions` has 8 floats per quad,
+        `texture_coordinates` has 8 normalized floats per quad, and `colors` has 16 bytes (r, g, b, a) per quad.
+        The arrays are read when the batch is drawn, so they must not be changed afterwards.
+        """
+        if texture is not cls._sprite_batch.texture:
+            cls.flush()
+
+        # Quads are axis-aligned, so their size is the distance from the top-left vertex to the bottom-right vertex
+        cls._stats.pixels += int(sum(
+            (positions[i + 4] - positions[i]) * (positions[i + 5] - positions[i + 1])
+            for i in range(0, len(positions), 8)
+        ))
+
+        cls._sprite_batch.add_quads(cls._sdl_renderer, texture, positions, texture_coordinates, colors)
+
     @classmethod
     def present(cls) -> None:
         """ Update the screen with any rendering performed since the previous call. """
+        cls.flush()
         sdl2.SDL_RenderPresent(cls._sdl_renderer)
 
+        cls._last_frame_state_calls = (cls._state_calls_issued, cls._state_calls_elided)
+        cls._state_calls_issued = 0
+        cls._state_calls_elided = 0
+
+        cls._commit_stats()
+        cls._last_frame_stats, cls._frame_stats = cls._frame_stats, cls._last_frame_stats
+        cls._frame_stats.reset()
+
     @classmethod
-    def draw_point(cls, point: Point, color: Color) -> None:
-        """ Draw a point. """
-        sdl2.SDL_SetRenderDrawColor(cls._sdl_renderer, *color)
-        sdl2.SDL_RenderDrawPoint(cls._sdl_renderer, point.x, point.y)
+    @_deferrable
+    def draw_point(cls, point: Point | tuple[int, int], color: Color) -> None:
+        """ Draw a point, given as a Point or an (x, y) tuple. """
+        cls.flush()
+        cls._set_draw_color(color)
+        x, y = point if point.__class__ is tuple else point.to_tuple()
+        sdl2.SDL_RenderDrawPoint(cls._sdl_renderer, x, y)
+
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.primitives += 1
 
     @classmethod
-    def draw_points(cls, points: list[Point], color: Color) -> None:
-        """ Draw a list of points. """
-        sdl2.SDL_SetRenderDrawColor(cls._sdl_renderer, *color)
-        sdl_points = [p.to_sdl_point() for p in points]
-        points_ptr = (sdl2.SDL_Point * len(points))(*sdl_points)
-        sdl2.SDL_RenderDrawPoints(cls._sdl_renderer, points_ptr, len(points))
+    @_deferrable
+    def draw_points(cls, points: list[Point] | list[tuple[int, int]] | array | memoryview, color: Color) -> None:
+        """ Draw a list of points, given as Points or (x, y) tuples.
+        Points can also be given as any contiguous buffer of (x, y) pairs of 32-bit ints or floats, such as an
+        `array('i')`, an `array('f')` or a NumPy array; the buffer is passed to SDL without converting each point.
+        While a draw queue is set, the buffer is read when the queue is executed, so it must not be changed until the
+        frame is drawn.
+        """
+        if isinstance(points, (list, tuple)):
+            if not points:
+                return
+
+            buffer = cls._point_buffer
+            del buffer[:]
+            for point in points:
+                buffer.extend(point if point.__class__ is tuple else point.to_tuple())
+
+            point_count = len(points)
+            points_ptr = cast(c_void_p(buffer.buffer_info()[0]), POINTER(sdl2.SDL_Point))
+            draw_points = sdl2.SDL_RenderDrawPoints
+        else:
+            buffer_view = _buffer_view(points, "draw_points")
+            if buffer_view is None or not buffer_view[0].nbytes:
+                return
+
+            view, value_format = buffer_view
+            if value_format == "f":
+                points_ptr = _buffer_to_ctypes(view, sdl2.SDL_FPoint)
+                draw_points = sdl2.SDL_RenderDrawPointsF
+            else:
+                points_ptr = _buffer_to_ctypes(view, sdl2.SDL_Point)
+                draw_points = sdl2.SDL_RenderDrawPoints
+            point_count = len(points_ptr)
+
+        cls.flush()
+        cls._set_draw_color(color)
+        draw_points(cls._sdl_renderer, points_ptr, point_count)
+
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.primitives += point_count
 
     @classmethod
-    def draw_line(cls, line: Line, color: Color) -> None:
-        """ Draw a line. """
-        sdl2.SDL_SetRenderDrawColor(cls._sdl_renderer, *color)
-        sdl2.SDL_RenderDrawLine(cls._sdl_renderer, line.a.x, line.a.y, line.b.x, line.b.y)
+    @_deferrable
+    def draw_line(cls, line: Line | tuple[int, int, int, int], color: Color) -> None:
+        """ Draw a line, given as a Line or an (x1, y1, x2, y2) tuple. """
+        cls.flush()
+        cls._set_draw_color(color)
+        if line.__class__ is tuple:
+            sdl2.SDL_RenderDrawLine(cls._sdl_renderer, *line)
+        else:
+            sdl2.SDL_RenderDrawLine(cls._sdl_renderer, line.a.x, line.a.y, line.b.x, line.b.y)
+
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.primitives += 1
 
     @classmethod
-    def draw_rect_outline(cls, rect: Rect, color: Color) -> None:
-        """ Draw the outline of a rectangle. """
-        sdl2.SDL_SetRenderDrawColor(cls._sdl_renderer, *color)
-        sdl2.SDL_RenderDrawRect(cls._sdl_renderer, rect.to_sdl_rect())
+    @_deferrable
+    def draw_rect_outline(cls, rect: Rect | tuple[int, int, int, int], color: Color) -> None:
+        """ Draw the outline of a rectangle, given as a Rect or an (x, y, width, height) tuple. """
+        cls.flush()
+        cls._set_draw_color(color)
+        rect_ptr = cls._fill_rect(cls._destination_rect, cls._destination_rect_ptr, rect)
+        sdl2.SDL_RenderDrawRect(cls._sdl_renderer, rect_ptr)
+
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.primitives += 1
 
     @classmethod
-    def draw_rect_solid(cls, rect: Rect, color: Color) -> None:
-        """ Draw a solid rectangle. """
-        sdl2.SDL_SetRenderDrawColor(cls._sdl_renderer, *color)
-        sdl2.SDL_RenderFillRect(cls._sdl_renderer, rect.to_sdl_rect())
+    @_deferrable
+    def draw_rect_solid(cls, rect: Rect | tuple[int, int, int, int], color: Color) -> None:
+        """ Draw a solid rectangle, given as a Rect or an (x, y, width, height) tuple. """
+        cls.flush()
+        cls._set_draw_color(color)
+        rect_ptr = cls._fill_rect(cls._destination_rect, cls._destination_rect_ptr, rect)
+        sdl2.SDL_RenderFillRect(cls._sdl_renderer, rect_ptr)
+
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.primitives += 1
+        stats.pixels += cls._destination_rect.w * cls._destination_rect.h
 
     @classmethod
+    @_deferrable
     def draw_circle_outline(cls, circle: Circle, color: Color) -> None:
         """ Draw the outline of a circle. """
+        cls.flush()
         sdlgfx.circleRGBA(cls._sdl_renderer, circle.x, circle.y, circle.radius, *color)
 
+        # SDL_gfx sets the draw color and blend mode itself
+        cls.invalidate_state_cache()
+
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.primitives += 1
+
     @classmethod
+    @_deferrable
     def draw_circle_solid(cls, circle: Circle, color: Color) -> None:
         """ Draw a solid circle. """
+        cls.flush()
         sdlgfx.filledCircleRGBA(cls._sdl_renderer, circle.x, circle.y, circle.radius, *color)
 
+        # SDL_gfx sets the draw color and blend mode itself
+        cls.invalidate_state_cache()
+
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.primitives += 1
+
     @classmethod
-    def render_geometry(cls, vertices: list[Point], color: Color) -> None:
-        """ Render a list of triangles. """
-        sdl_vertices = [sdl2.SDL_Vertex((v.x, v.y), color.to_tuple()) for v in vertices]
-        vertices_ptr = (sdl2.SDL_Vertex * len(vertices))(*sdl_vertices)
-        sdl2.SDL_RenderGeometry(cls._sdl_renderer, None, vertices_ptr, len(vertices), None, 0)
+    @_deferrable
+    def render_geometry(cls,
+                        vertices: list[Point] | list[tuple[int, int]] | array | memoryview,
+                        color: Color
+                        ) -> None:
+        """ Render a list of triangles, with vertices given as Points or (x, y) tuples.
+        Vertices can also be given as any contiguous buffer of (x, y) pairs of 32-bit floats, such as an `array('f')` or
+        a NumPy array; the buffer is passed to SDL without converting each vertex. While a draw queue is set, the buffer
+        is read when the queue is executed, so it must not be changed until the frame is drawn.
+        """
+        if isinstance(vertices, (list, tuple)):
+            if not vertices:
+                return
+
+            buffer = cls._vertex_buffer
+            del buffer[:]
+            for vertex in vertices:
+                buffer.extend(vertex if vertex.__class__ is tuple else vertex.to_tuple())
+
+            vertex_count = len(vertices)
+            xy_ptr = cast(c_void_p(buffer.buffer_info()[0]), POINTER(c_float))
+        else:
+            buffer_view = _buffer_view(vertices, "render_geometry")
+            if buffer_view is None or not buffer_view[0].nbytes:
+                return
+
+            view, value_format = buffer_view
+            if value_format != "f":
+                Log.error("render_geometry buffers must contain floats")
+                return
+
+            xy_ptr = _buffer_to_ctypes(view, c_float)
+            vertex_count = len(xy_ptr) // 2
+
+        cls.flush()
+
+        # Every vertex has the same color, so the color is read from a single struct with a stride of 0
+        cls._vertex_color.r, cls._vertex_color.g, cls._vertex_color.b, cls._vertex_color.a = color.to_tuple()
+
+        sdl2.SDL_RenderGeometryRaw(
+            cls._sdl_renderer,
+            None,
+            xy_ptr, 8,
+            cls._vertex_color_ptr, 0,
+            None, 0,
+            vertex_count,
+            None, 0, 0
+        )
+
+        stats = cls._stats
+        stats.draw_calls += 1
+        stats.geometry_calls += 1
+        stats.primitives += vertex_count // 3
 
     @classmethod
     def add_reset_callback(cls, callback: Callable) -> None:
@@ -190,56 +660,90 @@ class Renderer:
     @classmethod
     def on_renderer_reset(cls) -> None:
         """ Called when the render targets or device has been reset. """
+        cls.invalidate_state_cache()
         for cb in cls._reset_callbacks:
             cb()
 
     @classmethod
+    @_deferrable
     def set_render_draw_blend_mode(cls, blend_mode: BlendMode) -> None:
         """ Set the blend mode used for drawing operations (Fill and Line). """
         match blend_mode:
             case BlendMode.NONE:
-                sdl2.SDL_SetRenderDrawBlendMode(cls._sdl_renderer, sdl2.SDL_BLENDMODE_NONE)
+                cls._set_draw_blend_mode(sdl2.SDL_BLENDMODE_NONE)
             case BlendMode.BLEND:
-                sdl2.SDL_SetRenderDrawBlendMode(cls._sdl_renderer, sdl2.SDL_BLENDMODE_BLEND)
+                cls._set_draw_blend_mode(sdl2.SDL_BLENDMODE_BLEND)
             case BlendMode.ADD:
-                sdl2.SDL_SetRenderDrawBlendMode(cls._sdl_renderer, sdl2.SDL_BLENDMODE_ADD)
+                cls._set_draw_blend_mode(sdl2.SDL_BLENDMODE_ADD)
             case BlendMode.MOD:
-                sdl2.SDL_SetRenderDrawBlendMode(cls._sdl_renderer, sdl2.SDL_BLENDMODE_MOD)
+                cls._set_draw_blend_mode(sdl2.SDL_BLENDMODE_MOD)
             case BlendMode.MUL:
-                sdl2.SDL_SetRenderDrawBlendMode(cls._sdl_renderer, sdl2.SDL_BLENDMODE_MUL)
+                cls._set_draw_blend_mode(sdl2.SDL_BLENDMODE_MUL)
 
     @classmethod
+    @_deferrable
     def clear_render_draw_blend_mode(cls) -> None:
         """ Clear the render draw blend mode. """
-        sdl2.SDL_SetRenderDrawBlendMode(cls._sdl_renderer, sdl2.SDL_BLENDMODE_NONE)
+        cls._set_draw_blend_mode(sdl2.SDL_BLENDMODE_NONE)
 
-    @staticmethod
-    def set_texture_color_mod(texture: Texture, color: Color) -> None:
+    @classmethod
+    @_deferrable
+    def set_texture_color_mod(cls, texture: Texture, color: Color) -> None:
         """ Set an additional color value multiplied into render copy operations. """
-        sdl2.SDL_SetTextureColorMod(texture.sdl_texture, color.r, color.g, color.b)
+        cls._count_mod_change(texture.set_color_mod(color.r, color.g, color.b))
 
-    @staticmethod
-    def clear_texture_color_mod(texture: Texture) -> None:
+    @classmethod
+    @_deferrable
+    def clear_texture_color_mod(cls, texture: Texture) -> None:
         """ Clear the texture's color mod. """
-        sdl2.SDL_SetTextureColorMod(texture.sdl_texture, 255, 255, 255)
+        cls._count_mod_change(texture.set_color_mod(255, 255, 255))
 
-    @staticmethod
-    def set_texture_alpha_mod(texture: Texture, alpha: int) -> None:
+    @classmethod
+    @_deferrable
+    def set_texture_alpha_mod(cls, texture: Texture, alpha: int) -> None:
         """ Set an additional alpha value multiplied into render copy operations """
-        sdl2.SDL_SetTextureAlphaMod(texture.sdl_texture, alpha)
+        cls._count_mod_change(texture.set_alpha_mod(alpha))
 
-    @staticmethod
-    def clear_texture_alpha_mod(texture: Texture) -> None:
+    @classmethod
+    @_deferrable
+    def clear_texture_alpha_mod(cls, texture: Texture) -> None:
         """ Clear the texture alpha mod. """
-        sdl2.SDL_SetTextureAlphaMod(texture.sdl_texture, 255)
+        cls._count_mod_change(texture.set_alpha_mod(255))
 
-    @staticmethod
+    @classmethod
+    def push_render_target(cls, texture: Texture) -> None:
+        """ Set the render target to a texture, saving the current render target.
+        While a draw queue is set, the calls until `pop_render_target()` are recorded as off-screen calls, which are
+        drawn before the queue's render targets, so that the texture is ready before anything copies it.
+        """
+        if cls._draw_queue is not None:
+            cls._draw_queue.begin_offscreen()
+        cls._push_render_target(texture)
+
+    @classmethod
+    @_deferrable
+    def _push_render_target(cls, texture: Texture) -> None:
+        """ Save the current render target, and set the render target to a texture. """
+        cls._render_target_stack.append(cls._render_target)
+        cls._set_target(texture)
+
+    @classmethod
+    def pop_render_target(cls) -> None:
+        """ Restore the render target that was saved by `push_render_target()`. """
+        cls._pop_render_target()
+        if cls._draw_queue is not None:
+            cls._draw_queue.end_offscreen()
+
+    @classmethod
+    @_deferrable
+    def _pop_render_target(cls) -> None:
+        """ Set the render target back to the last saved render target. """
+        cls._set_target(cls._render_target_stack.pop())
+
+    @classmethod
     @contextmanager
-    def render_target(texture: Texture) -> Generator:
+    def render_target(cls, texture: Texture) -> Generator:
         """ Context manager to temporarily render to a target texture. """
-        old_target = sdl2.SDL_GetRenderTarget(Renderer.sdl_renderer())
-        Renderer.set_render_target(texture)
-
+        cls.push_render_target(texture)
         yield
-
-        sdl2.SDL_SetRenderTarget(Renderer.sdl_renderer(), old_target)
+        cls.pop_render_target()
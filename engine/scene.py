@@ -1,14 +1,22 @@
 from __future__ import annotations
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
 
 from ulid import ULID
 
 from engine.camera import Camera
+from engine.data_types.rect import Rect
 from engine.internal_utilities.camera_list import CameraList
+from engine.internal_utilities.contact_manager import ContactManager
 from engine.internal_utilities.entity_list import EntityList
 from engine.level import Level
 from engine.log import Log
 
+if TYPE_CHECKING:
+    from engine.data_types.circle import Circle
+    from engine.data_types.line import Line
+    from engine.data_types.point import Point
+    from engine.entity import Entity
+
 
 class Scene:
     """ A scene is a group of entities that the engine is processing. """
@@ -18,6 +26,7 @@ class Scene:
         self._paused = False
         self._cameras = CameraList(self)
         self._entities = EntityList(self)
+        self._contacts = ContactManager(self)
         self._level_map = {}
 
         self._main_camera = None
@@ -74,6 +83,11 @@ class Scene:
         """ A list of entities in the scene. """
         return self._entities
 
+    @property
+    def contacts(self) -> ContactManager:
+        """ The collisions between entities in the scene. """
+        return self._contacts
+
     @property
     def levels(self) -> Iterator[Level]:
         """ Iterate over the levels. """
@@ -123,6 +137,146 @@ class Scene:
         except KeyError:
             Log.error(f"{level} is not in {self}")
 
+    def query_rect(
+            self,
+            rect: Rect,
+            tag: Optional[str] = None,
+            entity_type: Optional[type] = None,
+            level: Optional[Level] = None,
+            sort_by: Optional[str] = None
+    ) -> list[Entity]:
+        """ Get the active entities whose bounding boxes intersect a rect.
+        Results can be filtered by tag, type, and level, and sorted by "distance" (from the center of the rect) or "z".
+        """
+        entities = self.entities.spatial_index.query_rect(rect)
+        return self._filter_query(entities, rect.center(), tag, entity_type, level, sort_by)
+
+    def query_point(
+            self,
+            point: Point,
+            tag: Optional[str] = None,
+            entity_type: Optional[type] = None,
+            level: Optional[Level] = None,
+            sort_by: Optional[str] = None
+    ) -> list[Entity]:
+        """ Get the active entities whose bounding boxes contain a point.
+        Results can be filtered by tag, type, and level, and sorted by "distance" or "z".
+        """
+        entities = self.entities.spatial_index.query(point.x, point.y, point.x, point.y)
+        return self._filter_query(entities, point, tag, entity_type, level, sort_by)
+
+    def query_circle(
+            self,
+            circle: Circle,
+            tag: Optional[str] = None,
+            entity_type: Optional[type] = None,
+            level: Optional[Level] = None,
+            sort_by: Optional[str] = None
+    ) -> list[Entity]:
+        """ Get the active entities whose bounding boxes intersect a circle.
+        Results can be filtered by tag, type, and level, and sorted by "distance" (from the center of the circle) or "z".
+        """
+        spatial_index = self.entities.spatial_index
+        entities = (
+            entity for entity in spatial_index.query_rect(circle.rect())
+            if self._bounds_rect(entity).intersects_circle(circle)
+        )
+        return self._filter_query(entities, circle.center(), tag, entity_type, level, sort_by)
+
+    def raycast(
+            self,
+            line: Line,
+            tag: Optional[str] = None,
+            entity_type: Optional[type] = None,
+            level: Optional[Level] = None
+    ) -> list[Entity]:
+        """ Get the active entities whose bounding boxes are hit by a line segment.
+        Results can be filtered by tag, type, and level, and are sorted by the distance from the start of the line to the
+        point where the line enters the entity's bounding box.
+        """
+        a = line.a
+        b = line.b
+        spatial_index = self.entities.spatial_index
+
+        hits = []
+        for entity in spatial_index.query_segment(a.x + .5, a.y + .5, b.x + .5, b.y + .5):
+            t = self._segment_entry(a, b, spatial_index.bounds(entity))
+            if t is not None:
+                hits.append((t, entity))
+
+        hits.sort(key=lambda hit: hit[0])
+        return self._filter_query((entity for _, entity in hits), a, tag, entity_type, level, None)
+
+    def _bounds_rect(self, entity: Entity) -> Rect:
+        """ Get the bounds of an entity in the spatial index as a rect. """
+        left, top, right, bottom = self.entities.spatial_index.bounds(entity)
+        return Rect(left, top, right - left + 1, bottom - top + 1)
+
+    @staticmethod
+    def _segment_entry(a: Point, b: Point, bounds: tuple[int, int, int, int]) -> Optional[float]:
+        """ Get the distance (0 to 1) along a line segment where it enters a bounding box, or None if it misses.
+        Each pixel is treated as a unit square, and the segment runs between the centers of its endpoint pixels.
+        """
+        left, top, right, bottom = bounds
+        x1 = a.x + .5
+        y1 = a.y + .5
+        dx = b.x - a.x
+        dy = b.y - a.y
+
+        t_enter = 0.0
+        t_exit = 1.0
+        for start, delta, low, high in ((x1, dx, left, right + 1), (y1, dy, top, bottom + 1)):
+            if delta == 0:
+                if start < low or start > high:
+                    return None
+                continue
+            t1 = (low - start) / delta
+            t2 = (high - start) / delta
+            if t1 > t2:
+                t1, t2 = t2, t1
+            t_enter = max(t_enter, t1)
+            t_exit = min(t_exit, t2)
+            if t_enter > t_exit:
+                return None
+
+        return t_enter
+
+    def _filter_query(
+            self,
+            entities: Iterable[Entity],
+            origin: Point,
+            tag: Optional[str],
+            entity_type: Optional[type],
+            level: Optional[Level],
+            sort_by: Optional[str]
+    ) -> list[Entity]:
+        """ Filter and sort the results of a spatial query. """
+        results = [
+            entity for entity in entities
+            if entity.active
+            and (tag is None or tag in entity.tags)
+            and (entity_type is None or isinstance(entity, entity_type))
+            and (level is None or entity.level is level)
+        ]
+
+        if sort_by == "distance":
+            # Distance from the origin to the center of the entity's bounds
+            spatial_index = self.entities.spatial_index
+            distances = {}
+            for entity in results:
+                left, top, right, bottom = spatial_index.bounds(entity)
+                dx = (left + right) / 2 - origin.x
+                dy = (top + bottom) / 2 - origin.y
+                distances[entity] = dx * dx + dy * dy
+            results.sort(key=lambda e: distances[e])
+        elif sort_by == "z":
+            # Foreground (lowest Z-depth) first
+            results.sort(key=lambda e: e.z_depth)
+        elif sort_by is not None:
+            Log.error(f"Unknown sort option: {sort_by}")
+
+        return results
+
     def on_load(self) -> None:
         """ Called when the engine loads the scene. """
         self.setup_cameras()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from math import floor
+from math import ceil, floor, hypot
 from typing import Optional, Self, TYPE_CHECKING
 
 import sdl2
@@ -17,7 +17,6 @@ from engine.frame import Frame
 from engine.log import Log
 from engine.renderer import Renderer
 from engine.utilities import pmath
-from engine.window import Window
 
 if TYPE_CHECKING:
     from engine.camera import Camera
@@ -28,6 +27,7 @@ class Sprite:
     def __init__(self, content_path: str) -> None:
         """ `content_path` is the path to the sprite image texture file. """
         self._name = content_path
+        self._content_path = content_path
         self._texture = Content.load_texture(content_path)
         self._rotation = 0
         self._scale = 1.0
@@ -37,7 +37,7 @@ class Sprite:
         self._flip = 0
         self._color = None
         self._opacity = 255
-        self._flash_texture = Texture.create_target(2, 2)
+        self._silhouette_texture: Optional[Texture] = None
         self._flash_color = Color.white()
         self._flash_opacity = 0
 
@@ -59,13 +59,6 @@ class Sprite:
         self._frame_offset_bottom: int = 0
         self._frame_offset: Point = Point.zero()
 
-        # Initialize flash texture
-        self._reset_flash_texture()
-
-        # Callbacks
-        Window.add_resize_callback(self._reset_flash_texture)
-        Renderer.add_reset_callback(self._reset_flash_texture)
-
     def __str__(self) -> str:
         return f"Sprite({self.name})"
 
@@ -267,6 +260,40 @@ class Sprite:
 
         return Point(x, y)
 
+    def bounds(self, position: Point) -> Rect:
+        """ Get the world-space rect that the sprite covers when it is drawn at a given position. """
+        draw_position = position - self.pivot_offset() + self.frame_offset()
+        width = floor(self._source_rect.width * self._scale)
+        height = floor(self._source_rect.height * self._scale)
+        if not self._rotation:
+            return Rect(draw_position.x, draw_position.y, width, height)
+
+        # Rotated sprites turn around the draw position, so use a square that contains the sprite at any angle
+        left = draw_position.x - position.x
+        top = draw_position.y - position.y
+        radius = ceil(max(hypot(x, y) for x in (left, left + width) for y in (top, top + height)))
+        return Rect(position.x - radius, position.y - radius, radius * 2, radius * 2)
+
+    def cache_key(self) -> tuple:
+        """ A value that changes whenever the sprite would draw differently (apart from its position). """
+        return (
+            self._texture,
+            self._source_rect.to_tuple(),
+            self._frame_offset_left,
+            self._frame_offset_top,
+            self._frame_offset_right,
+            self._frame_offset_bottom,
+            self._scale,
+            self._rotation,
+            self._pivot.x,
+            self._pivot.y,
+            self._flip,
+            self._color.to_tuple() if self._color else None,
+            self._opacity,
+            self._flash_color.to_tuple() if self._flash_opacity else None,
+            self._flash_opacity
+        )
+
     def set_texture_blend_mode(self, blend_mode: BlendMode) -> None:
         """ Set the sprite's texture's blend mode. """
         if self._atlas:
@@ -292,66 +319,36 @@ class Sprite:
         if self._rotation:
             rotation_center = self.pivot_offset() - self.frame_offset()
 
-        # Apply tint
-        if self.color:
-            Renderer.set_texture_color_mod(self._texture, self.color)
-
-        # Apply opacity
-        if self.opacity != 255:
-            Renderer.set_texture_alpha_mod(self._texture, self.opacity)
-
         # Render texture
-        Renderer.copy(
+        # Sprites are batched, so the tint and opacity are applied per sprite rather than on the texture
+        Renderer.copy_batched(
             texture=self._texture,
             source_rect=self._source_rect,
             destination_rect=destination,
             rotation_angle=self._rotation,
             rotation_center=rotation_center,
-            flip=self._flip
+            flip=self._flip,
+            color=self.color,
+            opacity=self.opacity
         )
 
-        # Clear tint
-        if self.color:
-            Renderer.clear_texture_color_mod(self._texture)
-
-        # Clear opacity
-        if self.opacity != 255:
-            Renderer.clear_texture_alpha_mod(self._texture)
-
         # Flash
         if not self._flash_opacity:
             return
 
-        # Create mask
-        # 1. Clear the flash texture
-        # 2. Draw the sprite to the flash texture
-        # 3. Add white over the texture - this creates a full white mask
-        with Renderer.render_target(self._flash_texture):
-            Renderer.clear()
-            Renderer.copy(
-                texture=self._texture,
-                source_rect=self._source_rect,
-                destination_rect=None,
-                rotation_angle=0,
-                rotation_center=None,
-                flip=0,
-            )
-            Renderer.set_render_draw_blend_mode(BlendMode.ADD)
-            Renderer.draw_rect_solid(Rect(0, 0, self._source_rect.width, self._source_rect.height), Color.white())
-            Renderer.clear_render_draw_blend_mode()
-
-        # Set color and opacity
-        Renderer.set_texture_color_mod(self._flash_texture, self._flash_color)
-        Renderer.set_texture_alpha_mod(self._flash_texture, self._flash_opacity)
-
-        # Render flash texture
-        Renderer.copy(
-            texture=self._flash_texture,
-            source_rect=None,
+        # The silhouette is an all-white copy of the texture, so tinting it with the flash color creates the overlay
+        if self._silhouette_texture is None:
+            self._silhouette_texture = Content.load_silhouette(self._content_path)
+
+        Renderer.copy_batched(
+            texture=self._silhouette_texture,
+            source_rect=self._source_rect,
             destination_rect=destination,
-            rotation_angle=self.rotation,
+            rotation_angle=self._rotation,
             rotation_center=rotation_center,
-            flip=self._flip
+            flip=self._flip,
+            color=self._flash_color,
+            opacity=self._flash_opacity
         )
 
     def _apply_frame_data(self, frame: Frame):
@@ -368,11 +365,3 @@ class Sprite:
         self._frame_offset_left = frame.offset_x
         self._frame_offset_right = frame.sprite_width - frame.frame_width - frame.offset_x
         self._frame_offset_bottom = frame.sprite_height - frame.frame_height - frame.offset_y
-
-        # Reset the flash texture
-        self._reset_flash_texture()
-
-    def _reset_flash_texture(self) -> None:
-        """ Create the flash texture. """
-        self._flash_texture = Texture.create_target(self._source_rect.width, self._source_rect.height)
-        self._flash_texture.set_blend_mode(BlendMode.BLEND)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from array import array
+import weakref
 from typing import Optional, TYPE_CHECKING
 
 from engine.bitmap_font import BitmapFont
 from engine.content import Content
+from engine.content_types.texture import Texture
+from engine.data_types.blend_mode import BlendMode
 from engine.data_types.color import Color
 from engine.data_types.point import Point
 from engine.data_types.rect import Rect
 from engine.glyph import Glyph
+from engine.internal_utilities.render_target_pool import RenderTargetPool
 from engine.renderer import Renderer
 from engine.text_effect import TextEffect
 from engine.utilities import pmath
@@ -25,6 +30,11 @@ ALIGN_BOTTOM = 4
 
 class Text:
     """ Displays a string of text using a bitmap font. """
+
+    # Text in cached mode, so that the cached textures can be re-drawn when the render targets are reset
+    _cached_texts: weakref.WeakSet[Text] = weakref.WeakSet()
+    _reset_callback_added = False
+
     def __init__(self, content_path: str) -> None:
         """ `content_path` is the path to the bitmap font texture file. """
         self._texture = Content.load_texture(content_path)
@@ -46,6 +56,16 @@ class Text:
         self._horizontal_alignment = ALIGN_LEFT
         self._vertical_alignment = ALIGN_TOP
 
+        # In cached mode, glyphs without a text effect are drawn into a texture that is re-used until the text changes
+        self._cached = False
+        self._cache_texture: Optional[Texture] = None
+        self._cache_rect = Rect.empty()
+        self._cache_glyph_count: Optional[int] = None
+        self._live_glyphs: list[Glyph] = []
+
+    def __del__(self) -> None:
+        self._release_cache_texture()
+
     def __str__(self) -> str:
         character_limit = 25
         if len(self.text) > character_limit:
@@ -172,6 +192,33 @@ class Text:
         """ Opacity can be set as a 0-255 int value. """
         self._opacity = pmath.clamp(value, 0, 255)
 
+    @property
+    def cached(self) -> bool:
+        """ If true, enables cached mode.
+        In cached mode, the glyphs are drawn into a texture when the text changes, and each draw copies that texture.
+        Glyphs with a text effect are still drawn every frame. Tint and opacity are applied when the texture is copied,
+        so they can be animated without re-drawing the glyphs.
+        """
+        return self._cached
+
+    @cached.setter
+    def cached(self, value: bool) -> None:
+        self._cached = value
+        if value:
+            Text._cached_texts.add(self)
+            if not Text._reset_callback_added:
+                Renderer.add_reset_callback(Text._on_renderer_reset)
+                Text._reset_callback_added = True
+        else:
+            Text._cached_texts.discard(self)
+            self._release_cache_texture()
+
+    @classmethod
+    def _on_renderer_reset(cls) -> None:
+        """ Re-draw the cached textures, since their contents are lost when the render targets are reset. """
+        for text in cls._cached_texts:
+            text._invalidate_cache()
+
     def align_horizontal_left(self) -> None:
         """ Left align. """
         self._horizontal_alignment = ALIGN_LEFT
@@ -207,86 +254,150 @@ class Text:
         # Convert world position to screen position
         anchor_position = camera.world_to_render_position(position)
 
-        # Apply tint
-        if self.color:
-            Renderer.set_texture_color_mod(self._texture, self.color)
-
-        # Apply opacity
-        if self.opacity != 255:
-            Renderer.set_texture_alpha_mod(self._texture, self.opacity)
-
-        # Draw each glyph
-        for i, glyph in enumerate(self._glyphs):
-            # Stop drawing if we are in typewriter mode and we've reached the limit of visible characters
-            if self.typewriter_mode and i >= self.visible_characters:
-                break
-
-            # Draw the glyph
-            self._draw_glyph(glyph, anchor_position)
-
-        # Clear tint
-        if self.color:
-            Renderer.clear_texture_color_mod(self._texture)
-
-        # Clear tint and opacity
-        if self.opacity != 255:
-            Renderer.clear_texture_alpha_mod(self._texture)
-
-    def _draw_glyph(self, glyph: Glyph, anchor_position: Point) -> None:
-        """ Draw a glyph. """
-        # Set destination
-        glyph_position = self._get_glyph_position(glyph, anchor_position)
-        destination = Rect(glyph_position.x, glyph_position.y, glyph.source_rect.width, glyph.source_rect.height)
-
-        # Set color
-        glyph_color = self._get_glyph_color(glyph)
-        if glyph_color:
-            Renderer.set_texture_color_mod(self._texture, glyph_color)
-
-        # Render texture
-        Renderer.copy(
-            texture=self._texture,
-            source_rect=glyph.source_rect,
-            destination_rect=destination,
-            rotation_angle=0,
-            rotation_center=None,
-            flip=0
-        )
-
-        # Clear color
-        if glyph_color:
-            Renderer.clear_texture_color_mod(self._texture)
-
-    def _get_glyph_position(self, glyph: Glyph, anchor_position: Point) -> Point:
-        """ Calculate the position that the glyph should be drawn at. """
-        # Add the character offset to the text anchor position
-        glyph_x = anchor_position.x + glyph.destination_offset_x
-        glypy_y = anchor_position.y + glyph.destination_offset_y
-
-        # Add text effect offset
-        if glyph.tag:
-            if text_effect := TextEffect.get(glyph.tag):
+        # Stop drawing if we are in typewriter mode and we've reached the limit of visible characters
+        if self.typewriter_mode:
+            glyph_count = min(self.visible_characters, len(self._glyphs))
+        else:
+            glyph_count = len(self._glyphs)
+
+        if self.cached:
+            self._draw_cached(anchor_position, glyph_count)
+        else:
+            self._draw_glyphs(self._glyphs[:glyph_count], anchor_position, self.color, self.opacity)
+
+    def _draw_glyphs(self, glyphs: list[Glyph], anchor_position: Point, color: Optional[Color], opacity: int) -> None:
+        """ Draw a list of glyphs as a single batch of quads.
+        Each glyph's tint and opacity is set in its vertex colors, so glyphs with text effects don't need to change the
+        font texture's color mod or alpha mod.
+        """
+        if not glyphs or not opacity:
+            return
+
+        r, g, b = color.to_tuple()[:3] if color else (255, 255, 255)
+        text_color = (r, g, b, opacity)
+
+        texture_width = self._texture.width
+        texture_height = self._texture.height
+        anchor_x = anchor_position.x
+        anchor_y = anchor_position.y
+
+        positions = array('f')
+        texture_coordinates = array('f')
+        colors = array('B')
+        for glyph in glyphs:
+            x = anchor_x + glyph.destination_offset_x
+            y = anchor_y + glyph.destination_offset_y
+            vertex_color = text_color
+
+            # Apply text effect
+            if glyph.tag and (text_effect := TextEffect.get(glyph.tag)):
                 glyph_offset = text_effect.glyph_offset(glyph)
-                glyph_x += glyph_offset.x
-                glypy_y += glyph_offset.y
+                x += glyph_offset.x
+                y += glyph_offset.y
+
+                glyph_color = text_effect.glyph_color(glyph)
+                glyph_opacity = text_effect.glyph_opacity(glyph)
+                vertex_color = (glyph_color.r, glyph_color.g, glyph_color.b, opacity * glyph_opacity // 255)
+
+            source_rect = glyph.source_rect
+            w = source_rect.width
+            h = source_rect.height
+            u0 = source_rect.x / texture_width
+            v0 = source_rect.y / texture_height
+            u1 = (source_rect.x + w) / texture_width
+            v1 = (source_rect.y + h) / texture_height
+
+            positions.extend((x, y, x + w, y, x + w, y + h, x, y + h))
+            texture_coordinates.extend((u0, v0, u1, v0, u1, v1, u0, v1))
+            colors.extend(vertex_color * 4)
+
+        Renderer.copy_batched_quads(self._texture, positions, texture_coordinates, colors)
+
+    def _draw_cached(self, anchor_position: Point, glyph_count: int) -> None:
+        """ Copy the cached texture, and draw the glyphs that have a text effect. """
+        if self._cache_glyph_count != glyph_count:
+            self._update_cache_texture(glyph_count)
+
+        if self._cache_texture is not None and self.opacity:
+            # The cached texture has premultiplied alpha, so the opacity is applied to the tint as well
+            r, g, b = self.color.to_tuple()[:3] if self.color else (255, 255, 255)
+            color = Color(r * self.opacity // 255, g * self.opacity // 255, b * self.opacity // 255)
+            if color.to_tuple() != (255, 255, 255, 255):
+                Renderer.set_texture_color_mod(self._cache_texture, color)
+            if self.opacity != 255:
+                Renderer.set_texture_alpha_mod(self._cache_texture, self.opacity)
+
+            Renderer.copy(
+                texture=self._cache_texture,
+                source_rect=(0, 0, self._cache_rect.width, self._cache_rect.height),
+                destination_rect=(
+                    anchor_position.x + self._cache_rect.x,
+                    anchor_position.y + self._cache_rect.y,
+                    self._cache_rect.width,
+                    self._cache_rect.height
+                ),
+                rotation_angle=0,
+                rotation_center=None,
+                flip=0
+            )
+
+            Renderer.clear_texture_color_mod(self._cache_texture)
+            Renderer.clear_texture_alpha_mod(self._cache_texture)
 
-        return Point(glyph_x, glypy_y)
+        if self._live_glyphs:
+            self._draw_glyphs(self._live_glyphs, anchor_position, self.color, self.opacity)
 
-    def _get_glyph_color(self, glyph: Glyph) -> Optional[Color]:
-        """ Get the color that the glyph should be drawn as. """
-        if glyph.tag:
-            if text_effect := TextEffect.get(glyph.tag):
-                return text_effect.glyph_color(glyph)
+    def _update_cache_texture(self, glyph_count: int) -> None:
+        """ Draw the glyphs that don't have a text effect into the cached texture. """
+        self._cache_glyph_count = glyph_count
 
-        return None
+        # Glyphs with a text effect change every frame, so they aren't cached
+        cached_glyphs = []
+        self._live_glyphs = []
+        for glyph in self._glyphs[:glyph_count]:
+            if glyph.tag and TextEffect.get(glyph.tag):
+                self._live_glyphs.append(glyph)
+            else:
+                cached_glyphs.append(glyph)
 
-    def _get_glyph_opacity(self, glyph: Glyph) -> Optional[int]:
-        """ Get the opacity that the glyph should be drawn at. """
-        if glyph.tag:
-            if text_effect := TextEffect.get(glyph.tag):
-                return text_effect.glyph_opacity(glyph)
+        if not cached_glyphs:
+            self._release_cache_texture()
+            return
 
-        return None
+        # Get the rect that contains the cached glyphs, relative to the anchor position
+        left = min(glyph.destination_offset_x for glyph in cached_glyphs)
+        top = min(glyph.destination_offset_y for glyph in cached_glyphs)
+        right = max(glyph.destination_offset_x + glyph.source_rect.width for glyph in cached_glyphs)
+        bottom = max(glyph.destination_offset_y + glyph.source_rect.height for glyph in cached_glyphs)
+        self._cache_rect = Rect(left, top, right - left, bottom - top)
+
+        # The texture only grows, so that text that changes often doesn't allocate a new texture every time
+        texture = self._cache_texture
+        if texture is None or texture.width < self._cache_rect.width or texture.height < self._cache_rect.height:
+            width = self._cache_rect.width if texture is None else max(texture.width, self._cache_rect.width)
+            height = self._cache_rect.height if texture is None else max(texture.height, self._cache_rect.height)
+            self._release_cache_texture()
+            self._cache_texture = RenderTargetPool.acquire(width, height)
+            self._cache_texture.set_blend_mode(BlendMode.ALPHA_COMPOSITE)
+
+        # Draw the glyphs relative to the top-left corner of the texture
+        with Renderer.render_target(self._cache_texture):
+            Renderer.clear()
+            self._draw_glyphs(cached_glyphs, Point(-left, -top), None, 255)
+
+        # The glyph count was reset if the texture was released
+        self._cache_glyph_count = glyph_count
+
+    def _invalidate_cache(self) -> None:
+        """ Draw the cached texture again the next time that the text is drawn. """
+        self._cache_glyph_count = None
+
+    def _release_cache_texture(self) -> None:
+        """ Return the cached texture to the render target pool. """
+        self._invalidate_cache()
+        if self._cache_texture is not None:
+            RenderTargetPool.release(self._cache_texture)
+            self._cache_texture = None
 
     def _update_characters(self) -> None:
         """ Update the character source positions and destination offsets when the text changes """
@@ -374,6 +485,8 @@ class Text:
             self._update_text_size()
             self._apply_vertical_alignment()
 
+        self._invalidate_cache()
+
     def _is_cursor_at_start_of_new_word(self, cursor: int) -> bool:
         """ Check if the cursor is at the start of a new word. """
         # If this is the very first character, we never want this to be true, otherwise it would always start by
@@ -0,0 +1,267 @@
+""" Batch geometry functions.
+
+These test many shapes in a single call. Shapes are packed into flat arrays of integers:
+    rects:   (x, y, width, height) per rect
+    points:  (x, y) per point
+    circles: (x, y, radius) per circle
+
+If NumPy is installed, packed shapes are NumPy arrays with one row per shape, and the results are NumPy arrays.
+Otherwise, packed shapes are `array('i')` arrays, and results are `array('b')` (booleans) or `array('d')` (distances).
+
+The results match the single-shape functions in `geometry_utils`, `Rect` and `Point`.
+"""
+from __future__ import annotations
+
+from array import array
+from math import floor, sqrt
+from typing import Any, Iterable, TYPE_CHECKING
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from engine.data_types.circle import Circle
+    from engine.data_types.point import Point
+    from engine.data_types.rect import Rect
+    from engine.entity import Entity
+
+
+HAS_NUMPY = numpy is not None
+
+RECT_FIELDS = 4
+POINT_FIELDS = 2
+CIRCLE_FIELDS = 3
+
+
+def _pack(values: Iterable[int], fields: int) -> Any:
+    """ Pack a flat sequence of integers into an array with a given number of fields per shape. """
+    packed = array('i', values)
+    if numpy is not None:
+        return numpy.frombuffer(packed, dtype=numpy.intc).reshape(-1, fields).copy()
+    return packed
+
+
+def _columns(packed: Any, fields: int) -> Any:
+    """ Get the columns of a packed array as NumPy arrays, or as array slices if NumPy is not installed. """
+    if numpy is not None:
+        if isinstance(packed, array):
+            packed = numpy.frombuffer(packed, dtype=numpy.intc).reshape(-1, fields)
+        return tuple(packed[:, i].astype(numpy.int64) for i in range(fields))
+    return tuple(packed[i::fields] for i in range(fields))
+
+
+def pack_rects(rects: Iterable[Rect]) -> Any:
+    """ Pack rects into an array. """
+    values = []
+    for rect in rects:
+        values.extend((rect.x, rect.y, rect.width, rect.height))
+    return _pack(values, RECT_FIELDS)
+
+
+def pack_points(points: Iterable[Point]) -> Any:
+    """ Pack points into an array. """
+    values = []
+    for point in points:
+        values.extend((point.x, point.y))
+    return _pack(values, POINT_FIELDS)
+
+
+def pack_circles(circles: Iterable[Circle]) -> Any:
+    """ Pack circles into an array. """
+    values = []
+    for circle in circles:
+        values.extend((floor(circle.x), floor(circle.y), circle.radius))
+    return _pack(values, CIRCLE_FIELDS)
+
+
+def pack_bboxes(entities: Iterable[Entity]) -> Any:
+    """ Pack the bounding boxes of entities into an array of rects.
+    This reads the entity fields directly, without creating a Rect for each entity.
+    """
+    values = []
+    for entity in entities:
+        values.extend((entity.x, entity.y, entity.width, entity.height))
+    return _pack(values, RECT_FIELDS)
+
+
+def pack_positions(entities: Iterable[Entity]) -> Any:
+    """ Pack the positions of entities into an array of points. """
+    values = []
+    for entity in entities:
+        values.extend((entity.x, entity.y))
+    return _pack(values, POINT_FIELDS)
+
+
+def count(packed: Any, fields: int) -> int:
+    """ The number of shapes in a packed array. """
+    if numpy is not None and not isinstance(packed, array):
+        return packed.shape[0]
+    return len(packed) // fields
+
+
+def rects_intersect_rect(rects: Any, rect: Rect) -> Any:
+    """ Check which rects intersect a rect. """
+    left = rect.x
+    top = rect.y
+    right = rect.x + rect.width - 1
+    bottom = rect.y + rect.height - 1
+
+    xs, ys, ws, hs = _columns(rects, RECT_FIELDS)
+    if numpy is not None:
+        return (left <= xs + ws - 1) & (xs <= right) & (top <= ys + hs - 1) & (ys <= bottom)
+
+    return array('b', (
+        left <= x + w - 1 and x <= right and top <= y + h - 1 and y <= bottom
+        for x, y, w, h in zip(xs, ys, ws, hs)
+    ))
+
+
+def rects_contain_point(rects: Any, point: Point) -> Any:
+    """ Check which rects contain a point. """
+    px = point.x
+    py = point.y
+
+    xs, ys, ws, hs = _columns(rects, RECT_FIELDS)
+    if numpy is not None:
+        return (xs <= px) & (px <= xs + ws - 1) & (ys <= py) & (py <= ys + hs - 1)
+
+    return array('b', (x <= px <= x + w - 1 and y <= py <= y + h - 1 for x, y, w, h in zip(xs, ys, ws, hs)))
+
+
+def rects_intersect_circle(rects: Any, circle: Circle) -> Any:
+    """ Check which rects intersect a circle.
+    This follows the same steps as `geometry_utils.rect_intersects_circle`.
+    """
+    cx = floor(circle.x)
+    cy = floor(circle.y)
+    radius = circle.radius
+
+    # The center and corner checks use the floored center of the circle (like `Circle.center`); the edge checks don't
+    edge_cx = circle.x
+    edge_cy = circle.y
+
+    xs, ys, ws, hs = _columns(rects, RECT_FIELDS)
+    if numpy is not None:
+        rights = xs + ws - 1
+        bottoms = ys + hs - 1
+
+        # Center of the circle inside the rect
+        result = (xs <= cx) & (cx <= rights) & (ys <= cy) & (cy <= bottoms)
+
+        # Corners of the rect inside the circle
+        for corner_x, corner_y in ((xs, ys), (rights, ys), (xs, bottoms), (rights, bottoms)):
+            dx = corner_x - cx
+            dy = corner_y - cy
+            result |= numpy.round(numpy.sqrt(dx * dx + dy * dy)) <= radius
+
+        # Edges of the rect intersecting the circle
+        distance_x = numpy.abs(edge_cx - (xs + ws // 2))
+        distance_y = numpy.abs(edge_cy - (ys + hs // 2))
+        result |= (distance_x <= ws / 2) & (distance_y < hs / 2 + radius)
+        result |= (distance_y <= hs / 2) & (distance_x < ws / 2 + radius)
+        return result
+
+    result = array('b')
+    for x, y, w, h in zip(xs, ys, ws, hs):
+        right = x + w - 1
+        bottom = y + h - 1
+        if x <= cx <= right and y <= cy <= bottom:
+            result.append(True)
+            continue
+
+        hit = False
+        for corner_x, corner_y in ((x, y), (right, y), (x, bottom), (right, bottom)):
+            dx = corner_x - cx
+            dy = corner_y - cy
+            if round(sqrt(dx * dx + dy * dy)) <= radius:
+                hit = True
+                break
+
+        if not hit:
+            distance_x = abs(edge_cx - (x + w // 2))
+            distance_y = abs(edge_cy - (y + h // 2))
+            hit = (
+                (distance_x <= w / 2 and distance_y < h / 2 + radius) or
+                (distance_y <= h / 2 and distance_x < w / 2 + radius)
+            )
+
+        result.append(hit)
+
+    return result
+
+
+def points_in_rect(points: Any, rect: Rect) -> Any:
+    """ Check which points are inside a rect. """
+    left = rect.x
+    top = rect.y
+    right = rect.x + rect.width - 1
+    bottom = rect.y + rect.height - 1
+
+    xs, ys = _columns(points, POINT_FIELDS)
+    if numpy is not None:
+        return (left <= xs) & (xs <= right) & (top <= ys) & (ys <= bottom)
+
+    return array('b', (left <= x <= right and top <= y <= bottom for x, y in zip(xs, ys)))
+
+
+def points_in_circle(points: Any, circle: Circle) -> Any:
+    """ Check which points are inside a circle.
+    This matches `Circle.contains`, which compares the rounded distance to the radius.
+    """
+    distance = distances_to(points, circle.center())
+    if numpy is not None:
+        return numpy.round(distance) <= circle.radius
+
+    radius = circle.radius
+    return array('b', (round(d) <= radius for d in distance))
+
+
+def distances_to(points: Any, point: Point) -> Any:
+    """ Get the distance from each point to a point. """
+    px = point.x
+    py = point.y
+
+    xs, ys = _columns(points, POINT_FIELDS)
+    if numpy is not None:
+        dx = xs - px
+        dy = ys - py
+        return numpy.sqrt(dx * dx + dy * dy)
+
+    return array('d', (sqrt((x - px) * (x - px) + (y - py) * (y - py)) for x, y in zip(xs, ys)))
+
+
+def circles_contain_point(circles: Any, point: Point) -> Any:
+    """ Check which circles contain a point. """
+    px = point.x
+    py = point.y
+
+    xs, ys, radii = _columns(circles, CIRCLE_FIELDS)
+    if numpy is not None:
+        dx = xs - px
+        dy = ys - py
+        return numpy.round(numpy.sqrt(dx * dx + dy * dy)) <= radii
+
+    return array('b', (
+        round(sqrt((x - px) * (x - px) + (y - py) * (y - py))) <= r
+        for x, y, r in zip(xs, ys, radii)
+    ))
+
+
+def circles_intersect_circle(circles: Any, circle: Circle) -> Any:
+    """ Check which circles intersect a circle. """
+    cx = floor(circle.x)
+    cy = floor(circle.y)
+    radius = circle.radius
+
+    xs, ys, radii = _columns(circles, CIRCLE_FIELDS)
+    if numpy is not None:
+        dx = xs - cx
+        dy = ys - cy
+        return numpy.sqrt(dx * dx + dy * dy) <= radii + radius
+
+    return array('b', (
+        sqrt((x - cx) * (x - cx) + (y - cy) * (y - cy)) <= r + radius
+        for x, y, r in zip(xs, ys, radii)
+    ))
@@ -6,7 +6,10 @@ from typing import Callable, Optional
 import sdl2
 
 from engine.content_types.texture import Texture
+from engine.data_types.blend_mode import BlendMode
 from engine.data_types.rect import Rect
+from engine.internal_utilities.render_target_pool import RenderTargetPool
+from engine.internal_utilities.texture_registry import TextureRegistry
 
 
 class WindowMode(Enum):
@@ -37,6 +40,10 @@ class Window:
     _viewport_scale: int = 1
     _viewport_texture: Optional[Texture] = None
 
+    # Resize events are coalesced, and handled once the window size has stopped changing
+    _resize_queued = False
+    _queued_size: Optional[tuple[int, int]] = None
+
     # Callbacks
     _resize_callbacks: list[Callable] = []
     _fullscreen_callbacks: list[Callable] = []
@@ -250,6 +257,25 @@ class Window:
             cls._window_mode_change_queued = False
             cls._next_window_mode = WindowMode.NONE
 
+        # Resize
+        # Dragging the window edge sends a resize event every frame, so wait until the size is the same for two frames
+        if cls._resize_queued:
+            size = cls.size()
+            if size == cls._queued_size:
+                cls._resize_queued = False
+                cls._queued_size = None
+                cls.on_window_resized()
+            else:
+                cls._queued_size = size
+
+    @classmethod
+    def queue_resize(cls) -> None:
+        """ Queue the resize callbacks to run once the window size settles.
+        Any number of resize events before then only run the callbacks once.
+        """
+        cls._resize_queued = True
+        cls._queued_size = cls.size()
+
     @classmethod
     def update_viewport(cls) -> None:
         """ Calculate and update the viewport.
@@ -286,7 +312,13 @@ class Window:
         # Update viewport
         cls._viewport = Rect(x, y, w, h)
         cls._viewport_scale = scale
-        cls._viewport_texture = Texture.create_target(int(w), int(h))
+        if cls._viewport_texture is not None:
+            RenderTargetPool.release(cls._viewport_texture)
+        cls._viewport_texture = RenderTargetPool.acquire(int(w), int(h))
+        # Pooled textures keep their last blend mode, so use SDL's default for a new texture, which copies the viewport
+        # to the window without blending
+        cls._viewport_texture.set_blend_mode(BlendMode.NONE)
+        TextureRegistry.retain(cls._viewport_texture)
 
     @classmethod
     def add_resize_callback(cls, callback: Callable) -> None:
@@ -9,5 +9,11 @@ class Bg(Entity):
         self.y = -90
         self.z_depth = 1000
 
+    def draw_bounds(self) -> Rect:
+        return self.sprite.bounds(self.position())
+
+    def draw_cache_key(self) -> tuple:
+        return self.x, self.y, self.sprite.cache_key()
+
     def draw(self, camera: Camera) -> None:
         self.sprite.draw(camera, self.position())
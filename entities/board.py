@@ -5,9 +5,9 @@ import random
 from typing import Iterator, Optional, TYPE_CHECKING
 
 from engine import *
+from entities.tile import Tile
 
 if TYPE_CHECKING:
-    from entities.tile import Tile
     from entities.game_manager import GameManager
 
 
@@ -25,6 +25,10 @@ class Board(Entity):
         self.tiles = {}
         self.hovered_tile: Tile | None = None
 
+        # Tiles near the current player's focus point, cached by focus position
+        self._focus_key = None
+        self._tiles_under_focus: list[Tile] = []
+
         self.total_tiles = 0     # Number of tiles in play
         self.enabled_tiles = 0   # Number of tiles that have been enabled
         self.revealed_tiles = 0  # Tiles that have been revealed during the board setup
@@ -105,6 +109,20 @@ class Board(Entity):
         for tile in self.iter_tiles():
             tile.set_position(self.tile_to_world_position(tile.q, tile.r, tile.s))
             tile.z_depth = -tile.y + 100
+        self._focus_key = None
+
+    def tiles_under_focus(self) -> list[Tile]:
+        """ Get the tiles within 10 pixels of the current player's focus point. """
+        player = self.game_manager.current_player
+        if not player:
+            return []
+
+        focus = player.focus
+        if self._focus_key != (focus.x, focus.y):
+            self._focus_key = (focus.x, focus.y)
+            self._tiles_under_focus = self.scene.query_circle(Circle(focus.x, focus.y, 9), entity_type=Tile)
+
+        return self._tiles_under_focus
 
     def setup_board_for_new_game(self) -> None:
         self.total_tiles = 0
@@ -182,6 +200,21 @@ class Board(Entity):
         """ Get a single tile. """
         return self.tiles.get((q, r, s))
 
+    def get_ring(self, q: int, r: int, s: int, radius: int) -> Iterator[Tile]:
+        """ Get the tiles that are exactly `radius` steps away from a coordinate. """
+        if radius == 0:
+            if tile := self.get_tile(q, r, s):
+                yield tile
+            return
+
+        # Start at one corner of the ring, and walk along each of its 6 sides
+        i, j, k = q - radius, r + radius, s
+        for di, dj, dk in ((1, 0, -1), (1, -1, 0), (0, -1, 1), (-1, 0, 1), (-1, 1, 0), (0, 1, -1)):
+            for _ in range(radius):
+                if tile := self.get_tile(i, j, k):
+                    yield tile
+                i, j, k = i + di, j + dj, k + dk
+
     def get_tiles(self, q: int, r: int, s: int, radius: int) -> list[Tile]:
         """ Get all tiles within a range of a coordinate. """
         for i in range(q-radius, q+radius+1):
@@ -314,20 +347,18 @@ class Board(Entity):
         for tile in self.iter_tiles():
             if skull := tile.skull:
                 if skull.team == "blue":
-                    for t in self.iter_tiles():
+                    for t in self.get_ring(*tile.coordinates, 2):
                         if t.is_free():
-                            if tile.distance_to(t) == 2:
-                                if t.coordinates not in self.red_start_coordinates:
-                                    return True
+                            if t.coordinates not in self.red_start_coordinates:
+                                return True
         return False
 
     def red_has_sacrifice_moves(self) -> bool:
         for tile in self.iter_tiles():
             if skull := tile.skull:
                 if skull.team == "red":
-                    for t in self.iter_tiles():
+                    for t in self.get_ring(*tile.coordinates, 2):
                         if t.is_free():
-                            if tile.distance_to(t) == 2:
-                                if t.coordinates not in self.blue_start_coordinates:
-                                    return True
+                            if t.coordinates not in self.blue_start_coordinates:
+                                return True
         return False
@@ -16,6 +16,7 @@ class MainMenuEntity(GuiWidgetEntity):
         self.game_manager: GameManager | None = None
 
         self.text = Text("fonts/NotJamOldStyle11.11.png")
+        self.text.cached = True
         self.text.text = "Play"
 
         self.width = self.text.width
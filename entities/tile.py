@@ -75,10 +75,7 @@ class Tile(Entity):
         self.sprite.pivot.set_center()
 
     def mouse_hovering(self) -> bool:
-        if player := self.game_manager.current_player:
-            if player.focus.distance_to(self.position()) < 10:
-                return True
-        return False
+        return self in self.board.tiles_under_focus()
 
     def is_free(self) -> bool:
         if not self.enabled:
@@ -182,11 +179,18 @@ class Tile(Entity):
         self.reveal_y_start = 0
         self.reveal_y_offset = 0
 
+    def draw_position(self) -> Point:
+        return Point(self.x, self.y + self.reveal_y_offset + self.hide_y_offset)
+
+    def draw_bounds(self) -> Rect:
+        return self.sprite.bounds(self.draw_position())
+
+    def draw_cache_key(self) -> tuple:
+        return self.x, self.y, self.visible, self.reveal_y_offset, self.hide_y_offset, self.sprite.cache_key()
+
     def draw(self, camera: Camera) -> None:
         if self.visible:
-            x = self.x
-            y = self.y + self.reveal_y_offset + self.hide_y_offset
-            self.sprite.draw(camera, Point(x, y))
+            self.sprite.draw(camera, self.draw_position())
 
     def debug_draw(self, camera: Camera) -> None:
         if self.mouse_hovering():
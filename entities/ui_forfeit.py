@@ -23,6 +23,7 @@ class UiForfeit(Entity):
         self.y = 4
 
         self.text = Text("fonts/NotJamOldStyle11.11.png")
+        self.text.cached = True
         self.text.align_horizontal_center()
         self.text.align_vertical_center()
         self.text.text = "Forfeit"
@@ -30,6 +31,7 @@ class UiForfeit(Entity):
         self.text_position = Point(self.x + self.width // 2, self.y + self.height // 2)
 
         self.hint_text = Text("fonts/NotJamOldStyle11.11.png")
+        self.hint_text.cached = True
         self.hint_text.align_horizontal_center()
         self.hint_text.align_vertical_center()
         self.hint_text.text = "(Hold ESC to forfeit)"
@@ -7,6 +7,7 @@ class UiGameEnded(Entity):
         self.name = "UiGameEnded"
         self.tags.add("UI")
         self.text = Text("fonts/antiquity-print.13.png")
+        self.text.cached = True
         self.text.opacity = 0
         self.banner = Rect.empty()
         self.banner_color = Color(46, 46, 67)
@@ -7,6 +7,7 @@ class UiTutorialText(Entity):
         self.name = "UiTutorialText"
         self.tags.add("UI")
         self.text = Text("fonts/NotJamOldStyle11.11.png")
+        self.text.cached = True
         self.text.align_horizontal_center()
         self.text.align_vertical_center()
         self.text.color = Color(230, 238, 237)
@@ -37,11 +37,18 @@ class MainScene(Scene):
         game_manager = GameManager()
         self.entities.add(game_manager)
 
+        # The background and board tiles rarely change, so they are drawn into a cached layer behind everything else
+        static_layer = CachedLayerEntity()
+        static_layer.z_depth = 100
+        self.entities.add(static_layer)
+
         # Background
-        self.entities.add(Bg())
+        bg = Bg()
+        self.entities.add(bg)
+        static_layer.add(bg)
 
         # Board
-        self.generate_board(3)
+        self.generate_board(3, static_layer)
 
         # Summon Circle
         self.entities.add(SummonCircle())
@@ -70,7 +77,7 @@ class MainScene(Scene):
         # End Game
         self.entities.add(UiGameEnded())
 
-    def generate_board(self, radius: int) -> None:
+    def generate_board(self, radius: int, layer: CachedLayerEntity) -> None:
         # Create board
         board = Board()
         board.radius = radius
@@ -93,6 +100,7 @@ class MainScene(Scene):
                         tile.coordinates = (i, j, k)
                         board.add_tile(tile)
                         self.entities.add(tile)
+                        layer.add(tile)
 
         # Setup board
         board.move_tiles()